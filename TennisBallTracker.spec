@@ -1,11 +1,17 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+# Generate src/resources/themes before it is collected below
+sys.path.insert(0, SPECPATH)
+from src.utils.build_qss import build_qss
+build_qss(SPECPATH)
 
 
 a = Analysis(
     ['run.py'],
     pathex=[],
     binaries=[],
-    datas=[('src/resources/images/icons', 'src/resources/images/icons'), ('src/resources/tests/images', 'src/resources/tests/images'), ('src/resources/tests', 'src/resources/tests'), ('src/resources/models', 'src/resources/models'), ('src/resources/videos', 'src/resources/videos'), ('src/resources/planned_features.json', 'src/resources')],
+    datas=[('src/resources/images/icons', 'src/resources/images/icons'), ('src/resources/tests/images', 'src/resources/tests/images'), ('src/resources/tests', 'src/resources/tests'), ('src/resources/models', 'src/resources/models'), ('src/resources/videos', 'src/resources/videos'), ('src/resources/planned_features.json', 'src/resources'), ('src/resources/themes', 'src/resources/themes')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
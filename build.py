@@ -1,6 +1,7 @@
 import os
 import sys
 import shutil
+import subprocess
 from pathlib import Path
 
 # 현재 디렉토리 출력
@@ -20,6 +21,10 @@ models_dir = os.path.join(resources_dir, "models")
 resources_tests_dir = os.path.join(resources_dir, "tests")
 resources_tests_images_dir = os.path.join(resources_tests_dir, "images")
 tests_dir = os.path.join("tests", "images")
+themes_dir = os.path.join(resources_dir, "themes")
+
+# 테마 스타일시트(.qss) 생성
+subprocess.run([sys.executable, "-m", "src.utils.build_qss"], check=True)
 
 # 파일 존재 여부 확인 및 출력
 print("\n포함할 파일/디렉토리 확인:")
@@ -28,6 +33,7 @@ print(f"- 아이콘 디렉토리: {os.path.exists(icons_dir)}")
 print(f"- 모델 디렉토리: {os.path.exists(models_dir)}")
 print(f"- 리소스 테스트 이미지: {os.path.exists(resources_tests_dir)}")
 print(f"- 테스트 이미지: {os.path.exists(tests_dir)}")
+print(f"- 테마 스타일시트: {os.path.exists(themes_dir)}")
 
 # PyInstaller 명령어 생성
 pyinstaller_cmd = [
@@ -46,6 +52,9 @@ pyinstaller_cmd = [
     # 비디오 리소스 추가
     "--add-data", f"{os.path.join(resources_dir, 'videos')};src/resources/videos",
     
+    # 테마 스타일시트 추가
+    "--add-data", f"{themes_dir};src/resources/themes",
+    
     # 기타 리소스 파일 추가
     "--add-data", f"{os.path.join(resources_dir, 'planned_features.json')};src/resources",
     
@@ -14,7 +14,6 @@ APP_NAME = "Tennis Ball Tracker"
 APP_VERSION = "0.1.0"
 ORG_NAME = "Tennis Tracker Team"
 ORG_DOMAIN = "example.com"
-APP_STYLE = "Fusion"
 
 # Set up paths
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -45,7 +44,6 @@ def main():
     
     # Create and initialize application
     app = TennisTrackerApp(sys.argv)
-    app.setStyle(APP_STYLE)
     
     # Start event loop
     exit_code = app.exec()
@@ -14,6 +14,7 @@ from src.controllers.simulation_controller import SimulationController
 from src.controllers.ball_status_display_manager import BallStatusDisplayManager
 from src.controllers.image_display_manager import ImageDisplayManager
 from src.controllers.calibration_overlay_manager import CalibrationOverlayManager
+from src.controllers.image_folder_processor import FolderProcessWorker
 
 # Specify classes/objects to expose externally
 __all__ = [
@@ -24,5 +25,6 @@ __all__ = [
     'FrameManager',
     'FpgaConnectionManager',
     'ImageDisplayManager',
-    'CalibrationOverlayManager'
+    'CalibrationOverlayManager',
+    'FolderProcessWorker'
 ] 
\ No newline at end of file
@@ -14,6 +14,7 @@ from src.models.app_state import AppState
 from src.controllers.image_manager import ImageManager
 from src.utils.logger import Logger
 from src.utils.settings_manager import SettingsManager
+from src.utils.tennis_ball_detector import candidate_arrays, candidate_at
 from src.constants.ui_constants import (
     TENNIS_BALL_DETECTION_THRESHOLD,
     TENNIS_BALL_MIN_CONTOUR_AREA
@@ -148,7 +149,7 @@ class BallDetectionThread(threading.Thread):
         
         result = {
             'detection_type': 'none',
-            'candidate_centers': [],
+            'candidate_centers': candidate_arrays([], [], []),
             'circle_detections': [],
             'selected_center': None,
             'frame_shape': current_frame.shape[:2]  # (height, width)
@@ -157,17 +158,14 @@ class BallDetectionThread(threading.Thread):
         # Process contours to find candidate centers
         if valid_contours:
             result['detection_type'] = 'diff'
+            xs, ys, areas = [], [], []
             for contour in valid_contours:
                 M = cv2.moments(contour)
                 if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    area = cv2.contourArea(contour)
-                    result['candidate_centers'].append({
-                        'x': cx,
-                        'y': cy,
-                        'area': area
-                    })
+                    xs.append(int(M["m10"] / M["m00"]))
+                    ys.append(int(M["m01"] / M["m00"]))
+                    areas.append(cv2.contourArea(contour))
+            result['candidate_centers'] = candidate_arrays(xs, ys, areas)
         
         # Optional: Hough Circle detection for verification
         if self.use_hough and len(current_frame.shape) == 3:
@@ -182,10 +180,10 @@ class BallDetectionThread(threading.Thread):
                     })
         
         # Select best candidate (either largest contour or most confident circle)
-        if result['candidate_centers']:
-            # Sort by area (descending)
-            candidates_sorted = sorted(result['candidate_centers'], key=lambda c: c['area'], reverse=True)
-            result['selected_center'] = candidates_sorted[0]
+        candidates = result['candidate_centers']
+        if len(candidates['area']):
+            # Largest area wins
+            result['selected_center'] = candidate_at(candidates, int(np.argmax(candidates['area'])))
         elif result['circle_detections']:
             # Use first circle (could implement more sophisticated selection)
             result['selected_center'] = result['circle_detections'][0]
@@ -12,6 +12,7 @@ from PySide6.QtWidgets import QLabel
 from src.models.app_state import AppState
 from src.views.widgets.led_display import LedDisplay
 from src.utils.logger import Logger
+from src.utils.ui_theme import set_style_property
 
 class BallStatusDisplayManager(QObject):
     """
@@ -23,15 +24,6 @@ class BallStatusDisplayManager(QObject):
     - Status style management
     """
     
-    # Status display styles
-    STATUS_STYLE_BASE = "font-size: 14pt; font-weight: bold; color: white; padding: 5px; border-radius: 3px;"
-    STATUS_STYLE_NOT_DETECTED = f"{STATUS_STYLE_BASE} background-color: #444;"
-    STATUS_STYLE_IN_BOUNDS = f"{STATUS_STYLE_BASE} background-color: #006400;"
-    STATUS_STYLE_OUT_OF_BOUNDS = f"{STATUS_STYLE_BASE} background-color: #8B0000;"
-    STATUS_STYLE_BOUNCE = f"{STATUS_STYLE_BASE} color: black; background-color: #FFD700;"
-    STATUS_STYLE_IN_SERVICE = f"{STATUS_STYLE_BASE} background-color: #228B22;"
-    STATUS_STYLE_FAULT = f"{STATUS_STYLE_BASE} background-color: #B22222;"
-    
     def __init__(self, status_label=None, led_display=None):
         """
         Constructor
@@ -103,8 +95,7 @@ class BallStatusDisplayManager(QObject):
         self._status_label.setText(f"Ball Status: {status_text}")
         
         # Change color according to status
-        style = self.STATUS_STYLE_IN_BOUNDS if in_bounds else self.STATUS_STYLE_OUT_OF_BOUNDS
-        self._status_label.setStyleSheet(style)
+        set_style_property(self._status_label, "ballStatus", "inBounds" if in_bounds else "outOfBounds")
     
     def update_ball_status(self, status_code, blink_rate=0):
         """
@@ -135,14 +126,14 @@ class BallStatusDisplayManager(QObject):
             return
             
         if status_code == LedDisplay.STATUS_NOT_DETECTED:
-            self._status_label.setStyleSheet(self.STATUS_STYLE_NOT_DETECTED)
+            set_style_property(self._status_label, "ballStatus", "notDetected")
         elif status_code == LedDisplay.STATUS_IN_BOUNDS:
-            self._status_label.setStyleSheet(self.STATUS_STYLE_IN_BOUNDS)
+            set_style_property(self._status_label, "ballStatus", "inBounds")
         elif status_code == LedDisplay.STATUS_OUT_OF_BOUNDS:
-            self._status_label.setStyleSheet(self.STATUS_STYLE_OUT_OF_BOUNDS)
+            set_style_property(self._status_label, "ballStatus", "outOfBounds")
         elif status_code == LedDisplay.STATUS_BOUNCE:
-            self._status_label.setStyleSheet(self.STATUS_STYLE_BOUNCE)
+            set_style_property(self._status_label, "ballStatus", "bounce")
         elif status_code == LedDisplay.STATUS_IN_SERVICE:
-            self._status_label.setStyleSheet(self.STATUS_STYLE_IN_SERVICE)
+            set_style_property(self._status_label, "ballStatus", "inService")
         elif status_code == LedDisplay.STATUS_FAULT:
-            self._status_label.setStyleSheet(self.STATUS_STYLE_FAULT) 
\ No newline at end of file
+            set_style_property(self._status_label, "ballStatus", "fault") 
\ No newline at end of file
@@ -29,7 +29,7 @@ class ImageDisplayManager(QObject):
     
     This class handles:
     - Loading and displaying images
-    - Caching and managing image pixmaps
+    - Managing the displayed image pixmaps
     - Resizing images for display
     - Updating the UI elements based on current frame
     """
@@ -68,10 +68,6 @@ class ImageDisplayManager(QObject):
         self._right_detection_result = None
         self._position_3d = None
         
-        # Image cache for better performance (frame_num -> dict of images)
-        self._image_cache = {}
-        self._max_cache_size = 20  # Maximum number of frames to cache
-        
         # Connect signals
         self._connect_signals()
     
@@ -126,27 +122,8 @@ class ImageDisplayManager(QObject):
             elif frame_number == 0:
                 frame_number = 1  # Convert index 0 to frame 1
             
-            # Try to get images from cache first
-            if frame_number in self._image_cache:
-                cached_images = self._image_cache[frame_number]
-                self._images = cached_images
-                
-                # Update display labels
-                if 'left' in cached_images and cached_images['left'] is not None:
-                    self._update_image_display(self._left_image_label, cached_images['left'])
-                
-                if 'right' in cached_images and cached_images['right'] is not None:
-                    self._update_image_display(self._right_image_label, cached_images['right'])
-                
-                # Copy original pixmaps from cache
-                self._left_original_pixmap = self._image_cache.get(f'left_orig_{frame_number}')
-                self._right_original_pixmap = self._image_cache.get(f'right_orig_{frame_number}')
-                
-                # Emit signal that images have been updated
-                self.images_updated.emit(frame_number)
-                return
-            
-            # Get both camera images in one call
+            # Get both camera images in one call (decoded pixmaps are cached by
+            # full path in ImageManager's ImageCache, so folders never collide)
             left_pixmap, right_pixmap = self.image_manager.get_images(frame_number)
             
             # Update left camera image
@@ -162,19 +139,6 @@ class ImageDisplayManager(QObject):
             # Apply detection overlays if available
             self._apply_detection_overlays()
             
-            # Update cache
-            self._image_cache[frame_number] = self._images
-            self._image_cache[f'left_orig_{frame_number}'] = self._left_original_pixmap
-            self._image_cache[f'right_orig_{frame_number}'] = self._right_original_pixmap
-            
-            # Limit cache size
-            if len(self._image_cache) > self._max_cache_size * 3:  # Each frame takes 3 entries
-                keys = sorted([k for k in self._image_cache.keys() if not isinstance(k, str)])
-                for key in keys[:len(keys) - self._max_cache_size]:
-                    del self._image_cache[key]
-                    del self._image_cache[f'left_orig_{key}']
-                    del self._image_cache[f'right_orig_{key}']
-            
             # Emit signal that images have been updated
             self.images_updated.emit(frame_number)
             
@@ -361,11 +325,12 @@ class ImageDisplayManager(QObject):
                 # Convert QPixmap to OpenCV image for processing
                 image_array = self._pixmap_to_cv2(self._left_original_pixmap)
                 if image_array is not None:
-                    # Draw detection overlay
+                    # Draw detection overlay (image_array is our own converted copy)
                     overlay_image = draw_detection_overlay(
                         image_array, 
                         self._left_detection_result, 
-                        color=OPENCV_GREEN  # Green
+                        color=OPENCV_GREEN,  # Green
+                        inplace=True
                     )
                     
                     # Draw 3D position if available
@@ -373,7 +338,8 @@ class ImageDisplayManager(QObject):
                         overlay_image = draw_3d_position(
                             overlay_image,
                             self._position_3d,
-                            color=OPENCV_GREEN  # Green
+                            color=OPENCV_GREEN,  # Green
+                            inplace=True
                         )
                     
                     # Convert back to QPixmap and update label
@@ -390,11 +356,12 @@ class ImageDisplayManager(QObject):
                 # Convert QPixmap to OpenCV image for processing
                 image_array = self._pixmap_to_cv2(self._right_original_pixmap)
                 if image_array is not None:
-                    # Draw detection overlay
+                    # Draw detection overlay (image_array is our own converted copy)
                     overlay_image = draw_detection_overlay(
                         image_array, 
                         self._right_detection_result, 
-                        color=OPENCV_YELLOW  # Yellow
+                        color=OPENCV_YELLOW,  # Yellow
+                        inplace=True
                     )
                     
                     # Convert back to QPixmap and update label
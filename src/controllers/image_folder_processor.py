@@ -0,0 +1,331 @@
+"""
+Image Folder Processor Module
+
+This module defines the worker that converts a plain folder of camera images
+into the LeftCamera/RightCamera structure with a frames_info.json file.
+The work runs on a thread pool thread and reports back through Qt signals.
+"""
+
+import os
+import json
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import cv2
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from src.utils.logger import Logger
+
+# orjson is optional; without it frames_info.json is written with the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# frames_info.json keys of the files written for each frame, and their paths
+# relative to the folder, formatted with the 1-based frame number
+_FRAME_FILE_KEYS = ("left_raw", "right_raw", "left_resize", "right_resize")
+_FRAME_FILE_TEMPLATES = tuple(
+    os.path.join(camera, subdir, f"frame_{{0:04d}}_{camera}.jpg")
+    for subdir in ("raw", "resize")
+    for camera in ("LeftCamera", "RightCamera")
+)
+
+# frames_info.json stores the relative paths with backslashes on every platform
+_FRAME_INFO_TEMPLATES = tuple(template.replace(os.sep, "\\") for template in _FRAME_FILE_TEMPLATES)
+
+class FolderProcessWorker(QObject):
+    """
+    Worker that builds the camera folder structure for an image folder.
+    
+    This class handles:
+    - Creating the LeftCamera/RightCamera raw and resize folders
+    - Classifying images into left and right cameras
+    - Copying raw frames and writing resized copies
+    - Writing frames_info.json
+    
+    Signals are emitted from the worker thread; connected slots on GUI
+    objects are therefore invoked through queued connections.
+    """
+    
+    # Reason codes reported in the result of a failed run
+    REASON_CANCELED = "canceled"
+    REASON_CLASSIFICATION = "classification"
+    REASON_ERROR = "error"
+    
+    # Source image extensions picked up from the folder
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.bmp')
+    
+    # Upper bound on frames copied and resized at the same time
+    # (OpenCV and file I/O release the GIL, so threads run in parallel)
+    MAX_FRAME_WORKERS = 8
+    
+    # Progress percentage and label text
+    progress = Signal(int, str)
+    
+    # Success flag and result details
+    # (json_file_path/total_frames on success, reason/message on failure)
+    finished = Signal(bool, dict)
+    
+    def __init__(self, folder_path, image_files=None, parent=None):
+        """
+        Initialize the worker
+        
+        Args:
+            folder_path: Image folder to process
+            image_files: Result of scan_image_files() for the folder, if the
+                caller already has it; the folder is scanned otherwise
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.folder_path = folder_path
+        self.image_files = image_files
+        self.logger = Logger.instance()
+        self._cancel_flag = threading.Event()
+    
+    @classmethod
+    def scan_image_files(cls, folder_path):
+        """
+        List the image files under a folder in a single pass
+        
+        os.scandir reports the entry type from the directory listing, so no
+        extra stat call is needed per entry.
+        
+        Args:
+            folder_path: Folder to search recursively
+            
+        Returns:
+            list: Paths of the image files found
+        """
+        image_files = []
+        pending_dirs = [folder_path]
+        while pending_dirs:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.name.lower().endswith(cls.IMAGE_EXTENSIONS):
+                        image_files.append(entry.path)
+        return image_files
+    
+    def cancel(self):
+        """Request the running job to stop at the next frame."""
+        self._cancel_flag.set()
+    
+    def is_canceled(self):
+        """
+        Check whether cancellation has been requested
+        
+        Returns:
+            bool: True if cancel() has been called
+        """
+        return self._cancel_flag.is_set()
+    
+    def start(self):
+        """Run the job on the global thread pool."""
+        QThreadPool.globalInstance().start(_FolderProcessRunnable(self))
+    
+    def run(self):
+        """Process the folder and emit finished with the result."""
+        try:
+            success, result = self._process()
+        except Exception as e:
+            self.logger.error(f"Error processing image folder: {str(e)}")
+            success, result = False, {"reason": self.REASON_ERROR, "message": str(e)}
+        
+        self.finished.emit(success, result)
+    
+    def _process(self):
+        """
+        Create the folder structure, copy and resize frames, and write the JSON file
+        
+        Returns:
+            tuple: (success, result dict)
+        """
+        folder_path = self.folder_path
+        
+        # 1. 필요한 폴더 구조 생성
+        for camera in ["LeftCamera", "RightCamera"]:
+            for subdir in ["raw", "resize"]:
+                path = os.path.join(folder_path, camera, subdir)
+                os.makedirs(path, exist_ok=True)
+        
+        # 2. 이미지 파일 검색
+        self.logger.info("Searching for image files...")
+        self.progress.emit(10, "Searching for image files...")
+        
+        left_files = []
+        right_files = []
+        
+        # 모든 이미지 파일 검색 (호출한 쪽에서 이미 검색했다면 그 결과 사용)
+        if self.image_files is not None:
+            all_files = list(self.image_files)
+        else:
+            all_files = self.scan_image_files(folder_path)
+        
+        self.progress.emit(20, "Classifying images...")
+        
+        # 파일명으로 좌/우 카메라 이미지 분류
+        for file in all_files:
+            if self.is_canceled():
+                return False, {"reason": self.REASON_CANCELED}
+            
+            if "left" in file.lower() or "leftcamera" in file.lower():
+                left_files.append(file)
+            elif "right" in file.lower() or "rightcamera" in file.lower():
+                right_files.append(file)
+        
+        # 만약 Left/Right가 구분되지 않았다면 파일을 첫 번째 절반과 두 번째 절반으로 나누기
+        if not left_files and not right_files and all_files:
+            all_files.sort()
+            mid = len(all_files) // 2
+            left_files = all_files[:mid]
+            right_files = all_files[mid:]
+        
+        if not left_files or not right_files:
+            return False, {"reason": self.REASON_CLASSIFICATION}
+        
+        # 파일 정렬
+        left_files.sort()
+        right_files.sort()
+        
+        self.progress.emit(30, "Copying and adjusting files...")
+        
+        # 3. 이미지 처리 및 복사
+        self.logger.info(f"Processing {len(left_files)} left files and {len(right_files)} right files")
+        total_files = min(len(left_files), len(right_files))
+        
+        # 각 프레임을 독립된 작업으로 병렬 처리
+        entries = []
+        max_workers = min(self.MAX_FRAME_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="folder_process") as executor:
+            futures = [
+                executor.submit(self._process_one_frame, i + 1, left_files[i], right_files[i])
+                for i in range(total_files)
+            ]
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                if self.is_canceled():
+                    # 시작하지 않은 프레임은 취소하고 실행 중인 프레임만 기다림
+                    for pending in futures:
+                        pending.cancel()
+                    return False, {"reason": self.REASON_CANCELED}
+                
+                entries.append(future.result())
+                
+                # 진행상황 업데이트
+                progress_value = 30 + int(done / total_files * 60)  # 30% ~ 90%
+                self.progress.emit(progress_value, f"Processing images... ({done}/{total_files})")
+        
+        # 완료 순서와 관계없이 프레임 번호 순으로 기록
+        entries.sort(key=lambda entry: entry["frame_number"])
+        frame_info = {str(entry["frame_number"]): entry for entry in entries}
+        
+        self.progress.emit(90, "Generating JSON file...")
+        
+        # 4. JSON 파일 생성
+        json_data = {
+            "total_frames": total_files,
+            "frame_info": frame_info
+        }
+        
+        json_file_path = os.path.join(folder_path, "frames_info.json")
+        if orjson is not None:
+            with open(json_file_path, 'wb') as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            # 같은 들여쓰기로 기록해 어느 경로로 만들어도 파일 형식이 같음
+            with open(json_file_path, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, indent=2)
+        
+        self.logger.info(f"Created frames_info.json with {total_files} frames")
+        
+        return True, {"json_file_path": json_file_path, "total_frames": total_files}
+    
+    def _process_one_frame(self, frame_number, left_file, right_file):
+        """
+        Copy and resize one left/right frame pair
+        
+        Args:
+            frame_number: 1-based frame number
+            left_file: Source image of the left camera
+            right_file: Source image of the right camera
+            
+        Returns:
+            dict: frames_info.json entry for the frame
+        """
+        # 파일 경로 생성
+        left_raw, right_raw, left_resize, right_resize = (
+            os.path.join(self.folder_path, template.format(frame_number))
+            for template in _FRAME_FILE_TEMPLATES
+        )
+        
+        # raw 파일 복사
+        self._copy_file(left_file, left_raw)
+        self._copy_file(right_file, right_raw)
+        
+        # 이미지 리사이징
+        self._resize_image(left_raw, left_resize, height=280)
+        self._resize_image(right_raw, right_resize, height=280)
+        
+        # 프레임 정보
+        frame_entry = {"frame_number": frame_number}
+        for key, template in zip(_FRAME_FILE_KEYS, _FRAME_INFO_TEMPLATES):
+            frame_entry[key] = template.format(frame_number)
+        return frame_entry
+    
+    def _copy_file(self, src, dst):
+        """Link or copy a file. Skips if the destination file already exists."""
+        try:
+            if not os.path.lexists(dst):
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                
+                # 메타데이터가 필요 없으므로 같은 파일 시스템이면 하드 링크로 대체하고,
+                # 아니면 내용만 복사 (shutil.copyfile은 가능하면 sendfile 등 커널 복사 사용)
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copyfile(src, dst)
+            
+            return True
+        except Exception as e:
+            self.logger.error(f"Error copying file {src} to {dst}: {str(e)}")
+            return False
+    
+    def _resize_image(self, src, dst, height=280):
+        """Resize an image. Skips if the destination file already exists."""
+        if not os.path.exists(dst):
+            try:
+                # imread/imwrite 대신 버퍼로 디코드/인코드 (Windows의 비 ASCII 경로 지원)
+                # EXIF 회전은 원본 raw 파일과 같게 적용하지 않음
+                data = np.fromfile(src, dtype=np.uint8)
+                img = cv2.imdecode(data, cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+                if img is None:
+                    raise ValueError("Unsupported image format")
+                
+                h, w = img.shape[:2]
+                new_width = int(w * height / h)
+                
+                # 축소에는 INTER_AREA가 LANCZOS보다 빠르고 앨리어싱도 적음
+                resized_img = cv2.resize(img, (new_width, height), interpolation=cv2.INTER_AREA)
+                
+                encoded, buffer = cv2.imencode(".jpg", resized_img, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                if not encoded:
+                    raise ValueError("JPEG encoding failed")
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                buffer.tofile(dst)
+            except Exception as e:
+                self.logger.error(f"Error resizing image {src}: {str(e)}")
+                # 리사이징 실패 시 원본 파일 복사
+                self._copy_file(src, dst)
+
+class _FolderProcessRunnable(QRunnable):
+    """QRunnable wrapper that runs a FolderProcessWorker on a pool thread."""
+    
+    def __init__(self, worker):
+        super().__init__()
+        self._worker = worker
+    
+    def run(self):
+        self._worker.run()
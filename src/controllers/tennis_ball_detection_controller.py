@@ -7,6 +7,7 @@ and calculating 3D positions using stereo correspondence.
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import json
 import numpy as np
 import cv2
@@ -19,7 +20,9 @@ from src.utils.settings_manager import SettingsManager
 from src.utils.tennis_ball_detector import (
     detect_tennis_ball_by_color,
     calculate_3d_position,
-    draw_detection_overlay
+    draw_detection_overlay,
+    candidate_arrays,
+    candidate_at
 )
 from src.constants.ui_constants import (
     TENNIS_BALL_DETECTION_THRESHOLD,
@@ -70,6 +73,8 @@ class TennisBallDetectionThread(threading.Thread):
         
         # Color detection settings
         self.use_color_detection = self.settings_manager.get("use_color_detection", True)
+        self.color_downsample = self.settings_manager.get("color_detection_downsample", False)
+        self.color_roi = self.settings_manager.get("color_detection_roi", None)  # (x, y, w, h)
         hsv_low_h = self.settings_manager.get("hsv_low_h", TENNIS_BALL_HSV_LOWER[0])
         hsv_low_s = self.settings_manager.get("hsv_low_s", TENNIS_BALL_HSV_LOWER[1])
         hsv_low_v = self.settings_manager.get("hsv_low_v", TENNIS_BALL_HSV_LOWER[2])
@@ -77,8 +82,9 @@ class TennisBallDetectionThread(threading.Thread):
         hsv_high_s = self.settings_manager.get("hsv_high_s", TENNIS_BALL_HSV_UPPER[1])
         hsv_high_v = self.settings_manager.get("hsv_high_v", TENNIS_BALL_HSV_UPPER[2])
         
-        self.hsv_lower = np.array([hsv_low_h, hsv_low_s, hsv_low_v])
-        self.hsv_upper = np.array([hsv_high_h, hsv_high_s, hsv_high_v])
+        # uint8 to match the HSV image depth, so inRange needs no conversion
+        self.hsv_lower = np.array([hsv_low_h, hsv_low_s, hsv_low_v], dtype=np.uint8)
+        self.hsv_upper = np.array([hsv_high_h, hsv_high_s, hsv_high_v], dtype=np.uint8)
         
         # Hough circle detection settings
         self.use_hough = self.settings_manager.get("use_hough_detection", False)
@@ -116,6 +122,14 @@ class TennisBallDetectionThread(threading.Thread):
             if 'principal_point' not in camera_params:
                 camera_params['principal_point'] = (0, 0)
             
+            # Store the extrinsics as plain float tuples for the per-frame math
+            if 'rotation_matrix' in camera_params:
+                camera_params['rotation_matrix'] = tuple(
+                    tuple(float(v) for v in row) for row in camera_params['rotation_matrix'])
+            if 'translation_vector' in camera_params:
+                camera_params['translation_vector'] = tuple(
+                    float(v) for v in camera_params['translation_vector'])
+            
             self.logger.debug(f"Loaded camera parameters: {camera_params}")
             return camera_params
             
@@ -136,77 +150,90 @@ class TennisBallDetectionThread(threading.Thread):
         prev_right_frame = None
         prev_time = time.time()
         
-        while not self.interrupt_flag.is_set():
-            # Handle pause state
-            if self.paused.is_set():
-                time.sleep(0.1)
-                continue
-            
-            # Measure FPS
-            current_time = time.time()
-            elapsed = current_time - prev_time
-            fps = 1.0 / elapsed if elapsed > 0 else 0
-            prev_time = current_time
-            
-            # Get current frame index
-            frame_idx = self.app_state.current_frame
-            if frame_idx < 0:
-                time.sleep(0.1)
-                continue
-            
-            # Get frames from both cameras
-            left_frame = self.image_manager.get_frame('left', frame_idx)
-            right_frame = self.image_manager.get_frame('right', frame_idx)
-            
-            if left_frame is None or right_frame is None:
-                time.sleep(0.1)
-                continue
-            
-            # Initialize previous frames if needed
-            if prev_left_frame is None:
-                prev_left_frame = left_frame
-            if prev_right_frame is None:
-                prev_right_frame = right_frame
-            
-            try:
-                # Measure processing time
-                start_process = time.time()
+        # Per-frame masks are small enough that OpenCV's internal thread pool
+        # costs more than it saves; the two cameras run in parallel instead
+        cv2.setNumThreads(1)
+        
+        # Two workers so both camera views are detected concurrently
+        # (OpenCV releases the GIL while it works)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tennis_ball_detect")
+        try:
+            while not self.interrupt_flag.is_set():
+                # Handle pause state
+                if self.paused.is_set():
+                    time.sleep(0.1)
+                    continue
                 
-                # Detect tennis ball in both camera views
-                left_detection = self._detect_tennis_ball(prev_left_frame, left_frame)
-                right_detection = self._detect_tennis_ball(prev_right_frame, right_frame)
+                # Measure FPS
+                current_time = time.time()
+                elapsed = current_time - prev_time
+                fps = 1.0 / elapsed if elapsed > 0 else 0
+                prev_time = current_time
                 
-                # Calculate 3D position if we have detections from both cameras
-                position_data = calculate_3d_position(
-                    left_detection,
-                    right_detection, 
-                    self.camera_params
-                )
+                # Get current frame index
+                frame_idx = self.app_state.current_frame
+                if frame_idx < 0:
+                    time.sleep(0.1)
+                    continue
                 
-                # Update previous frames
-                prev_left_frame = left_frame
-                prev_right_frame = right_frame
+                # Get frames from both cameras
+                left_frame = self.image_manager.get_frame('left', frame_idx)
+                right_frame = self.image_manager.get_frame('right', frame_idx)
                 
-                # Prepare result dictionary
-                result = {
-                    'left': left_detection,
-                    'right': right_detection,
-                    'position': position_data,
-                    'timestamp': time.time()
-                }
+                if left_frame is None or right_frame is None:
+                    time.sleep(0.1)
+                    continue
                 
-                # Calculate processing time
-                process_time = time.time() - start_process
+                # Initialize previous frames if needed
+                if prev_left_frame is None:
+                    prev_left_frame = left_frame
+                if prev_right_frame is None:
+                    prev_right_frame = right_frame
                 
-                # Call callback if one was provided
-                if self.callback:
-                    self.callback(result, fps, process_time)
+                try:
+                    # Measure processing time
+                    start_process = time.time()
+                    
+                    # Detect tennis ball in both camera views concurrently
+                    left_future = self._executor.submit(self._detect_tennis_ball, prev_left_frame, left_frame)
+                    right_future = self._executor.submit(self._detect_tennis_ball, prev_right_frame, right_frame)
+                    left_detection = left_future.result()
+                    right_detection = right_future.result()
+                    
+                    # Calculate 3D position if we have detections from both cameras
+                    position_data = calculate_3d_position(
+                        left_detection,
+                        right_detection, 
+                        self.camera_params
+                    )
+                    
+                    # Update previous frames
+                    prev_left_frame = left_frame
+                    prev_right_frame = right_frame
+                    
+                    # Prepare result dictionary
+                    result = {
+                        'left': left_detection,
+                        'right': right_detection,
+                        'position': position_data,
+                        'timestamp': time.time()
+                    }
+                    
+                    # Calculate processing time
+                    process_time = time.time() - start_process
+                    
+                    # Call callback if one was provided
+                    if self.callback:
+                        self.callback(result, fps, process_time)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error in tennis ball detection: {e}")
                 
-            except Exception as e:
-                self.logger.error(f"Error in tennis ball detection: {e}")
-            
-            # Sleep briefly to avoid consuming too much CPU
-            time.sleep(0.01)
+                # Sleep briefly to avoid consuming too much CPU
+                time.sleep(0.01)
+        finally:
+            # Release the worker threads even if the loop exits with an error
+            self._executor.shutdown(wait=False)
     
     def _detect_tennis_ball(self, prev_frame, curr_frame):
         """
@@ -224,7 +251,9 @@ class TennisBallDetectionThread(threading.Thread):
             color_result = detect_tennis_ball_by_color(
                 curr_frame,
                 self.hsv_lower,
-                self.hsv_upper
+                self.hsv_upper,
+                downsample=self.color_downsample,
+                roi=self.color_roi
             )
             
             # If we get good detection with color, return it
@@ -256,30 +285,25 @@ class TennisBallDetectionThread(threading.Thread):
         # Prepare result dictionary
         result = {
             'detection_type': 'none',
-            'candidate_centers': [],
+            'candidate_centers': candidate_arrays([], [], []),
             'circle_detections': [],
             'selected_center': None,
             'frame_shape': curr_frame.shape[:2]  # (height, width)
         }
         
         # Process contours to find candidate centers
+        candidate_contours = []
         if valid_contours:
             result['detection_type'] = 'diff'
+            xs, ys, areas = [], [], []
             for contour in valid_contours:
                 M = cv2.moments(contour)
                 if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    area = cv2.contourArea(contour)
-                    # Get bounding circle radius
-                    (_, _), radius = cv2.minEnclosingCircle(contour)
-                    
-                    result['candidate_centers'].append({
-                        'x': cx,
-                        'y': cy,
-                        'area': area,
-                        'radius': radius
-                    })
+                    xs.append(int(M["m10"] / M["m00"]))
+                    ys.append(int(M["m01"] / M["m00"]))
+                    areas.append(cv2.contourArea(contour))
+                    candidate_contours.append(contour)
+            result['candidate_centers'] = candidate_arrays(xs, ys, areas)
         
         # Optional: Use Hough Circle detection for verification if enabled
         if self.use_hough and len(curr_frame.shape) == 3:
@@ -311,10 +335,13 @@ class TennisBallDetectionThread(threading.Thread):
                     })
         
         # Select best candidate (either largest contour or most confident circle)
-        if result['candidate_centers']:
-            # Sort by area (descending)
-            candidates_sorted = sorted(result['candidate_centers'], key=lambda c: c['area'], reverse=True)
-            result['selected_center'] = candidates_sorted[0]
+        candidates = result['candidate_centers']
+        if len(candidates['area']):
+            # Largest area wins; get its bounding circle radius
+            best = int(np.argmax(candidates['area']))
+            selected = candidate_at(candidates, best)
+            (_, _), selected['radius'] = cv2.minEnclosingCircle(candidate_contours[best])
+            result['selected_center'] = selected
         elif result['circle_detections']:
             # Use first circle (could implement more sophisticated selection)
             result['selected_center'] = result['circle_detections'][0]
@@ -0,0 +1,25 @@
+"""
+Write the dark theme style sheets to .qss files for packaged builds
+"""
+
+import os
+from src.utils.ui_theme import THEME_DIR, THEME_FILES, get_global_stylesheet
+
+def build_qss(base_dir: str = "."):
+    """
+    Write every global style sheet variant to the themes directory
+    
+    Args:
+        base_dir: Project root the themes directory is created under
+    """
+    theme_dir = os.path.join(base_dir, THEME_DIR)
+    os.makedirs(theme_dir, exist_ok=True)
+    
+    for transparent_background, file_name in enumerate(THEME_FILES):
+        qss_path = os.path.join(theme_dir, file_name)
+        with open(qss_path, 'w', encoding='utf-8') as file:
+            file.write(get_global_stylesheet(bool(transparent_background)))
+        print(f"Wrote {qss_path}")
+
+if __name__ == "__main__":
+    build_qss()
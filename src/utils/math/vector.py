@@ -19,6 +19,9 @@ class Vector2D:
     working with point coordinates throughout the application.
     """
     
+    # Fixed two-field layout: no per-instance __dict__
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: Union[int, float] = 0, y: Union[int, float] = 0):
         """
         Initialize a 2D vector with x and y components.
@@ -30,6 +33,26 @@ class Vector2D:
         self.x = float(x)
         self.y = float(y)
         
+    @classmethod
+    def _fast(cls, x: float, y: float) -> 'Vector2D':
+        """
+        Create a vector from components that are already floats.
+        
+        Skips __init__ and its float() coercion; callers must guarantee
+        that both components are floats.
+        
+        Args:
+            x: The x component as a float
+            y: The y component as a float
+            
+        Returns:
+            Vector2D: A new Vector2D object
+        """
+        vector = cls.__new__(cls)
+        vector.x = x
+        vector.y = y
+        return vector
+        
     def __str__(self) -> str:
         """Return human-readable string representation"""
         return f"Vector2D({self.x:.1f}, {self.y:.1f})"
@@ -64,7 +87,7 @@ class Vector2D:
         """
         if not isinstance(other, Vector2D):
             raise TypeError("Can only add Vector2D objects")
-        return Vector2D(self.x + other.x, self.y + other.y)
+        return Vector2D._fast(self.x + other.x, self.y + other.y)
         
     def __sub__(self, other) -> 'Vector2D':
         """
@@ -78,7 +101,7 @@ class Vector2D:
         """
         if not isinstance(other, Vector2D):
             raise TypeError("Can only subtract Vector2D objects")
-        return Vector2D(self.x - other.x, self.y - other.y)
+        return Vector2D._fast(self.x - other.x, self.y - other.y)
         
     def __mul__(self, scalar: Union[int, float]) -> 'Vector2D':
         """
@@ -117,7 +140,7 @@ class Vector2D:
         Returns:
             float: The length of the vector
         """
-        return math.sqrt(self.x * self.x + self.y * self.y)
+        return math.hypot(self.x, self.y)
         
     def distance_to(self, other: 'Vector2D') -> float:
         """
@@ -129,7 +152,7 @@ class Vector2D:
         Returns:
             float: The distance between the two vectors
         """
-        return (other - self).length()
+        return math.hypot(other.x - self.x, other.y - self.y)
         
     def normalized(self) -> 'Vector2D':
         """
@@ -173,8 +196,8 @@ class Vector2D:
         """
         return (int(self.x), int(self.y))
         
-    @staticmethod
-    def from_tuple(tuple_value: Tuple[Union[int, float], Union[int, float]]) -> 'Vector2D':
+    @classmethod
+    def from_tuple(cls, tuple_value: Tuple[Union[int, float], Union[int, float]]) -> 'Vector2D':
         """
         Create a Vector2D from a tuple.
         
@@ -184,7 +207,7 @@ class Vector2D:
         Returns:
             Vector2D: A new Vector2D object
         """
-        return Vector2D(tuple_value[0], tuple_value[1])
+        return cls._fast(float(tuple_value[0]), float(tuple_value[1]))
         
     @staticmethod
     def from_normalized(norm_x: float, norm_y: float, width: int, height: int) -> 'Vector2D':
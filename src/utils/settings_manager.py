@@ -6,11 +6,13 @@ The SettingsManager class uses a JSON file to persist settings across applicatio
 """
 
 import os
+import sys
 import json
+from types import MappingProxyType
 from PySide6.QtCore import QObject, Signal, QSize, QPoint
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TypeVar, cast
+from typing import Any, Dict, List, Mapping, Optional, Union, TypeVar, cast
 
 from src.models.singleton import qt_singleton
 from src.utils.logger import Logger
@@ -19,20 +21,10 @@ from src.utils.logger import Logger
 SettingValue = TypeVar('SettingValue', str, int, float, bool, list, dict)
 SettingsDict = Dict[str, Any]
 
-@qt_singleton
-class SettingsManager:
-    """
-    Singleton class that manages application settings
-    
-    This class provides the following features:
-    - Saving settings
-    - Loading settings
-    - Managing default values
-    - Validating settings
-    """
-    
-    # Default settings definitions
-    DEFAULT_SETTINGS: SettingsDict = {
+# Default settings, keyed by interned strings and wrapped read-only so that
+# no instance can mutate the shared defaults by accident
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    sys.intern(key): value for key, value in {
         "last_file_path": "",          # Last opened file path
         "last_folder_path": "",        # Last opened folder path
         "playback_speed": 1000,        # Playback speed (fps)
@@ -48,7 +40,23 @@ class SettingsManager:
         "fpga_auto_connect": False,    # Auto-connect to FPGA on startup
         "calibration_points_dir": "",  # Directory for calibration points files
         "calibration_points_file": "", # Default calibration points file
-    }
+    }.items()
+})
+
+@qt_singleton
+class SettingsManager:
+    """
+    Singleton class that manages application settings
+    
+    This class provides the following features:
+    - Saving settings
+    - Loading settings
+    - Managing default values
+    - Validating settings
+    """
+    
+    # Default settings definitions (read-only, shared by all instances)
+    DEFAULT_SETTINGS: Mapping[str, Any] = _DEFAULT_SETTINGS
     
     # Settings validation constraints
     SETTINGS_CONSTRAINTS = {
@@ -75,17 +83,20 @@ class SettingsManager:
     
     def _get_default_settings(self) -> SettingsDict:
         """
-        Get a copy of the default settings
+        Get a mutable copy of the default settings
         
         Returns:
             SettingsDict: Copy of default settings
         """
-        return self.DEFAULT_SETTINGS.copy()
+        return dict(self.DEFAULT_SETTINGS)
     
     def _initialize_settings(self) -> None:
-        """Initialize settings directory and load settings file"""
-        self._ensure_settings_directory_exists()
+        """
+        Load settings file
         
+        The settings directory is not touched here; it is created lazily
+        by the first write in save_settings().
+        """
         # Load settings file
         if not self.load_settings():
             # Save default settings if settings file doesn't exist
@@ -124,19 +135,45 @@ class SettingsManager:
         Returns:
             bool: True if settings were saved successfully, False otherwise
         """
-        # Ensure settings directory exists
+        # Create the settings directory on first write only
         if not self._ensure_settings_directory_exists():
             return False
                 
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as file:
-                json.dump(self.settings, file, indent=4)
+            # Compact output keeps json on its C encoder fast path
+            data = json.dumps(self.settings, separators=(',', ':')).encode('utf-8')
+            with open(self.settings_file, 'wb') as file:
+                file.write(data)
             self.logger.info(f"Settings saved: {self.settings_file}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to save settings: {e}")
             return False
     
+    def export_settings(self, file_path: Union[str, Path], pretty: bool = True) -> bool:
+        """
+        Export current settings to a user-chosen file
+        
+        Args:
+            file_path: Destination file path
+            pretty: Indent the output for human reading
+            
+        Returns:
+            bool: True if settings were exported successfully, False otherwise
+        """
+        try:
+            if pretty:
+                data = json.dumps(self.settings, indent=4)
+            else:
+                data = json.dumps(self.settings, separators=(',', ':'))
+            with open(file_path, 'wb') as file:
+                file.write(data.encode('utf-8'))
+            self.logger.info(f"Settings exported: {file_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to export settings: {e}")
+            return False
+    
     def load_settings(self) -> bool:
         """
         Load settings from file
@@ -144,22 +181,19 @@ class SettingsManager:
         Returns:
             bool: True if settings were loaded successfully, False otherwise
         """
-        if not self.settings_file.exists():
-            self.logger.warning(f"Settings file not found. Using defaults.")
-            return False
-        
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as file:
-                loaded_settings = json.load(file)
-                
-                # Override playback_speed to force 1000 fps
-                if "playback_speed" in loaded_settings and loaded_settings["playback_speed"] != 1000:
-                    self.logger.info(f"Forcing playback_speed to 1000 fps (was {loaded_settings['playback_speed']})")
-                    loaded_settings["playback_speed"] = 1000
-                
-                # Verify and merge loaded settings into current settings
-                self._merge_settings(loaded_settings)
+            # Read the whole file in one call and decode it in one pass
+            with open(self.settings_file, 'rb') as file:
+                loaded_settings = json.loads(file.read())
                 
+            # Override playback_speed to force 1000 fps
+            if "playback_speed" in loaded_settings and loaded_settings["playback_speed"] != 1000:
+                self.logger.info(f"Forcing playback_speed to 1000 fps (was {loaded_settings['playback_speed']})")
+                loaded_settings["playback_speed"] = 1000
+            
+            # Verify and merge loaded settings into current settings
+            self._merge_settings(loaded_settings)
+            
             self.logger.info(f"Settings loaded: {self.settings_file}")
             
             # Force save to ensure the speed change is stored permanently
@@ -167,6 +201,9 @@ class SettingsManager:
                 self.save_settings()
                 
             return True
+        except FileNotFoundError:
+            self.logger.warning("Settings file not found. Using defaults.")
+            return False
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse settings file: {e}")
             return False
@@ -228,6 +265,7 @@ class SettingsManager:
         Returns:
             The setting value or default if not found
         """
+        key = sys.intern(key)
         if default is None and key in self.DEFAULT_SETTINGS:
             default = self.DEFAULT_SETTINGS[key]
             
@@ -244,6 +282,8 @@ class SettingsManager:
         Returns:
             bool: True if the setting was saved successfully, False otherwise
         """
+        key = sys.intern(key)
+        
         # Check if value changed
         if key in self.settings and self.settings[key] == value:
             return True
@@ -267,7 +307,11 @@ class SettingsManager:
         Returns:
             bool: True if the setting was saved successfully, False otherwise
         """
-        if not path or not os.path.exists(path):
+        # Nothing to stat or save when the path is unchanged
+        if path and path == self.settings.get("last_file_path"):
+            return True
+            
+        if not path or not os.path.isfile(path):
             self.logger.warning(f"Invalid file path: {path}")
             return False
             
@@ -354,7 +398,11 @@ class SettingsManager:
         Returns:
             bool: True if the setting was saved successfully, False otherwise
         """
-        if not path or not os.path.exists(path):
+        # Nothing to stat or save when the path is unchanged
+        if path and path == self.settings.get("last_folder_path"):
+            return True
+            
+        if not path or not os.path.isdir(path):
             self.logger.warning(f"Invalid folder path: {path}")
             return False
             
@@ -7,8 +7,16 @@ This module provides utility functions for tennis ball detection, including:
 - Stereo correspondence
 """
 
+import threading
 import cv2
 import numpy as np
+
+# Numba is optional; without it batched triangulation uses plain NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from src.constants.ui_constants import (
     TENNIS_BALL_HSV_LOWER, TENNIS_BALL_HSV_UPPER,
     TENNIS_BALL_MIN_CONTOUR_AREA, TENNIS_BALL_MAX_EXPECTED_AREA,
@@ -21,78 +29,240 @@ from src.constants.ui_constants import (
     OPENCV_GREEN
 )
 
+# Default HSV bounds and morphology kernel, built once instead of per frame.
+# Bounds are C-contiguous uint8 arrays matching the 8-bit HSV image depth.
+_HSV_LOWER = np.array(TENNIS_BALL_HSV_LOWER, dtype=np.uint8)
+_HSV_UPPER = np.array(TENNIS_BALL_HSV_UPPER, dtype=np.uint8)
+_MORPH_KERNEL = cv2.getStructuringElement(
+    cv2.MORPH_RECT, (TENNIS_BALL_KERNEL_SIZE, TENNIS_BALL_KERNEL_SIZE))
+
+# An opening (erode N + dilate N) plus the leftover dilations equals
+# erode-then-dilate only when there are at least as many dilations as erosions
+_USE_MORPH_OPEN = TENNIS_BALL_DILATE_ITERATIONS >= TENNIS_BALL_ERODE_ITERATIONS
+_EXTRA_DILATE_ITERATIONS = TENNIS_BALL_DILATE_ITERATIONS - TENNIS_BALL_ERODE_ITERATIONS
+
+# Reusable mask buffers, one set per thread because the left and right
+# cameras may be detected concurrently
+_mask_buffers = threading.local()
+
+# Last rendered 3D position label bitmap (see draw_3d_position), held as one
+# (key, mask, origin) tuple that is replaced in a single assignment so
+# concurrent readers never see a key paired with another label's bitmap
+_position_text_cache = (None, None, None)
 
-def detect_tennis_ball_by_color(frame, hsv_lower=None, hsv_upper=None):
+# Overlay colors as OpenCV BGR tuples, converted from QColor once
+_GREEN_BGR = (DETECTION_GREEN.blue(), DETECTION_GREEN.green(), DETECTION_GREEN.red())
+_ORANGE_BGR = (DETECTION_ORANGE.blue(), DETECTION_ORANGE.green(), DETECTION_ORANGE.red())
+_BLUE_BGR = (DETECTION_BLUE.blue(), DETECTION_BLUE.green(), DETECTION_BLUE.red())
+
+
+def _get_mask_buffers(shape):
+    """
+    Get two reusable single-channel masks for the calling thread.
+    
+    The buffers are reallocated only when the requested shape changes.
+    
+    Args:
+        shape: (height, width) of the masks
+        
+    Returns:
+        Tuple of two uint8 arrays of the given shape
+    """
+    if getattr(_mask_buffers, 'shape', None) != shape:
+        _mask_buffers.shape = shape
+        _mask_buffers.pair = (np.empty(shape, dtype=np.uint8), np.empty(shape, dtype=np.uint8))
+    return _mask_buffers.pair
+
+
+def _get_labels_buffer(shape):
+    """
+    Get a reusable int32 label image for the calling thread.
+    
+    Kept next to the mask buffers and reallocated only when the shape changes.
+    
+    Args:
+        shape: (height, width) of the label image
+        
+    Returns:
+        int32 array of the given shape
+    """
+    if getattr(_mask_buffers, 'labels_shape', None) != shape:
+        _mask_buffers.labels_shape = shape
+        _mask_buffers.labels = np.empty(shape, dtype=np.int32)
+    return _mask_buffers.labels
+
+
+def candidate_arrays(xs, ys, areas):
+    """
+    Pack candidate centers into a struct-of-arrays table.
+    
+    Args:
+        xs: Candidate x coordinates
+        ys: Candidate y coordinates
+        areas: Candidate areas
+        
+    Returns:
+        Dictionary of parallel arrays: 'x' and 'y' (int32) and 'area' (float64)
+    """
+    return {
+        'x': np.asarray(xs, dtype=np.int32),
+        'y': np.asarray(ys, dtype=np.int32),
+        'area': np.asarray(areas, dtype=np.float64)
+    }
+
+
+def candidate_at(candidates, index):
+    """
+    Extract a single candidate from a struct-of-arrays table.
+    
+    Args:
+        candidates: Table built by candidate_arrays()
+        index: Row index of the candidate
+        
+    Returns:
+        Dictionary with 'x', 'y' and 'area' of the candidate
+    """
+    return {
+        'x': int(candidates['x'][index]),
+        'y': int(candidates['y'][index]),
+        'area': float(candidates['area'][index])
+    }
+
+
+def detect_tennis_ball_by_color(frame, hsv_lower=None, hsv_upper=None, downsample=False, roi=None):
     """
     Detect a tennis ball in a single frame using HSV color filtering.
     
+    Thin BGR wrapper around detect_tennis_ball_from_hsv(); callers that
+    already have the HSV image should call that function directly.
+    
     Args:
         frame: BGR input frame
         hsv_lower: Lower HSV range for tennis ball color (default: yellow-green)
         hsv_upper: Upper HSV range for tennis ball color
+        downsample: Run detection on a half-resolution copy (cv2.pyrDown);
+            coordinates, radius and area are reported at full resolution
+        roi: Optional region of interest (x, y, w, h); only these pixels are
+            converted and searched, coordinates are reported in frame space
+        
+    Returns:
+        Dictionary with detection results; 'candidate_centers' is a
+        struct-of-arrays table (see candidate_arrays())
+    """
+    # Restrict all per-pixel work to the region of interest
+    source = frame
+    if roi is not None:
+        roi_x, roi_y, roi_w, roi_h = roi
+        source = frame[roi_y:roi_y + roi_h, roi_x:roi_x + roi_w]
+    
+    # Optionally work on a half-resolution frame (a quarter of the pixels)
+    scale = 2 if downsample else 1
+    if downsample:
+        source = cv2.pyrDown(source)
+    
+    # Convert frame to HSV for color detection
+    hsv = cv2.cvtColor(source, cv2.COLOR_BGR2HSV)
+    
+    result = detect_tennis_ball_from_hsv(hsv, hsv_lower, hsv_upper,
+                                         frame_shape=frame.shape[:2], scale=scale)
+    
+    # Shift coordinates from ROI space back to frame space
+    if roi is not None:
+        result['candidate_centers']['x'] += roi_x
+        result['candidate_centers']['y'] += roi_y
+        selected = result['selected_center']
+        if selected:
+            selected['x'] += roi_x
+            selected['y'] += roi_y
+    
+    return result
+
+
+def detect_tennis_ball_from_hsv(hsv, hsv_lower=None, hsv_upper=None, frame_shape=None, scale=1):
+    """
+    Detect a tennis ball in an image that is already converted to HSV.
+    
+    Args:
+        hsv: HSV input image (8-bit)
+        hsv_lower: Lower HSV range for tennis ball color (default: yellow-green);
+            pass a uint8 array so cv2.inRange needs no per-call conversion
+        hsv_upper: Upper HSV range for tennis ball color (uint8 array)
+        frame_shape: (height, width) reported in the result (default: hsv shape)
+        scale: Factor from hsv pixels to reported pixels, e.g. 2 when hsv
+            was computed from a cv2.pyrDown copy of the frame
         
     Returns:
-        Dictionary with detection results
+        Dictionary with detection results (see detect_tennis_ball_by_color())
     """
     # Default tennis ball color range (yellow-green)
     if hsv_lower is None:
-        hsv_lower = np.array(TENNIS_BALL_HSV_LOWER)
+        hsv_lower = _HSV_LOWER
     if hsv_upper is None:
-        hsv_upper = np.array(TENNIS_BALL_HSV_UPPER)
+        hsv_upper = _HSV_UPPER
+    if frame_shape is None:
+        frame_shape = hsv.shape[:2]
     
-    # Convert frame to HSV for color detection
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    # Minimum blob (connected component) area expressed in hsv pixels
+    min_area = TENNIS_BALL_MIN_CONTOUR_AREA / (scale * scale)
+    
+    # Masks are written into this thread's persistent buffers (ping-pong
+    # between the two) instead of allocating a new image per step
+    mask_a, mask_b = _get_mask_buffers(hsv.shape[:2])
     
     # Create mask and filter by color
-    mask = cv2.inRange(hsv, hsv_lower, hsv_upper)
+    mask = cv2.inRange(hsv, hsv_lower, hsv_upper, dst=mask_a)
     
     # Apply morphological operations to reduce noise
-    kernel = np.ones((TENNIS_BALL_KERNEL_SIZE, TENNIS_BALL_KERNEL_SIZE), np.uint8)
-    mask = cv2.erode(mask, kernel, iterations=TENNIS_BALL_ERODE_ITERATIONS)
-    mask = cv2.dilate(mask, kernel, iterations=TENNIS_BALL_DILATE_ITERATIONS)
-    
-    # Find contours in the mask
-    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    # (an opening followed by the remaining dilations when that is equivalent)
+    if _USE_MORPH_OPEN:
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _MORPH_KERNEL, dst=mask_b,
+                                iterations=TENNIS_BALL_ERODE_ITERATIONS)
+        if _EXTRA_DILATE_ITERATIONS:
+            mask = cv2.dilate(mask, _MORPH_KERNEL, dst=mask_a, iterations=_EXTRA_DILATE_ITERATIONS)
+    else:
+        mask = cv2.erode(mask, _MORPH_KERNEL, dst=mask_b, iterations=TENNIS_BALL_ERODE_ITERATIONS)
+        mask = cv2.dilate(mask, _MORPH_KERNEL, dst=mask_a, iterations=TENNIS_BALL_DILATE_ITERATIONS)
     
     # Prepare result dictionary
     result = {
         'detection_type': 'none',
-        'candidate_centers': [],
+        'candidate_centers': candidate_arrays([], [], []),
         'circle_detections': [],
         'selected_center': None,
-        'frame_shape': frame.shape[:2]  # (height, width)
+        'frame_shape': frame_shape  # (height, width)
     }
     
-    # Process contours to find candidate centers
-    if contours:
-        result['detection_type'] = 'color'
-        for contour in contours:
-            # Calculate area to filter out small noise
-            area = cv2.contourArea(contour)
-            if area < TENNIS_BALL_MIN_CONTOUR_AREA:  # Minimum contour area threshold
-                continue
-                
-            # Calculate center using moments
-            M = cv2.moments(contour)
-            if M["m00"] > 0:
-                cx = int(M["m10"] / M["m00"])
-                cy = int(M["m01"] / M["m00"])
-                
-                # Get bounding circle radius
-                (_, _), radius = cv2.minEnclosingCircle(contour)
-                
-                result['candidate_centers'].append({
-                    'x': cx,
-                    'y': cy,
-                    'area': area,
-                    'radius': radius
-                })
-    
-    # Select best candidate (if any)
-    if result['candidate_centers']:
-        # Sort by area (descending)
-        candidates_sorted = sorted(result['candidate_centers'], key=lambda c: c['area'], reverse=True)
-        result['selected_center'] = candidates_sorted[0]
+    # Skip blob labeling when too few pixels survive to form a ball
+    if cv2.countNonZero(mask) < min_area:
+        return result
+    
+    # Label blobs in one pass; area, bounding box and centroid of every blob
+    # come back as arrays (row 0 is the background)
+    label_count, _, stats, centroids = cv2.connectedComponentsWithStats(
+        mask, labels=_get_labels_buffer(mask.shape), connectivity=8, ltype=cv2.CV_32S)
+    if label_count <= 1:
+        return result
+    result['detection_type'] = 'color'
+    
+    # Filter out small noise blobs
+    stats = stats[1:]
+    centroids = centroids[1:]
+    keep = stats[:, cv2.CC_STAT_AREA] >= min_area
+    stats = stats[keep]
+    centroids = centroids[keep]
+    
+    # Report everything in full-resolution pixel units
+    candidates = candidate_arrays(centroids[:, 0] * scale, centroids[:, 1] * scale,
+                                  stats[:, cv2.CC_STAT_AREA] * (scale * scale))
+    result['candidate_centers'] = candidates
+    
+    # Largest area wins; its radius is half the longer bounding-box side
+    if len(stats):
+        best = int(np.argmax(candidates['area']))
+        selected = candidate_at(candidates, best)
+        half_extent = max(stats[best, cv2.CC_STAT_WIDTH], stats[best, cv2.CC_STAT_HEIGHT]) / 2.0
+        selected['radius'] = float(half_extent * scale)
+        result['selected_center'] = selected
     
     return result
 
@@ -139,17 +309,104 @@ def stereo_correspondence(left_point, right_point, camera_params):
     
     # Optional: Apply rotation and translation if provided
     if 'rotation_matrix' in camera_params and 'translation_vector' in camera_params:
-        point_3d = np.array([x, y, z])
-        R = camera_params['rotation_matrix']
-        T = camera_params['translation_vector']
+        # Unpack rows so a nested list, tuple or 3x3 array all work
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = camera_params['rotation_matrix']
+        tx, ty, tz = camera_params['translation_vector']
         
-        # Transform to world coordinates
-        point_3d = np.matmul(R, point_3d) + T
-        x, y, z = point_3d
+        # Transform to world coordinates (R @ p + T written out for one point)
+        x, y, z = (r00 * x + r01 * y + r02 * z + tx,
+                   r10 * x + r11 * y + r12 * z + ty,
+                   r20 * x + r21 * y + r22 * z + tz)
     
     return (x, y, z)
 
 
+# Batches smaller than this are not worth the parallel kernel launch
+_NUMBA_MIN_BATCH = 256
+
+if njit is not None:
+    # fastmath without 'nnan' so the NaN rows for zero disparity stay well defined
+    @njit(parallel=True, fastmath={'contract', 'arcp', 'reassoc'}, cache=True)
+    def _stereo_batch_numba(left_points, right_points, baseline, focal_length, cx, cy, R, T, out):
+        """Compiled triangulation loop behind stereo_correspondence_batch()"""
+        for i in prange(left_points.shape[0]):
+            disparity = left_points[i, 0] - right_points[i, 0]
+            if disparity == 0.0:
+                out[i, 0] = np.nan
+                out[i, 1] = np.nan
+                out[i, 2] = np.nan
+                continue
+            z = baseline * focal_length / disparity
+            x = (left_points[i, 0] - cx) * z / focal_length
+            y = (left_points[i, 1] - cy) * z / focal_length
+            out[i, 0] = R[0, 0] * x + R[0, 1] * y + R[0, 2] * z + T[0]
+            out[i, 1] = R[1, 0] * x + R[1, 1] * y + R[1, 2] * z + T[1]
+            out[i, 2] = R[2, 0] * x + R[2, 1] * y + R[2, 2] * z + T[2]
+        return out
+else:
+    _stereo_batch_numba = None
+
+
+def stereo_correspondence_batch(left_points, right_points, camera_params):
+    """
+    Calculate 3D coordinates for many stereo correspondences at once.
+    
+    Vectorized counterpart of stereo_correspondence(): all point pairs are
+    triangulated with NumPy array operations and the optional rotation and
+    translation is applied as a single matrix product.
+    
+    Args:
+        left_points: (N, 2) array of (x, y) coordinates in the left image
+        right_points: (N, 2) array of (x, y) coordinates in the right image
+        camera_params: Dictionary with camera parameters (see stereo_correspondence)
+            
+    Returns:
+        (N, 3) float64 array of (x, y, z) world coordinates; rows with zero
+        disparity are NaN
+    """
+    left_points = np.asarray(left_points, dtype=np.float64).reshape(-1, 2)
+    right_points = np.asarray(right_points, dtype=np.float64).reshape(-1, 2)
+    
+    # Extract parameters
+    baseline = camera_params.get('baseline', CAMERA_BASELINE_DEFAULT)
+    focal_length = camera_params.get('focal_length', CAMERA_FOCAL_LENGTH_DEFAULT)
+    cx, cy = camera_params.get('principal_point', CAMERA_PRINCIPAL_POINT_DEFAULT)[:2]
+    has_extrinsics = 'rotation_matrix' in camera_params and 'translation_vector' in camera_params
+    
+    # Large offline batches go through the compiled kernel when Numba is installed
+    if _stereo_batch_numba is not None and left_points.shape[0] >= _NUMBA_MIN_BATCH:
+        if has_extrinsics:
+            R = np.asarray(camera_params['rotation_matrix'], dtype=np.float64)
+            T = np.asarray(camera_params['translation_vector'], dtype=np.float64)
+        else:
+            R = np.eye(3)
+            T = np.zeros(3)
+        out = np.empty((left_points.shape[0], 3), dtype=np.float64)
+        return _stereo_batch_numba(left_points, right_points, float(baseline), float(focal_length),
+                                   float(cx), float(cy), R, T, out)
+    
+    # Calculate disparity and mask out pairs that cannot be triangulated
+    disparity = left_points[:, 0] - right_points[:, 0]
+    valid = disparity != 0
+    safe_disparity = np.where(valid, disparity, 1.0)
+    
+    # Calculate depth (Z) and world X and Y coordinates
+    points_3d = np.empty((left_points.shape[0], 3), dtype=np.float64)
+    z = (baseline * focal_length) / safe_disparity
+    points_3d[:, 0] = (left_points[:, 0] - cx) * z / focal_length
+    points_3d[:, 1] = (left_points[:, 1] - cy) * z / focal_length
+    points_3d[:, 2] = z
+    
+    # Optional: Apply rotation and translation if provided
+    if has_extrinsics:
+        R = np.asarray(camera_params['rotation_matrix'], dtype=np.float64)
+        T = np.asarray(camera_params['translation_vector'], dtype=np.float64)
+        points_3d = points_3d @ R.T + T
+    
+    points_3d[~valid] = np.nan
+    return points_3d
+
+
 def calculate_3d_position(left_detection, right_detection, camera_params=None):
     """
     Calculate 3D position of a tennis ball using stereo correspondence
@@ -197,7 +454,67 @@ def calculate_3d_position(left_detection, right_detection, camera_params=None):
     return result
 
 
-def draw_detection_overlay(frame, detection_result, color=None, thickness=TENNIS_BALL_CIRCLE_THICKNESS):
+def calculate_3d_positions_batch(left_detections, right_detections, camera_params=None):
+    """
+    Calculate 3D positions for a sequence of frame pairs in one vectorized pass
+    
+    Equivalent to calling calculate_3d_position() for each (left, right) pair,
+    but the selected centers of all pairs are triangulated together with
+    stereo_correspondence_batch() and the confidences are computed as arrays.
+    
+    Args:
+        left_detections: Detection results from the left camera, one per frame
+        right_detections: Detection results from the right camera, one per frame
+        camera_params: Camera parameters for stereo calculation
+        
+    Returns:
+        List of 3D position dictionaries, one per frame pair
+    """
+    # Default camera parameters if none provided
+    if camera_params is None:
+        camera_params = {}
+    
+    results = [{'has_position': False, 'position': None, 'confidence': 0.0}
+               for _ in range(min(len(left_detections), len(right_detections)))]
+    
+    # Collect the frame pairs that have a selected center in both cameras
+    indices = []
+    left_points = []
+    right_points = []
+    areas = []
+    for i, (left_detection, right_detection) in enumerate(zip(left_detections, right_detections)):
+        if not (left_detection and right_detection and
+                left_detection.get('selected_center') and right_detection.get('selected_center')):
+            continue
+        left_center = left_detection['selected_center']
+        right_center = right_detection['selected_center']
+        indices.append(i)
+        left_points.append((left_center['x'], left_center['y']))
+        right_points.append((right_center['x'], right_center['y']))
+        areas.append((left_center.get('area', 0), right_center.get('area', 0)))
+    
+    if not indices:
+        return results
+    
+    # Triangulate all pairs at once
+    positions = stereo_correspondence_batch(left_points, right_points, camera_params)
+    valid = ~np.isnan(positions[:, 2])
+    
+    # Simple confidence metric: normalized product of areas
+    areas = np.asarray(areas, dtype=np.float64)
+    confidences = np.minimum(1.0, areas[:, 0] * areas[:, 1] / (TENNIS_BALL_MAX_EXPECTED_AREA ** 2))
+    
+    for row in np.flatnonzero(valid):
+        result = results[indices[row]]
+        result['has_position'] = True
+        result['position'] = tuple(positions[row].tolist())
+        result['confidence'] = float(confidences[row])
+    
+    return results
+
+
+def draw_detection_overlay(frame, detection_result, color=None, thickness=TENNIS_BALL_CIRCLE_THICKNESS,
+                           inplace=False):
     """
     Draw detection overlay on a frame.
     
@@ -206,31 +523,32 @@ def draw_detection_overlay(frame, detection_result, color=None, thickness=TENNIS
         detection_result: Detection result dictionary
         color: BGR color tuple for drawing
         thickness: Line thickness
+        inplace: Draw directly on frame instead of on a copy
         
     Returns:
         Frame with detection overlay
     """
-    # Create a copy of the frame to draw on
-    overlay = frame.copy()
+    # Draw on a copy unless the caller owns the frame buffer
+    overlay = frame if inplace else frame.copy()
     
     # Default color if none provided
     if color is None:
-        color = (DETECTION_GREEN.blue(), DETECTION_GREEN.green(), DETECTION_GREEN.red())
+        color = _GREEN_BGR
     
     # Draw all candidate centers (if any)
-    for candidate in detection_result.get('candidate_centers', []):
-        center = (int(candidate['x']), int(candidate['y']))
+    candidates = detection_result.get('candidate_centers')
+    if candidates is None:
+        candidates = candidate_arrays([], [], [])
+    for center in zip(candidates['x'].tolist(), candidates['y'].tolist()):
         # Draw a small circle for each candidate
-        orange_color = (DETECTION_ORANGE.blue(), DETECTION_ORANGE.green(), DETECTION_ORANGE.red())  # OpenCV uses BGR
-        cv2.circle(overlay, center, TENNIS_BALL_CENTER_RADIUS, orange_color, -1)  # Orange filled circle
+        cv2.circle(overlay, center, TENNIS_BALL_CENTER_RADIUS, _ORANGE_BGR, -1)  # Orange filled circle
     
     # Draw circle detections from Hough (if any)
     for circle in detection_result.get('circle_detections', []):
         center = (int(circle['x']), int(circle['y']))
         radius = int(circle['radius'])
         # Draw circle outline
-        blue_color = (DETECTION_BLUE.blue(), DETECTION_BLUE.green(), DETECTION_BLUE.red())  # OpenCV uses BGR
-        cv2.circle(overlay, center, radius, blue_color, thickness)  # Blue circle
+        cv2.circle(overlay, center, radius, _BLUE_BGR, thickness)  # Blue circle
     
     # Draw the selected detection (if any)
     selected = detection_result.get('selected_center')
@@ -254,7 +572,8 @@ def draw_detection_overlay(frame, detection_result, color=None, thickness=TENNIS
     return overlay
 
 
-def draw_3d_position(frame, position_3d, color=None, thickness=TENNIS_BALL_CIRCLE_THICKNESS):
+def draw_3d_position(frame, position_3d, color=None, thickness=TENNIS_BALL_CIRCLE_THICKNESS,
+                     inplace=False):
     """
     Draw 3D position information on a frame.
     
@@ -263,6 +582,7 @@ def draw_3d_position(frame, position_3d, color=None, thickness=TENNIS_BALL_CIRCL
         position_3d: (x, y, z) position
         color: BGR color tuple for drawing
         thickness: Line thickness
+        inplace: Draw directly on frame instead of on a copy
         
     Returns:
         Frame with 3D position overlay
@@ -270,8 +590,8 @@ def draw_3d_position(frame, position_3d, color=None, thickness=TENNIS_BALL_CIRCL
     if color is None:
         color = OPENCV_GREEN
         
-    # Create a copy of the frame to draw on
-    overlay = frame.copy()
+    # Draw on a copy unless the caller owns the frame buffer
+    overlay = frame if inplace else frame.copy()
     
     if position_3d:
         x, y, z = position_3d
@@ -279,10 +599,82 @@ def draw_3d_position(frame, position_3d, color=None, thickness=TENNIS_BALL_CIRCL
         # Format position with 2 decimal places
         label = f"3D Position: X={x:.2f}, Y={y:.2f}, Z={z:.2f}"
         
-        # Draw text on the frame
-        cv2.putText(overlay, label, 
-                   (TENNIS_BALL_POSITION_TEXT_X, TENNIS_BALL_POSITION_TEXT_Y), 
-                   cv2.FONT_HERSHEY_SIMPLEX,
-                   TENNIS_BALL_POSITION_FONT_SCALE, color, thickness)
+        # Paste the cached text bitmap; putText only runs when the label changes.
+        # The blend rounds to 8-bit values, so other depths are drawn directly.
+        if overlay.dtype == np.uint8:
+            text_mask, (left, top) = _get_position_text_mask(label, thickness)
+            _paste_text_mask(overlay, text_mask, left, top, color)
+        else:
+            cv2.putText(overlay, label, (TENNIS_BALL_POSITION_TEXT_X, TENNIS_BALL_POSITION_TEXT_Y),
+                        cv2.FONT_HERSHEY_SIMPLEX, TENNIS_BALL_POSITION_FONT_SCALE, color, thickness)
+    
+    return overlay
+
+
+def _get_position_text_mask(label, thickness):
+    """
+    Get the rendered bitmap of a 3D position label, rendering it on a cache miss.
+    
+    Args:
+        label: Text to render
+        thickness: Text stroke thickness
+        
+    Returns:
+        Tuple of (uint8 coverage mask of the text, (left, top) frame
+        position of the mask)
+    """
+    global _position_text_cache
+    
+    key = (label, thickness)
+    cached_key, cached_mask, cached_origin = _position_text_cache
+    if cached_key == key:
+        return cached_mask, cached_origin
+    
+    # Size the mask to the text plus a stroke-wide margin on every side
+    (text_width, text_height), baseline = cv2.getTextSize(
+        label, cv2.FONT_HERSHEY_SIMPLEX, TENNIS_BALL_POSITION_FONT_SCALE, thickness)
+    pad = thickness
+    mask = np.zeros((text_height + baseline + 2 * pad, text_width + 2 * pad), dtype=np.uint8)
+    cv2.putText(mask, label, (pad, pad + text_height), cv2.FONT_HERSHEY_SIMPLEX,
+                TENNIS_BALL_POSITION_FONT_SCALE, 255, thickness)
+    
+    origin = (TENNIS_BALL_POSITION_TEXT_X - pad, TENNIS_BALL_POSITION_TEXT_Y - text_height - pad)
+    _position_text_cache = (key, mask, origin)
+    return mask, origin
+
+
+def _paste_text_mask(image, mask, left, top, color):
+    """
+    Blend a text color into image through a coverage mask, clipped to the image bounds.
+    
+    Args:
+        image: uint8 image to draw on (modified in place); grayscale images use the
+            first color component, as cv2.putText does
+        mask: uint8 text coverage mask
+        left: x position of the mask in the image
+        top: y position of the mask in the image
+        color: BGR color tuple for the text
+    """
+    mask_height, mask_width = mask.shape
+    x0, y0 = max(left, 0), max(top, 0)
+    x1 = min(left + mask_width, image.shape[1])
+    y1 = min(top + mask_height, image.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    
+    # The mask holds glyph coverage (antialiased edges), so blend by it
+    alpha = mask[y0 - top:y1 - top, x0 - left:x1 - left] * (1.0 / 255.0)
+    
+    # Match the color to the image channels like a cv2 Scalar
+    # (missing components are 0, extra ones are ignored)
+    channels = image.shape[2] if image.ndim == 3 else 1
+    value = np.zeros(channels, dtype=np.float64)
+    components = min(len(color), channels)
+    value[:components] = color[:components]
+    if image.ndim == 3:
+        alpha = alpha[..., np.newaxis]
+    else:
+        value = value[0]
     
-    return overlay 
\ No newline at end of file
+    region = image[y0:y1, x0:x1]
+    region[...] = region * (1.0 - alpha) + value * alpha + 0.5 
\ No newline at end of file
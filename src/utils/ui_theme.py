@@ -5,59 +5,94 @@ This module defines the UI theme constants and styles used across the applicatio
 It provides a consistent look and feel for all components.
 """
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
-from typing import Dict, Any
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from PySide6.QtWidgets import QApplication
 from src.constants.ui_constants import (
     # Colors
     PRIMARY_COLOR, PRIMARY_DARK, SECONDARY_COLOR,
     BG_DARK, BG_MEDIUM, BG_LIGHT, BG_HOVER,
-    BORDER_DARK, BORDER_LIGHT, BORDER_FOCUS,
-    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_DISABLED, TEXT_BRIGHT, TEXT_DARK,
-    SUCCESS_COLOR, WARNING_COLOR, ERROR_COLOR, INFO_COLOR,
-    STATUS_IMPLEMENTED_BG, STATUS_COMING_SOON_BG, STATUS_TEXT_COLOR,
+    BORDER_DARK, BORDER_LIGHT,
+    TEXT_PRIMARY, TEXT_DISABLED, TEXT_BRIGHT,
+    ERROR_COLOR,
     GRADIENT_START, GRADIENT_END,
     
     # Sizing
-    PADDING_SMALL, PADDING_MEDIUM, PADDING_LARGE, PADDING_XLARGE,
-    MARGIN_SMALL, MARGIN_MEDIUM, MARGIN_LARGE, MARGIN_XLARGE,
-    BORDER_RADIUS_SMALL, BORDER_RADIUS_MEDIUM, BORDER_RADIUS_LARGE,
-    FONT_SIZE_SMALL, FONT_SIZE_MEDIUM, FONT_SIZE_LARGE, FONT_SIZE_XLARGE,
-    BUTTON_HEIGHT_SMALL, BUTTON_HEIGHT_MEDIUM, BUTTON_HEIGHT_LARGE
+    PADDING_SMALL, PADDING_MEDIUM, PADDING_LARGE,
+    MARGIN_MEDIUM,
+    BORDER_RADIUS_SMALL, BORDER_RADIUS_MEDIUM,
+    FONT_SIZE_MEDIUM, FONT_SIZE_LARGE, FONT_SIZE_XLARGE
 )
 
+# Theme color tokens (hex names and RGB components), formatted once for use
+# in style sheets
+_PRIMARY_COLOR = PRIMARY_COLOR.name()
+_PRIMARY_DARK = PRIMARY_DARK.name()
+_SECONDARY_COLOR = SECONDARY_COLOR.name()
+_BG_DARK = BG_DARK.name()
+_BG_MEDIUM = BG_MEDIUM.name()
+_BG_LIGHT = BG_LIGHT.name()
+_BG_HOVER = BG_HOVER.name()
+_BORDER_DARK = BORDER_DARK.name()
+_BORDER_DARK_RGBA_HALF = f"rgba({BORDER_DARK.red()}, {BORDER_DARK.green()}, {BORDER_DARK.blue()}, 0.5)"
+_BORDER_LIGHT = BORDER_LIGHT.name()
+_TEXT_PRIMARY = TEXT_PRIMARY.name()
+_TEXT_DISABLED = TEXT_DISABLED.name()
+_TEXT_BRIGHT = TEXT_BRIGHT.name()
+_ERROR_COLOR = ERROR_COLOR.name()
+_ERROR_RGB = f"{ERROR_COLOR.red()}, {ERROR_COLOR.green()}, {ERROR_COLOR.blue()}"
+_ERROR_TINT_LIGHT = f"rgba({_ERROR_RGB}, 0.1)"
+_ERROR_TINT_MEDIUM = f"rgba({_ERROR_RGB}, 0.2)"
+_ERROR_TINT_STRONG = f"rgba({_ERROR_RGB}, 0.3)"
+_GRADIENT_START = GRADIENT_START.name()
+_GRADIENT_END = GRADIENT_END.name()
+
+def _scoped(style: str, selector: str, scoped_selector: str) -> str:
+    """
+    Return a style with every occurrence of a widget selector narrowed
+    
+    Args:
+        style: Style sheet written for the plain widget selector
+        selector: Widget selector to replace, e.g. "QPushButton"
+        scoped_selector: Selector to use instead, e.g. 'QPushButton[primary="true"]'
+    """
+    return style.replace(selector, scoped_selector)
+
 # =============================================================================
 # WIDGET STYLE FUNCTIONS
 # =============================================================================
 
-def get_application_style() -> str:
-    """Return the global application style"""
-    return f"""
+# Style sheets are built once at import; the theme colors never change at
+# runtime, so each getter returns the same prebuilt string
+
+# Shared by the application style and get_label_style()
+_PLAIN_LABEL_STYLE = f"""
+            QLabel {{
+                color: {_TEXT_PRIMARY};
+                background-color: transparent;
+                border: none;
+            }}
+        """
+
+_APPLICATION_STYLE = f"""
         QWidget {{
-            background-color: {BG_DARK.name()};
-            color: {TEXT_PRIMARY.name()};
+            background-color: {_BG_DARK};
+            color: {_TEXT_PRIMARY};
             font-size: {FONT_SIZE_MEDIUM}px;
         }}
-        QLabel {{
-            background-color: transparent;
-            color: {TEXT_PRIMARY.name()};
-            border: none;
-        }}
-    """
+    """ + _PLAIN_LABEL_STYLE
 
-def get_group_box_style(is_title_centered: bool = False) -> str:
-    """
-    Return the style for QGroupBox widgets
-    
-    Args:
-        is_title_centered: Whether the title should be centered
-    """
-    title_position = "top center" if is_title_centered else "top left"
-    
-    return f"""
+def get_application_style() -> str:
+    """Return the global application style"""
+    return _APPLICATION_STYLE
+
+# Indexed by is_title_centered
+_GROUP_BOX_STYLES = tuple(f"""
         QGroupBox {{
             font-weight: bold;
-            border: 1px solid {BORDER_DARK.name()};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_MEDIUM}px;
             margin-top: 12px;
             padding-top: 12px;
@@ -67,137 +102,170 @@ def get_group_box_style(is_title_centered: bool = False) -> str:
             subcontrol-origin: margin;
             subcontrol-position: {title_position};
             padding: 0 10px;
-            color: {PRIMARY_COLOR.name()};
+            color: {_PRIMARY_COLOR};
             font-size: {FONT_SIZE_LARGE}px;
         }}
     """
+    for title_position in ("top left", "top center"))
 
-def get_label_style(is_description: bool = False) -> str:
+def get_group_box_style(is_title_centered: bool = False) -> str:
     """
-    Return the style for QLabel widgets
+    Return the style for QGroupBox widgets
     
     Args:
-        is_description: Whether this is a description label with different styling
+        is_title_centered: Whether the title should be centered
     """
-    if is_description:
-        return f"""
+    return _GROUP_BOX_STYLES[bool(is_title_centered)]
+
+_DESCRIPTION_LABEL_STYLE = f"""
             QLabel {{
                 padding: {PADDING_LARGE}px;
                 background-color: rgba(45, 45, 45, 0.1);
                 border-radius: {BORDER_RADIUS_MEDIUM}px;
-                color: {TEXT_PRIMARY.name()};
+                color: {_TEXT_PRIMARY};
                 font-size: {FONT_SIZE_MEDIUM}px;
                 border: none;
             }}
         """
-    else:
-        return f"""
+
+# Description look for the larger centered hint shown before images load
+_INSTRUCTION_LABEL_STYLE = f"""
             QLabel {{
-                color: {TEXT_PRIMARY.name()};
-                background-color: transparent;
+                padding: 10px;
+                margin: 10px;
+                background-color: rgba(45, 45, 45, 0.1);
+                border-radius: {BORDER_RADIUS_MEDIUM}px;
+                color: {_TEXT_PRIMARY};
+                font-size: 14px;
                 border: none;
             }}
         """
 
-def get_form_input_label_style() -> str:
-    """Return the style for form input labels"""
-    return f"""
-        QLabel {{
-            color: {TEXT_PRIMARY.name()};
-            margin-right: {MARGIN_MEDIUM}px;
-        }}
-    """
+# Small frame-rate readout under each camera view
+_FPS_LABEL_STYLE = f"color: {_TEXT_PRIMARY}; font-size: 12px; padding: 5px;"
 
-def get_button_style(is_primary: bool = False, is_destructive: bool = False) -> str:
+# Indexed by is_description
+_LABEL_STYLES = (_PLAIN_LABEL_STYLE, _DESCRIPTION_LABEL_STYLE)
+
+def get_label_style(is_description: bool = False) -> str:
     """
-    Return the style for QPushButton widgets
+    Return the style for QLabel widgets
     
     Args:
-        is_primary: Whether this is a primary action button
-        is_destructive: Whether this is a destructive action button
+        is_description: Whether this is a description label with different styling
     """
-    if is_primary:
-        return f"""
+    return _LABEL_STYLES[bool(is_description)]
+
+_FORM_INPUT_LABEL_STYLE = f"""
+        QLabel {{
+            color: {_TEXT_PRIMARY};
+            margin-right: {MARGIN_MEDIUM}px;
+        }}
+    """
+
+def get_form_input_label_style() -> str:
+    """Return the style for form input labels"""
+    return _FORM_INPUT_LABEL_STYLE
+
+_PRIMARY_BUTTON_STYLE = f"""
             QPushButton {{
-                background-color: {PRIMARY_DARK.name()};
-                color: {TEXT_BRIGHT.name()};
-                border: 1px solid {PRIMARY_COLOR.name()};
+                background-color: {_PRIMARY_DARK};
+                color: {_TEXT_BRIGHT};
+                border: 1px solid {_PRIMARY_COLOR};
                 border-radius: {BORDER_RADIUS_SMALL}px;
                 padding: {PADDING_MEDIUM}px {PADDING_LARGE}px;
                 font-weight: bold;
             }}
             QPushButton:hover {{
-                background-color: {PRIMARY_COLOR.name()};
-                border: 1px solid {PRIMARY_DARK.name()};
+                background-color: {_PRIMARY_COLOR};
+                border: 1px solid {_PRIMARY_DARK};
             }}
             QPushButton:pressed {{
-                background-color: {SECONDARY_COLOR.name()};
-                color: {BG_DARK.name()};
+                background-color: {_SECONDARY_COLOR};
+                color: {_BG_DARK};
             }}
             QPushButton:disabled {{
-                background-color: {BG_MEDIUM.name()};
-                color: {TEXT_DISABLED.name()};
-                border: 1px solid {BORDER_DARK.name()};
+                background-color: {_BG_MEDIUM};
+                color: {_TEXT_DISABLED};
+                border: 1px solid {_BORDER_DARK};
             }}
         """
-    elif is_destructive:
-        return f"""
+
+_DESTRUCTIVE_BUTTON_STYLE = f"""
             QPushButton {{
-                background-color: rgba(244, 67, 54, 0.1);
-                color: {ERROR_COLOR.name()};
-                border: 1px solid {ERROR_COLOR.name()};
+                background-color: {_ERROR_TINT_LIGHT};
+                color: {_ERROR_COLOR};
+                border: 1px solid {_ERROR_COLOR};
                 border-radius: {BORDER_RADIUS_SMALL}px;
                 padding: {PADDING_MEDIUM}px {PADDING_LARGE}px;
                 font-weight: bold;
             }}
             QPushButton:hover {{
-                background-color: rgba(244, 67, 54, 0.2);
+                background-color: {_ERROR_TINT_MEDIUM};
             }}
             QPushButton:pressed {{
-                background-color: rgba(244, 67, 54, 0.3);
+                background-color: {_ERROR_TINT_STRONG};
             }}
         """
-    else:
-        return f"""
+
+_DEFAULT_BUTTON_STYLE = f"""
             QPushButton {{
-                background-color: {BG_LIGHT.name()};
-                color: {TEXT_PRIMARY.name()};
-                border: 1px solid {BORDER_DARK.name()};
+                background-color: {_BG_LIGHT};
+                color: {_TEXT_PRIMARY};
+                border: 1px solid {_BORDER_DARK};
                 border-radius: {BORDER_RADIUS_SMALL}px;
                 padding: {PADDING_MEDIUM}px {PADDING_LARGE}px;
             }}
             QPushButton:hover {{
-                background-color: {BG_HOVER.name()};
-                border: 1px solid {BORDER_LIGHT.name()};
+                background-color: {_BG_HOVER};
+                border: 1px solid {_BORDER_LIGHT};
             }}
             QPushButton:pressed {{
-                background-color: {PRIMARY_COLOR.name()};
-                color: {TEXT_BRIGHT.name()};
+                background-color: {_PRIMARY_COLOR};
+                color: {_TEXT_BRIGHT};
             }}
         """
 
-def get_checkbox_style() -> str:
-    """Return the style for QCheckBox widgets"""
-    return f"""
+# Keyed by (is_primary, is_destructive); primary wins when both are set
+_BUTTON_STYLES = MappingProxyType({
+    (False, False): _DEFAULT_BUTTON_STYLE,
+    (False, True): _DESTRUCTIVE_BUTTON_STYLE,
+    (True, False): _PRIMARY_BUTTON_STYLE,
+    (True, True): _PRIMARY_BUTTON_STYLE,
+})
+
+def get_button_style(is_primary: bool = False, is_destructive: bool = False) -> str:
+    """
+    Return the style for QPushButton widgets
+    
+    Args:
+        is_primary: Whether this is a primary action button
+        is_destructive: Whether this is a destructive action button
+    """
+    return _BUTTON_STYLES[bool(is_primary), bool(is_destructive)]
+
+_CHECKBOX_STYLE = f"""
         QCheckBox {{
-            color: {TEXT_PRIMARY.name()};
+            color: {_TEXT_PRIMARY};
         }}
         QCheckBox::indicator {{
             width: 16px;
             height: 16px;
         }}
         QCheckBox::indicator:checked {{
-            background-color: {PRIMARY_COLOR.name()};
-            border: 2px solid {TEXT_PRIMARY.name()};
+            background-color: {_PRIMARY_COLOR};
+            border: 2px solid {_TEXT_PRIMARY};
         }}
     """
 
-def get_slider_style() -> str:
-    """Return the style for QSlider widgets"""
-    return f"""
+def get_checkbox_style() -> str:
+    """Return the style for QCheckBox widgets"""
+    return _CHECKBOX_STYLE
+
+_SLIDER_STYLE = f"""
         QSlider::handle:horizontal {{
-            background: {PRIMARY_COLOR.name()};
-            border: 1px solid {BG_HOVER.name()};
+            background: {_PRIMARY_COLOR};
+            border: 1px solid {_BG_HOVER};
             width: 18px;
             margin: -2px 0;
             border-radius: 9px;
@@ -205,53 +273,55 @@ def get_slider_style() -> str:
         QSlider::groove:horizontal {{
             border: 1px solid #999999;
             height: 8px;
-            background: {BG_LIGHT.name()};
+            background: {_BG_LIGHT};
             margin: 2px 0;
             border-radius: 4px;
         }}
         QSlider::sub-page:horizontal {{
             background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                stop: 0 {GRADIENT_START.name()}, stop: 1 {GRADIENT_END.name()});
+                stop: 0 {_GRADIENT_START}, stop: 1 {_GRADIENT_END});
             border: 1px solid #777;
             height: 10px;
             border-radius: 4px;
         }}
     """
 
-def get_spinbox_style() -> str:
-    """Return the style for QSpinBox widgets"""
-    return f"""
+def get_slider_style() -> str:
+    """Return the style for QSlider widgets"""
+    return _SLIDER_STYLE
+
+_SPINBOX_STYLE = f"""
         QSpinBox {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_SMALL}px;
             padding: {PADDING_SMALL}px;
         }}
         QSpinBox::up-button, QSpinBox::down-button {{
-            background-color: {BG_MEDIUM.name()};
+            background-color: {_BG_MEDIUM};
             width: 16px;
-            border: 1px solid {BORDER_DARK.name()};
+            border: 1px solid {_BORDER_DARK};
         }}
         QSpinBox::up-arrow {{
-            image: url(../resources/images/up_arrow.png);
             width: 10px;
             height: 10px;
         }}
         QSpinBox::down-arrow {{
-            image: url(../resources/images/down_arrow.png);
             width: 10px;
             height: 10px;
         }}
     """
 
-def get_combobox_style() -> str:
-    """Return the style for QComboBox widgets"""
-    return f"""
+def get_spinbox_style() -> str:
+    """Return the style for QSpinBox widgets"""
+    return _SPINBOX_STYLE
+
+_COMBOBOX_STYLE = f"""
         QComboBox {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_SMALL}px;
             padding: {PADDING_SMALL}px;
             min-width: 200px;
@@ -260,224 +330,226 @@ def get_combobox_style() -> str:
             subcontrol-origin: padding;
             subcontrol-position: top right;
             width: 20px;
-            border-left: 1px solid {BORDER_DARK.name()};
+            border-left: 1px solid {_BORDER_DARK};
         }}
         QComboBox::down-arrow {{
-            image: url(src/resources/icons/down-arrow.png);
             width: 12px;
             height: 12px;
         }}
         QComboBox QAbstractItemView {{
-            background-color: {BG_MEDIUM.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
-            selection-background-color: {PRIMARY_DARK.name()};
+            background-color: {_BG_MEDIUM};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
+            selection-background-color: {_PRIMARY_DARK};
         }}
     """
 
-def get_line_edit_style() -> str:
-    """Return the style for QLineEdit widgets"""
-    return f"""
+def get_combobox_style() -> str:
+    """Return the style for QComboBox widgets"""
+    return _COMBOBOX_STYLE
+
+_LINE_EDIT_STYLE = f"""
         QLineEdit {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_SMALL}px;
             padding: {PADDING_SMALL}px;
         }}
         QLineEdit:focus {{
-            border: 1px solid {PRIMARY_COLOR.name()};
+            border: 1px solid {_PRIMARY_COLOR};
         }}
     """
 
+def get_line_edit_style() -> str:
+    """Return the style for QLineEdit widgets"""
+    return _LINE_EDIT_STYLE
+
+# Text edits share the line edit box rules
+_TEXT_EDIT_STYLE = _scoped(_LINE_EDIT_STYLE, "QLineEdit", "QTextEdit")
+
 def get_text_edit_style() -> str:
     """Return the style for QTextEdit widgets"""
-    return f"""
-        QTextEdit {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
-            border-radius: {BORDER_RADIUS_SMALL}px;
-            padding: {PADDING_SMALL}px;
-        }}
-        QTextEdit:focus {{
-            border: 1px solid {PRIMARY_COLOR.name()};
-        }}
-    """
+    return _TEXT_EDIT_STYLE
 
-def get_dialog_style() -> str:
-    """Return the style for QDialog widgets"""
-    return f"""
+_DIALOG_STYLE = f"""
         QDialog {{
-            background-color: {BG_DARK.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_DARK};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_MEDIUM}px;
         }}
     """
 
-def get_dialog_background_style() -> str:
-    """Return the background style for QDialog widgets"""
-    return f"background-color: {BG_DARK.name()}; color: {TEXT_PRIMARY.name()};"
+def get_dialog_style() -> str:
+    """Return the style for QDialog widgets"""
+    return _DIALOG_STYLE
 
-def get_status_background_color(is_implemented: bool) -> QColor:
-    """
-    Return the background color for status indicators
-    
-    Args:
-        is_implemented: Whether the feature is implemented
-    """
-    return STATUS_IMPLEMENTED_BG if is_implemented else STATUS_COMING_SOON_BG
+_DIALOG_BACKGROUND_STYLE = f"background-color: {_BG_DARK}; color: {_TEXT_PRIMARY};"
 
-def get_status_text_color() -> QColor:
-    """Return the text color for status indicators"""
-    return STATUS_TEXT_COLOR
+def get_dialog_background_style() -> str:
+    """Return the background style for QDialog widgets"""
+    return _DIALOG_BACKGROUND_STYLE
 
-def get_separator_style() -> str:
-    """Return the style for separator QFrame widgets"""
-    return f"""
+_SEPARATOR_STYLE = f"""
         QFrame[frameShape="4"], QFrame[frameShape="5"] {{
-            background-color: {BORDER_DARK.name()};
+            background-color: {_BORDER_DARK};
             height: 1px;
             border: none;
         }}
         QFrame[frameShape="5"] {{
-            background-color: {BORDER_DARK.name()};
+            background-color: {_BORDER_DARK};
             width: 1px;
             height: auto;
         }}
     """
 
-def get_message_box_style() -> str:
-    """Return the style for QMessageBox widgets"""
-    return f"""
+def get_separator_style() -> str:
+    """Return the style for separator QFrame widgets"""
+    return _SEPARATOR_STYLE
+
+_MESSAGE_BOX_STYLE = f"""
         QMessageBox {{
-            background-color: {BG_MEDIUM.name()};
-            color: {TEXT_PRIMARY.name()};
+            background-color: {_BG_MEDIUM};
+            color: {_TEXT_PRIMARY};
         }}
         QMessageBox QLabel {{
-            color: {TEXT_PRIMARY.name()};
+            color: {_TEXT_PRIMARY};
         }}
         QMessageBox QPushButton {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_SMALL}px;
             padding: {PADDING_MEDIUM}px {PADDING_LARGE}px;
         }}
         QMessageBox QPushButton:hover {{
-            background-color: {BG_HOVER.name()};
-            border: 1px solid {BORDER_LIGHT.name()};
+            background-color: {_BG_HOVER};
+            border: 1px solid {_BORDER_LIGHT};
         }}
     """
 
-def get_tab_widget_style() -> str:
-    """Return the style for QTabWidget widgets"""
-    return f"""
+def get_message_box_style() -> str:
+    """Return the style for QMessageBox widgets"""
+    return _MESSAGE_BOX_STYLE
+
+_TAB_WIDGET_STYLE = f"""
         QTabWidget::pane {{
-            border: 1px solid {BORDER_DARK.name()};
-            background-color: {BG_DARK.name()};
+            border: 1px solid {_BORDER_DARK};
+            background-color: {_BG_DARK};
             top: -1px;
         }}
         QTabBar::tab {{
-            background-color: {BG_MEDIUM.name()};
-            color: {TEXT_PRIMARY.name()};
+            background-color: {_BG_MEDIUM};
+            color: {_TEXT_PRIMARY};
             padding: {PADDING_MEDIUM}px {PADDING_LARGE}px;
             margin-right: 2px;
             border-top-left-radius: {BORDER_RADIUS_SMALL}px;
             border-top-right-radius: {BORDER_RADIUS_SMALL}px;
         }}
         QTabBar::tab:selected {{
-            background-color: {PRIMARY_DARK.name()};
-            color: {TEXT_BRIGHT.name()};
+            background-color: {_PRIMARY_DARK};
+            color: {_TEXT_BRIGHT};
         }}
         QTabBar::tab:hover {{
-            background-color: {BG_HOVER.name()};
+            background-color: {_BG_HOVER};
         }}
     """
 
-def get_scroll_bar_style() -> str:
-    """Return the style for QScrollBar widgets"""
-    return f"""
+def get_tab_widget_style() -> str:
+    """Return the style for QTabWidget widgets"""
+    return _TAB_WIDGET_STYLE
+
+_SCROLL_BAR_STYLE = f"""
         QScrollBar:vertical {{
             border: none;
-            background-color: {BG_MEDIUM.name()};
+            background-color: {_BG_MEDIUM};
             width: 10px;
             margin: 0px;
         }}
         QScrollBar::handle:vertical {{
-            background-color: {PRIMARY_DARK.name()};
+            background-color: {_PRIMARY_DARK};
             min-height: 30px;
             border-radius: 5px;
         }}
         QScrollBar::handle:vertical:hover {{
-            background-color: {PRIMARY_COLOR.name()};
+            background-color: {_PRIMARY_COLOR};
         }}
         QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
             height: 0px;
         }}
         QScrollBar:horizontal {{
             border: none;
-            background-color: {BG_MEDIUM.name()};
+            background-color: {_BG_MEDIUM};
             height: 10px;
             margin: 0px;
         }}
         QScrollBar::handle:horizontal {{
-            background-color: {PRIMARY_DARK.name()};
+            background-color: {_PRIMARY_DARK};
             min-width: 30px;
             border-radius: 5px;
         }}
         QScrollBar::handle:horizontal:hover {{
-            background-color: {PRIMARY_COLOR.name()};
+            background-color: {_PRIMARY_COLOR};
         }}
         QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
             width: 0px;
         }}
     """
 
-def get_progress_bar_style() -> str:
-    """Return the style for QProgressBar widgets"""
-    return f"""
+def get_scroll_bar_style() -> str:
+    """Return the style for QScrollBar widgets"""
+    return _SCROLL_BAR_STYLE
+
+_PROGRESS_BAR_STYLE = f"""
         QProgressBar {{
-            border: 1px solid {BORDER_DARK.name()};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_SMALL}px;
             text-align: center;
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_PRIMARY};
         }}
         QProgressBar::chunk {{
             background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                stop: 0 {GRADIENT_START.name()}, stop: 1 {GRADIENT_END.name()});
+                stop: 0 {_GRADIENT_START}, stop: 1 {_GRADIENT_END});
             border-radius: {BORDER_RADIUS_SMALL}px;
         }}
     """
 
-def get_table_style() -> str:
-    """Return the style for QTableWidget widgets"""
-    return f"""
+def get_progress_bar_style() -> str:
+    """Return the style for QProgressBar widgets"""
+    return _PROGRESS_BAR_STYLE
+
+_TABLE_STYLE = f"""
         QTableWidget {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             border-radius: {BORDER_RADIUS_SMALL}px;
-            gridline-color: rgba({BORDER_DARK.red()}, {BORDER_DARK.green()}, {BORDER_DARK.blue()}, 0.5);
+            gridline-color: {_BORDER_DARK_RGBA_HALF};
         }}
         QTableWidget::item {{
             padding: 5px;
         }}
         QTableWidget::item:selected {{
-            background-color: {PRIMARY_DARK.name()};
-            color: {TEXT_BRIGHT.name()};
+            background-color: {_PRIMARY_DARK};
+            color: {_TEXT_BRIGHT};
         }}
         QHeaderView::section {{
-            background-color: {BG_MEDIUM.name()};
-            color: {TEXT_PRIMARY.name()};
+            background-color: {_BG_MEDIUM};
+            color: {_TEXT_PRIMARY};
             padding: 5px;
-            border: 1px solid {BORDER_DARK.name()};
+            border: 1px solid {_BORDER_DARK};
             font-weight: bold;
         }}
     """
 
+def get_table_style() -> str:
+    """Return the style for QTableWidget widgets"""
+    return _TABLE_STYLE
+
+# Callers reuse a handful of palettes, so each one is formatted only once
+@lru_cache(maxsize=64)
 def get_colored_button_style(bg_color: str, border_color: str, hover_bg_color: str, hover_border_color: str, pressed_bg_color: str) -> str:
     """
     Return a custom colored style for QPushButton widgets
@@ -508,45 +580,46 @@ def get_colored_button_style(bg_color: str, border_color: str, hover_bg_color: s
         }}
     """
 
-def get_camera_image_style() -> str:
-    """Return the style for camera image QLabel widgets with transparent background"""
-    return f"""
+_CAMERA_IMAGE_STYLE = f"""
 QLabel {{
     background-color: rgba(0, 0, 0, 50);
-    border: 1px solid {BORDER_DARK.name()};
+    border: 1px solid {_BORDER_DARK};
 }}
     """
 
-def get_image_label_style() -> str:
-    """Return the style for image label with border"""
-    return f"""
+def get_camera_image_style() -> str:
+    """Return the style for camera image QLabel widgets with transparent background"""
+    return _CAMERA_IMAGE_STYLE
+
+_IMAGE_LABEL_STYLE = f"""
 QLabel {{
-    border: 1px solid {BORDER_DARK.name()};
+    border: 1px solid {_BORDER_DARK};
     background-color: rgba(30, 30, 30, 50);
 }}
     """
+
+def get_image_label_style() -> str:
+    """Return the style for image label with border"""
+    return _IMAGE_LABEL_STYLE
     
-def get_active_image_label_style() -> str:
-    """Return the style for active image label with highlighted border"""
-    return f"""
+_ACTIVE_IMAGE_LABEL_STYLE = f"""
 QLabel {{
-    border: 2px solid {PRIMARY_COLOR.name()};
+    border: 2px solid {_PRIMARY_COLOR};
     background-color: rgba(30, 30, 30, 50);
 }}
     """
+
+def get_active_image_label_style() -> str:
+    """Return the style for active image label with highlighted border"""
+    return _ACTIVE_IMAGE_LABEL_STYLE
     
+_INACTIVE_IMAGE_LABEL_STYLE = _IMAGE_LABEL_STYLE
+
 def get_inactive_image_label_style() -> str:
     """Return the style for inactive image label with regular border"""
-    return f"""
-QLabel {{
-    border: 1px solid {BORDER_DARK.name()};
-    background-color: rgba(30, 30, 30, 50);
-}}
-    """
+    return _INACTIVE_IMAGE_LABEL_STYLE
 
-def get_player_button_style() -> str:
-    """Return the style for player control buttons with semi-transparent background"""
-    return """
+_PLAYER_BUTTON_STYLE = """
         QPushButton {
             background-color: rgba(51, 51, 51, 0.3);
             color: white;
@@ -576,9 +649,11 @@ def get_player_button_style() -> str:
         }
     """
 
-def get_speed_button_style() -> str:
-    """Return the style for speed preset buttons with semi-transparent background"""
-    return """
+def get_player_button_style() -> str:
+    """Return the style for player control buttons with semi-transparent background"""
+    return _PLAYER_BUTTON_STYLE
+
+_SPEED_BUTTON_STYLE = """
         QPushButton {
             background-color: rgba(51, 51, 51, 0.3);
             color: white;
@@ -598,9 +673,11 @@ def get_speed_button_style() -> str:
         }
     """
 
-def get_player_slider_style() -> str:
-    """Return the style for player time slider with semi-transparent appearance"""
-    return """
+def get_speed_button_style() -> str:
+    """Return the style for speed preset buttons with semi-transparent background"""
+    return _SPEED_BUTTON_STYLE
+
+_PLAYER_SLIDER_STYLE = """
         QSlider::groove:horizontal {
             background: rgba(51, 51, 51, 0.3);
             height: 8px;
@@ -614,45 +691,66 @@ def get_player_slider_style() -> str:
         }
     """
 
-def get_status_label_style(status: str) -> str:
-    """
-    Return the style for status label based on completion status
-    
-    Args:
-        status: Status string ('complete', 'progress', or 'start')
-    """
-    if status == "complete":
-        return """
+def get_player_slider_style() -> str:
+    """Return the style for player time slider with semi-transparent appearance"""
+    return _PLAYER_SLIDER_STYLE
+
+_STATUS_LABEL_STYLES = MappingProxyType({
+    "complete": """
             QLabel {
                 font-weight: bold;
                 color: green;
             }
-        """
-    elif status == "progress":
-        return """
+        """,
+    "progress": """
             QLabel {
                 font-weight: bold;
                 color: orange;
             }
-        """
-    else:  # start
-        return """
+        """,
+    "start": """
             QLabel {
                 font-weight: bold;
                 color: black;
             }
-        """
+        """,
+})
+
+# Unknown statuses fall back to the "start" style
+_DEFAULT_STATUS_LABEL_STYLE = _STATUS_LABEL_STYLES["start"]
+
+def get_status_label_style(status: str) -> str:
+    """
+    Return the style for status label based on completion status
+    
+    Args:
+        status: Status string ('complete', 'progress', or 'start')
+    """
+    return _STATUS_LABEL_STYLES.get(status, _DEFAULT_STATUS_LABEL_STYLE)
+
+_BALL_STATUS_STYLE_BASE = "font-size: 14pt; font-weight: bold; color: white; padding: 5px; border-radius: 3px;"
+
+# Ball status label declarations, keyed by the label's ballStatus property
+_BALL_STATUS_STYLES = MappingProxyType({
+    "notDetected": f"{_BALL_STATUS_STYLE_BASE} background-color: #444;",
+    "inBounds": f"{_BALL_STATUS_STYLE_BASE} background-color: #006400;",
+    "outOfBounds": f"{_BALL_STATUS_STYLE_BASE} background-color: #8B0000;",
+    "bounce": f"{_BALL_STATUS_STYLE_BASE} color: black; background-color: #FFD700;",
+    "inService": f"{_BALL_STATUS_STYLE_BASE} background-color: #228B22;",
+    "fault": f"{_BALL_STATUS_STYLE_BASE} background-color: #B22222;",
+})
+
+# Public so callers can use the constant directly
+DISABLED_BUTTON_STYLE = "color: #888888;"
 
 def get_disabled_button_style() -> str:
-    """Return the style for disabled buttons"""
-    return "color: #888888;"
+    """Return the style for disabled buttons (kept for existing callers)"""
+    return DISABLED_BUTTON_STYLE
 
-def get_menu_style() -> str:
-    """Return the style for QMenu widgets"""
-    return f"""
+_MENU_STYLE = f"""
         QMenuBar {{
-            background-color: {BG_DARK.name()};
-            color: {TEXT_PRIMARY.name()};
+            background-color: {_BG_DARK};
+            color: {_TEXT_PRIMARY};
             padding: 2px;
             spacing: 3px;
         }}
@@ -664,18 +762,18 @@ def get_menu_style() -> str:
         }}
         
         QMenuBar::item:selected {{
-            background-color: {BG_MEDIUM.name()};
+            background-color: {_BG_MEDIUM};
         }}
         
         QMenuBar::item:pressed {{
-            background-color: {BG_LIGHT.name()};
-            color: {TEXT_BRIGHT.name()};
+            background-color: {_BG_LIGHT};
+            color: {_TEXT_BRIGHT};
         }}
         
         QMenu {{
-            background-color: {BG_MEDIUM.name()};
-            color: {TEXT_PRIMARY.name()};
-            border: 1px solid {BORDER_DARK.name()};
+            background-color: {_BG_MEDIUM};
+            color: {_TEXT_PRIMARY};
+            border: 1px solid {_BORDER_DARK};
             padding: 5px;
             opacity: 1.0;
         }}
@@ -683,105 +781,221 @@ def get_menu_style() -> str:
         QMenu::item {{
             padding: 5px 30px 5px 20px;
             border-radius: 2px;
-            background-color: {BG_MEDIUM.name()};
+            background-color: {_BG_MEDIUM};
         }}
         
         QMenu::item:selected {{
-            background-color: {BG_HOVER.name()};
+            background-color: {_BG_HOVER};
         }}
         
         QMenu::separator {{
             height: 1px;
-            background-color: {BORDER_DARK.name()};
+            background-color: {_BORDER_DARK};
             margin: 5px 15px;
         }}
     """
 
-def apply_dark_theme(widget) -> None:
+def get_menu_style() -> str:
+    """Return the style for QMenu widgets"""
+    return _MENU_STYLE
+
+# =============================================================================
+# GLOBAL STYLE SHEET
+# =============================================================================
+
+_MAIN_WINDOW_STYLE = """
+        QMainWindow {
+            background-color: #1e1e1e;
+        }
+    """
+
+# Lets a background image painted by the main window show through containers;
+# it follows the QWidget rule so every widget-specific rule still overrides it
+_TRANSPARENT_BACKGROUND_STYLE = """
+        QWidget {
+            background-color: transparent;
+        }
+    """
+
+@lru_cache(maxsize=None)
+def _global_style_rules() -> tuple:
+    """
+    Return the rule blocks of the global style sheet that follow the base
+    widget rules; both background variants share them
+    """
+    return (
+        _MAIN_WINDOW_STYLE,
+        _MENU_STYLE,
+        _TAB_WIDGET_STYLE,
+        _GROUP_BOX_STYLES[False],
+        _scoped(_GROUP_BOX_STYLES[True], "QGroupBox", 'QGroupBox[titleCentered="true"]'),
+        _scoped(_DESCRIPTION_LABEL_STYLE, "QLabel", 'QLabel[variant="description"]'),
+        _scoped(_FORM_INPUT_LABEL_STYLE, "QLabel", 'QLabel[variant="formInput"]'),
+        _scoped(_INSTRUCTION_LABEL_STYLE, "QLabel", 'QLabel[variant="instruction"]'),
+        f'QLabel[variant="fps"] {{ {_FPS_LABEL_STYLE} }}',
+        *(_scoped(style, "QLabel", f'QLabel[status="{status}"]')
+          for status, style in _STATUS_LABEL_STYLES.items()),
+        _scoped(_INACTIVE_IMAGE_LABEL_STYLE, "QLabel", 'QLabel[imageState="inactive"]'),
+        _scoped(_ACTIVE_IMAGE_LABEL_STYLE, "QLabel", 'QLabel[imageState="active"]'),
+        *(f'QLabel[ballStatus="{status}"] {{ {style} }}'
+          for status, style in _BALL_STATUS_STYLES.items()),
+        _DEFAULT_BUTTON_STYLE,
+        _scoped(_PRIMARY_BUTTON_STYLE, "QPushButton", 'QPushButton[primary="true"]'),
+        _scoped(_DESTRUCTIVE_BUTTON_STYLE, "QPushButton", 'QPushButton[destructive="true"]'),
+        f"QPushButton:disabled {{ {DISABLED_BUTTON_STYLE} }}",
+        _scoped(_PLAYER_BUTTON_STYLE, "QPushButton", 'QPushButton[styleRole="playerButton"]'),
+        _scoped(_SPEED_BUTTON_STYLE, "QPushButton", 'QPushButton[styleRole="speedButton"]'),
+        _scoped(_SLIDER_STYLE, "QSlider", 'QSlider[styleRole="settingsSlider"]'),
+        _scoped(_PLAYER_SLIDER_STYLE, "QSlider", 'QSlider[styleRole="playerSlider"]'),
+        _CHECKBOX_STYLE,
+        _SPINBOX_STYLE,
+        _COMBOBOX_STYLE,
+        _LINE_EDIT_STYLE,
+        _TEXT_EDIT_STYLE,
+        _TABLE_STYLE,
+        _SEPARATOR_STYLE,
+        f"QDialog {{ {_DIALOG_BACKGROUND_STYLE} }}",
+        _MESSAGE_BOX_STYLE,
+    )
+
+@lru_cache(maxsize=None)
+def _build_global_stylesheet(transparent_background: bool) -> str:
+    """
+    Join the global style sheet on first use
+    
+    Widget variants are selected with dynamic properties instead of
+    per-widget style sheets, so the whole theme is parsed once. Packaged
+    builds load the prebuilt file instead, and the transparent variant is
+    only needed with a background image, so neither is joined at import.
+    The result is interned so every caller shares one string object.
+    
+    Args:
+        transparent_background: Whether container backgrounds are transparent
+    """
+    background = (_TRANSPARENT_BACKGROUND_STYLE,) if transparent_background else ()
+    return sys.intern("".join((_APPLICATION_STYLE, *background, *_global_style_rules())))
+
+# Prebuilt style sheets written by src/utils/build_qss.py for packaged builds.
+# THEME_FILES is indexed by transparent_background.
+THEME_DIR = os.path.join("src", "resources", "themes")
+THEME_FILES = ("dark.qss", "dark_transparent.qss")
+
+# Prebuilt style sheets already read from disk, keyed by transparent_background
+_prebuilt_stylesheets = {}
+
+def _load_prebuilt_stylesheet(transparent_background: bool) -> str:
+    """
+    Read a prebuilt style sheet once, falling back to the one built in Python
+    
+    Args:
+        transparent_background: Whether container backgrounds are transparent
+    """
+    stylesheet = _prebuilt_stylesheets.get(transparent_background)
+    if stylesheet is not None:
+        return stylesheet
+    
+    # One-file builds unpack their data files into sys._MEIPASS rather than
+    # the working directory
+    base_dir = getattr(sys, '_MEIPASS', os.getcwd())
+    path = os.path.join(base_dir, THEME_DIR, THEME_FILES[transparent_background])
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            stylesheet = sys.intern(file.read())
+    except OSError:
+        stylesheet = _build_global_stylesheet(transparent_background)
+    
+    _prebuilt_stylesheets[transparent_background] = stylesheet
+    return stylesheet
+
+def get_global_stylesheet(transparent_background: bool = False) -> str:
+    """
+    Return the application-wide style sheet
+    
+    Packaged builds read the .qss files generated at build time; during
+    development the sheet built from the theme constants is used so edits
+    take effect without regenerating anything.
+    
+    Args:
+        transparent_background: Whether container backgrounds are transparent
+    """
+    transparent_background = bool(transparent_background)
+    if getattr(sys, 'frozen', False):
+        return _load_prebuilt_stylesheet(transparent_background)
+    
+    return _build_global_stylesheet(transparent_background)
+
+def set_style_property(widget, name: str, value) -> None:
+    """
+    Set a dynamic property used by the global style sheet at runtime
+    
+    Qt does not re-evaluate property selectors on its own, so the widget
+    is re-polished when the value changes.
+    
+    Args:
+        widget: The widget to update
+        name: Property name, e.g. "status"
+        value: New property value
     """
-    Apply the dark theme to the given widget
+    if widget.property(name) == value:
+        return
+    
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+def apply_dark_theme(widget, transparent_background: bool = False) -> None:
+    """
+    Apply the dark theme application-wide
     
     Args:
-        widget: The widget to apply the theme to
+        widget: The widget to apply the theme to if no QApplication exists
+        transparent_background: Whether container backgrounds are transparent
+    """
+    stylesheet = get_global_stylesheet(transparent_background)
+    target = QApplication.instance()
+    if target is None:
+        target = widget
+    
+    # Setting a style sheet re-parses it and re-polishes every widget, even
+    # when the text is unchanged
+    if target.styleSheet() == stylesheet:
+        return
+    
+    target.setStyleSheet(stylesheet)
+
+_BACKGROUND_STYLE = f"""
+        background-color: {_BG_DARK};
+        color: {_TEXT_PRIMARY};
     """
-    # Base application style
-    widget.setStyleSheet(get_application_style()) 
 
 def get_background_style() -> str:
     """Return the style for background appearance"""
-    return f"""
-        background-color: {BG_DARK.name()};
-        color: {TEXT_PRIMARY.name()};
-    """
+    return _BACKGROUND_STYLE
 
-def get_app_title_style() -> str:
-    """Return the style for application title"""
-    return f"""
+_APP_TITLE_STYLE = f"""
         font-size: {FONT_SIZE_XLARGE}px;
         font-weight: bold;
-        color: {PRIMARY_COLOR.name()};
+        color: {_PRIMARY_COLOR};
         background-color: transparent;
         padding: {PADDING_MEDIUM}px;
     """
 
-def get_scrollbar_style() -> str:
-    """Return the style for scrollbars"""
-    return f"""
-        QScrollBar:vertical {{
-            border: none;
-            background: {BG_MEDIUM.name()};
-            width: 14px;
-            margin: 15px 0 15px 0;
-            border-radius: 0px;
-        }}
-
-        QScrollBar::handle:vertical {{
-            background-color: {BORDER_DARK.name()};
-            min-height: 30px;
-            border-radius: 7px;
-        }}
-        QScrollBar::handle:vertical:hover {{
-            background-color: {PRIMARY_COLOR.name()};
-        }}
-        QScrollBar::handle:vertical:pressed {{
-            background-color: {PRIMARY_DARK.name()};
-        }}
+def get_app_title_style() -> str:
+    """Return the style for application title"""
+    return _APP_TITLE_STYLE
 
-        QScrollBar::sub-line:vertical {{
-            border: none;
-            background-color: {BG_MEDIUM.name()};
-            height: 15px;
-            border-top-left-radius: 7px;
-            border-top-right-radius: 7px;
-            subcontrol-position: top;
-            subcontrol-origin: margin;
+_STATUS_BAR_STYLE = f"""
+        QStatusBar {{
+            background-color: {_BG_MEDIUM};
+            color: {_TEXT_PRIMARY};
+            border-top: 1px solid {_BORDER_DARK};
         }}
-        QScrollBar::add-line:vertical {{
+        QStatusBar::item {{
             border: none;
-            background-color: {BG_MEDIUM.name()};
-            height: 15px;
-            border-bottom-left-radius: 7px;
-            border-bottom-right-radius: 7px;
-            subcontrol-position: bottom;
-            subcontrol-origin: margin;
-        }}
-        QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {{
-            background: none;
-        }}
-        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-            background: none;
         }}
     """
 
 def create_status_bar_style() -> str:
     """Return the style for status bar"""
-    return f"""
-        QStatusBar {{
-            background-color: {BG_MEDIUM.name()};
-            color: {TEXT_PRIMARY.name()};
-            border-top: 1px solid {BORDER_DARK.name()};
-        }}
-        QStatusBar::item {{
-            border: none;
-        }}
-    """ 
\ No newline at end of file
+    return _STATUS_BAR_STYLE
\ No newline at end of file
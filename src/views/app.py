@@ -5,14 +5,18 @@ This module defines the main application class for the Tennis Ball Tracker.
 """
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QCoreApplication, QTimer
 from src.views.main_window import MainWindow
 from src.utils.logger import Logger
 from src.utils.settings_manager import SettingsManager
 from src.controllers.image_manager import ImageManager
 from src.models.app_state import AppState
+from src.utils.ui_theme import apply_dark_theme
 import sys
 
+# Qt widget style used on every platform
+APP_STYLE = "Fusion"
+
 class TennisTrackerApp(QApplication):
     """
     Main application class for the Tennis Ball Tracker.
@@ -23,28 +27,66 @@ class TennisTrackerApp(QApplication):
     
     def __init__(self, argv):
         """Initialize the Tennis Ball Tracker application."""
+        # Set application information before the instance exists, so no
+        # change signals are emitted for it
+        QCoreApplication.setApplicationName("Tennis Ball Tracker")
+        QCoreApplication.setApplicationVersion("0.1.0")
+        QCoreApplication.setOrganizationName("Tennis Tracker Team")
+        QCoreApplication.setOrganizationDomain("example.com")
+        
         super(TennisTrackerApp, self).__init__(argv)
         
-        # Initialize singletons
+        # Use one widget style on every platform; set before the style sheet
+        # so nothing is polished against the native style first
+        self.setStyle(APP_STYLE)
+        
+        # Initialize singletons; the rest are created on first access
         self.logger = Logger.instance()
-        self.settings_manager = SettingsManager.instance()
-        self.image_manager = ImageManager.instance()
-        self.app_state = AppState.instance()
+        self._settings_manager = None
+        self._image_manager = None
+        self._app_state = None
         
-        # Set application information
-        self.setApplicationName("Tennis Ball Tracker")
-        self.setApplicationVersion("0.1.0")
-        self.setOrganizationName("Tennis Tracker Team")
-        self.setOrganizationDomain("example.com")
+        # Set the global style sheet before any widget exists so the widget
+        # tree is polished against it once while it is built
+        apply_dark_theme(self)
         
-        # Create and show main window
-        self.main_window = MainWindow()
-        self.main_window.show()
+        # Build the main window on the first event loop tick, so any further
+        # application setup by the caller is in place before the widget tree
+        # is created and polished
+        self.main_window = None
+        QTimer.singleShot(0, self._create_main_window)
+        
+        # Log shutdown when the event loop is about to exit
+        self.aboutToQuit.connect(self._on_about_to_quit)
         
         self.logger.info("Tennis Ball Tracker application initialized")
     
-    def closeEvent(self, event):
-        """Handle window close event"""
+    @property
+    def settings_manager(self):
+        """Settings manager singleton, created on first access"""
+        if self._settings_manager is None:
+            self._settings_manager = SettingsManager.instance()
+        return self._settings_manager
+    
+    @property
+    def image_manager(self):
+        """Image manager singleton, created on first access"""
+        if self._image_manager is None:
+            self._image_manager = ImageManager.instance()
+        return self._image_manager
+    
+    @property
+    def app_state(self):
+        """Application state singleton, created on first access"""
+        if self._app_state is None:
+            self._app_state = AppState.instance()
+        return self._app_state
+    
+    def _create_main_window(self):
+        """Create and show the main window once the event loop is running"""
+        self.main_window = MainWindow()
+        self.main_window.show()
+    
+    def _on_about_to_quit(self):
+        """Handle application shutdown"""
         self.logger.info("Application shutting down...")
-        # Any cleanup needed before exit
-        event.accept() 
\ No newline at end of file
@@ -4,15 +4,65 @@
 이미지를 표시하고 확대/축소, 패닝 등의 기능을 제공하는 UI 컴포넌트입니다.
 """
 
-import cv2
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from PySide6.QtCore import Qt, QPoint, Signal, QSize
-from PySide6.QtGui import QImage, QPixmap, QCursor, QPainter
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QMenu, QApplication
+import shiboken6
+from PySide6.QtCore import Qt, QPoint, QRect, Signal, QSize, QTimer
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QCursor, QPainter
+from PySide6.QtWidgets import QWidget, QLabel, QMenu, QApplication
 
 from src.models.app_state import AppState
 from src.constants.ui_constants import DARK_BACKGROUND_STYLE
 
+# QImage.Format_ARGB32는 32비트 정수 0xAARRGGBB 형식이므로 리틀 엔디언
+# 메모리에서는 B, G, R, A 순서로 저장됨
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# 프레임 픽셀 변환을 GUI 스레드 밖에서 수행하는 작업 스레드
+_CONVERT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image_view_convert")
+
+
+def _convert_frame(image):
+    """
+    NumPy 배열 프레임을 표시용 QImage로 변환합니다 (작업 스레드에서 실행).
+    
+    Args:
+        image: NumPy 배열로 된 이미지 (BGR 또는 BGRA 형식)
+        
+    Returns:
+        QImage: 화면 표시 형식으로 변환되어 픽셀을 소유하는 QImage
+    """
+    height, width, channels = image.shape
+    bytes_per_line = channels * width
+    
+    if channels == 4:
+        if _LITTLE_ENDIAN:
+            # 리틀 엔디언에서 BGRA 바이트 순서는 ARGB32와 같으므로 그대로 사용
+            if not image.flags['C_CONTIGUOUS']:
+                image = np.ascontiguousarray(image)
+            image_format = QImage.Format_ARGB32
+        else:
+            # BGRA -> RGBA 채널 순서 변경 (알파 채널 유지)
+            image = np.ascontiguousarray(image[..., [2, 1, 0, 3]])
+            image_format = QImage.Format_RGBA8888
+        display_format = QImage.Format_ARGB32_Premultiplied
+    else:
+        # BGR 데이터를 변환 없이 그대로 사용
+        if not image.flags['C_CONTIGUOUS']:
+            image = np.ascontiguousarray(image)
+        image_format = QImage.Format_BGR888
+        display_format = QImage.Format_RGB32
+    
+    # QImage 생성 (image 배열의 메모리를 복사 없이 참조)
+    q_image = QImage(image.data, width, height, bytes_per_line, image_format)
+    
+    # QPixmap이 사용하는 형식으로 미리 변환 (픽셀을 복사하므로 이후
+    # image 배열이 해제되어도 안전하고, GUI 스레드의 fromImage는 복사만 함)
+    return q_image.convertToFormat(display_format)
+
 
 class ImageView(QWidget):
     """
@@ -26,9 +76,30 @@ class ImageView(QWidget):
     MAX_ZOOM = 10.0
     ZOOM_FACTOR = 1.2
     
+    # 정수 배율로 간주하는 허용 오차 (부동소수점 오차만 허용; 1.2**6 ≈ 2.986 같은
+    # 근사값은 최근접 보간 시 픽셀 반복이 고르지 않으므로 정수 배율이 아님)
+    INTEGER_ZOOM_TOLERANCE = 1e-6
+    
+    # 빠른 변환 후 부드러운 변환으로 교체하기까지 대기 시간 (ms)
+    SMOOTH_SCALE_DELAY = 120
+    
+    # 휠 입력을 모아 한 번에 처리하는 간격 (ms, 약 한 프레임)과
+    # 확대/축소 한 단계에 해당하는 휠 회전량 (마우스 휠 한 칸)
+    WHEEL_FLUSH_INTERVAL = 16
+    WHEEL_STEP_DELTA = 120
+    
+    # 축소용 밉맵 피라미드의 최소 너비 (px)
+    MIP_MIN_WIDTH = 64
+    
+    # 확대/축소 단계별 스케일 결과를 담는 전역 QPixmapCache 최소 크기 (KB)
+    PIXMAP_CACHE_LIMIT = 100 * 1024
+    
     # Signal emitted when image is clicked
     clicked = Signal(int, int)
     
+    # 작업 스레드에서 변환된 프레임 전달 (QImage, 프레임 번호)
+    _frame_converted = Signal(QImage, int)
+    
     def __init__(self, parent=None):
         """
         ImageView 컴포넌트 초기화
@@ -48,6 +119,34 @@ class ImageView(QWidget):
         self.is_panning = False
         self.offset = QPoint(0, 0)
         
+        # 마지막으로 표시한 스케일 픽스맵의 (원본 cacheKey, 확대/축소 수준) 키
+        self._scaled_cache_key = None
+        
+        # 원본을 1/2씩 줄인 밉맵 피라미드 (필요한 단계까지만 생성)
+        self._mips = []
+        
+        # 작업 스레드 프레임 변환 상태 (최신 프레임만 대기)
+        self._frame_serial = 0
+        self._pending_frame = None
+        self._converting = False
+        self._frame_converted.connect(self._on_frame_converted)
+        
+        # 여러 확대/축소 단계를 담을 수 있도록 전역 캐시 크기 확보
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT)
+        
+        # 확대/축소 입력이 멈추면 부드러운 변환으로 다시 그리는 타이머
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._apply_smooth_scale)
+        
+        # 고해상도 트랙패드의 작은 휠 입력을 모아 프레임당 한 번만 확대/축소
+        self._wheel_accum = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(self.WHEEL_FLUSH_INTERVAL)
+        self._wheel_timer.timeout.connect(self._flush_wheel)
+        
         # UI 초기화
         self._init_ui()
         
@@ -56,25 +155,26 @@ class ImageView(QWidget):
     
     def _init_ui(self):
         """UI 요소를 초기화합니다."""
-        # 레이아웃 설정
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-        
         # 이미지 라벨 생성 및 설정
-        self.label = QLabel()
+        # (패닝은 라벨 위치만 옮기므로 레이아웃 없이 resizeEvent에서 직접 배치)
+        self.label = QLabel(self)
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setStyleSheet(DARK_BACKGROUND_STYLE)
         
         # 빈 픽스맵으로 초기화
         self.clear()
         
-        # 레이아웃에 라벨 추가
-        self.layout.addWidget(self.label)
-        
         # 마우스 트래킹 활성화
         self.setMouseTracking(True)
         self.label.setMouseTracking(True)
+        
+        # 컨텍스트 메뉴는 한 번만 만들고 재사용
+        self._context_menu = QMenu(self)
+        self._zoom_in_action = self._context_menu.addAction("확대")
+        self._zoom_out_action = self._context_menu.addAction("축소")
+        self._reset_zoom_action = self._context_menu.addAction("원래 크기로")
+        self._context_menu.addSeparator()
+        self._pan_action = self._context_menu.addAction("")
     
     def _connect_signals(self):
         """앱 상태 변경 이벤트에 연결합니다."""
@@ -89,54 +189,110 @@ class ImageView(QWidget):
             pixmap: 표시할 QPixmap 객체
         """
         self.pixmap = pixmap
-        self._update_image_scale()
+        
+        # 새 이미지는 빠른 변환으로 바로 표시하고, 밉맵 생성과 부드러운 변환은
+        # 이벤트 루프가 비는 시점으로 미룸
+        self._update_image_scale(fast=True)
+        if self._smooth_timer.isActive():
+            self._smooth_timer.start(0)
     
     def set_image(self, image):
         """
         NumPy 배열 이미지를 설정합니다.
         
+        픽셀 변환은 작업 스레드에서 수행되고, 완료되면 GUI 스레드에서
+        표시됩니다. 변환 중에 들어온 프레임은 가장 최신 것만 유지됩니다.
+        
+        비동기로 동작하므로 self.pixmap은 호출 직후가 아니라 이벤트 루프가
+        변환 완료 신호를 처리한 뒤에 갱신됩니다.
+        
         Args:
-            image: NumPy 배열로 된 이미지 (BGR 형식)
+            image: NumPy 배열로 된 이미지 (BGR 또는 BGRA 형식).
+                변환이 끝날 때까지 배열 내용을 수정하지 않아야 합니다.
         """
+        # 새 프레임 번호를 부여해 진행 중인 이전 변환 결과를 무효화
+        self._frame_serial += 1
+        
         if image is None:
+            self._pending_frame = None
             self.clear()
             return
         
-        # NumPy 배열에서 QImage 생성
-        height, width, channels = image.shape
-        bytes_per_line = channels * width
+        # 변환 중이면 최신 프레임만 남기고 이전 대기 프레임은 버림
+        self._pending_frame = (image, self._frame_serial)
+        if not self._converting:
+            self._submit_pending_frame()
+    
+    def _submit_pending_frame(self):
+        """대기 중인 프레임을 작업 스레드에서 변환하도록 제출합니다."""
+        image, serial = self._pending_frame
+        self._pending_frame = None
+        self._converting = True
+        
+        future = _CONVERT_EXECUTOR.submit(_convert_frame, image)
+        future.add_done_callback(
+            lambda done, serial=serial: self._deliver_converted_frame(done, serial)
+        )
+    
+    def _deliver_converted_frame(self, done, serial):
+        """
+        변환 결과를 GUI 스레드로 전달합니다 (작업 스레드에서 실행).
+        
+        Args:
+            done: 완료된 변환 Future
+            serial: 변환을 요청한 프레임 번호
+        """
+        # 변환 중에 위젯이 삭제되었으면 신호를 보낼 대상이 없음
+        if not shiboken6.isValid(self):
+            return
+        
+        q_image = done.result() if done.exception() is None else QImage()
+        self._frame_converted.emit(q_image, serial)
+    
+    def _on_frame_converted(self, q_image, serial):
+        """
+        작업 스레드에서 변환된 프레임을 GUI 스레드에서 표시합니다.
         
-        # BGR -> RGB 변환
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        Args:
+            q_image: 변환된 QImage (변환 실패 시 빈 이미지)
+            serial: 변환을 요청한 프레임 번호
+        """
+        self._converting = False
         
-        # QImage 생성
-        q_image = QImage(rgb_image.data, width, height, bytes_per_line, QImage.Format_RGB888)
+        # 그 사이에 새 프레임이 들어왔거나 지워졌다면 표시하지 않음
+        if serial == self._frame_serial and not q_image.isNull():
+            # QPixmap은 GUI 스레드에서만 만들 수 있음
+            self.set_pixmap(QPixmap.fromImage(q_image))
         
-        # QPixmap으로 변환하여 설정
-        self.set_pixmap(QPixmap.fromImage(q_image))
+        if self._pending_frame is not None:
+            self._submit_pending_frame()
     
     def clear(self):
         """이미지 뷰를 지웁니다."""
         self.pixmap = QPixmap()
+        self._scaled_cache_key = None
+        self._mips = []
+        self._smooth_timer.stop()
         self.label.setPixmap(self.pixmap)
     
     def reset_zoom(self):
         """확대/축소 수준을 초기화합니다."""
         self.zoom_level = 1.0
         self.offset = QPoint(0, 0)
+        self.label.move(self.offset)
         self._update_image_scale()
     
     def zoom_in(self):
         """이미지를 확대합니다."""
         if self.zoom_level < self.MAX_ZOOM:
             self.zoom_level *= self.ZOOM_FACTOR
-            self._update_image_scale()
+            self._update_image_scale(fast=True)
     
     def zoom_out(self):
         """이미지를 축소합니다."""
         if self.zoom_level > self.MIN_ZOOM:
             self.zoom_level /= self.ZOOM_FACTOR
-            self._update_image_scale()
+            self._update_image_scale(fast=True)
     
     def toggle_panning(self, enabled):
         """
@@ -151,31 +307,140 @@ class ImageView(QWidget):
         else:
             self.setCursor(Qt.ArrowCursor)
     
-    def _update_image_scale(self):
-        """현재 확대/축소 수준과 오프셋에 따라 이미지를 업데이트합니다."""
+    def _scale_pixmap(self, transformation):
+        """
+        원본 픽스맵을 현재 확대/축소 수준으로 스케일합니다.
+        
+        Args:
+            transformation: Qt.FastTransformation 또는 Qt.SmoothTransformation
+            
+        Returns:
+            QPixmap: 스케일된 픽스맵
+        """
+        # 이미지 크기 계산
+        scaled_size = self.pixmap.size() * self.zoom_level
+        
+        # 정수 배율 확대는 최근접 보간으로 충분하므로 빠른 변환 사용
+        if self._is_integer_zoom():
+            transformation = Qt.FastTransformation
+        
+        # 빠른 변환은 원본에서 바로 샘플링하고, 부드러운 변환은
+        # 목표 크기 이상인 가장 작은 밉맵 단계에서 스케일
+        if transformation == Qt.FastTransformation:
+            source = self.pixmap
+        else:
+            source = self._mip_for_zoom()
+        return source.scaled(scaled_size, Qt.KeepAspectRatio, transformation)
+    
+    def _is_integer_zoom(self):
+        """
+        현재 확대/축소 수준이 2배 이상의 정수 배율인지 확인합니다.
+        
+        Returns:
+            bool: 정수 배율 확대이면 True
+        """
+        return (self.zoom_level > 1.5
+                and abs(self.zoom_level - round(self.zoom_level)) < self.INTEGER_ZOOM_TOLERANCE)
+    
+    def _mip_for_zoom(self):
+        """
+        현재 확대/축소 수준에 맞는 밉맵 단계를 반환합니다.
+        
+        축소할 때 전체 해상도 원본 대신 목표 크기의 2배 이내인 단계에서
+        스케일하도록, 필요한 단계까지 1/2 축소본을 만들어 둡니다.
+        
+        Returns:
+            QPixmap: 목표 크기 이상인 가장 작은 밉맵 단계
+        """
+        # 원본이 바뀌었으면 피라미드를 다시 시작
+        if not self._mips or self._mips[0].cacheKey() != self.pixmap.cacheKey():
+            self._mips = [self.pixmap]
+        
+        if self.zoom_level >= 0.5:
+            return self.pixmap
+        
+        level = int(math.log2(1.0 / self.zoom_level))
+        while len(self._mips) <= level:
+            last = self._mips[-1]
+            if last.width() < 2 * self.MIP_MIN_WIDTH:
+                break
+            self._mips.append(last.scaled(last.size() / 2, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        
+        return self._mips[min(level, len(self._mips) - 1)]
+    
+    def _update_image_scale(self, fast=False):
+        """
+        현재 확대/축소 수준과 오프셋에 따라 이미지를 업데이트합니다.
+        
+        Args:
+            fast: True이면 빠른 변환으로 먼저 표시하고, 확대/축소 입력이
+                멈춘 뒤 부드러운 변환으로 교체합니다
+        """
         if self.pixmap.isNull():
+            self._scaled_cache_key = None
+            self._smooth_timer.stop()
             self.label.setPixmap(self.pixmap)
             return
         
-        # 위젯 크기 얻기
-        size = self.label.size()
+        # 원본과 확대/축소 수준이 그대로면 이미 표시 중인 픽스맵을 유지
+        # (패닝, 크기 변경 시 전체 해상도 재샘플링 방지)
+        cache_key = (self.pixmap.cacheKey(), round(self.zoom_level, 4))
+        if cache_key == self._scaled_cache_key:
+            return
         
-        # 이미지 크기 계산
-        scaled_size = self.pixmap.size() * self.zoom_level
+        # 1배율이면 스케일 없이 원본 픽스맵을 그대로 표시
+        if abs(self.zoom_level - 1.0) < 1e-6:
+            self._scaled_cache_key = cache_key
+            self._smooth_timer.stop()
+            self.label.setPixmap(self.pixmap)
+            return
+        
+        # 이전에 부드럽게 스케일한 같은 단계가 있으면 다시 계산하지 않음
+        pixmap_cache_key = self._pixmap_cache_key()
+        cached_pixmap = QPixmapCache.find(pixmap_cache_key)
+        if cached_pixmap is not None:
+            self._scaled_cache_key = cache_key
+            self._smooth_timer.stop()
+            self.label.setPixmap(cached_pixmap)
+            return
         
         # 스케일 변환된 픽스맵 생성
-        scaled_pixmap = self.pixmap.scaled(
-            scaled_size, 
-            Qt.KeepAspectRatio, 
-            Qt.SmoothTransformation
-        )
+        transformation = Qt.FastTransformation if fast else Qt.SmoothTransformation
+        scaled_pixmap = self._scale_pixmap(transformation)
         
         # 이미지가 있는 경우에만 처리
         if not scaled_pixmap.isNull():
+            self._scaled_cache_key = cache_key
             self.label.setPixmap(scaled_pixmap)
             
-            # 라벨 중앙에 이미지 배치
-            self.label.setAlignment(Qt.AlignCenter)
+            # 빠른 변환이면 입력이 멈춘 뒤 부드러운 변환으로 교체
+            # (정수 배율은 빠른 변환 결과가 최종 결과와 같음)
+            if fast and not self._is_integer_zoom():
+                self._smooth_timer.start(self.SMOOTH_SCALE_DELAY)
+            else:
+                self._smooth_timer.stop()
+                QPixmapCache.insert(pixmap_cache_key, scaled_pixmap)
+    
+    def _apply_smooth_scale(self):
+        """빠른 변환으로 표시한 이미지를 부드러운 변환으로 다시 그립니다."""
+        if self.pixmap.isNull():
+            return
+        
+        scaled_pixmap = self._scale_pixmap(Qt.SmoothTransformation)
+        if not scaled_pixmap.isNull():
+            QPixmapCache.insert(self._pixmap_cache_key(), scaled_pixmap)
+            self.label.setPixmap(scaled_pixmap)
+    
+    def _pixmap_cache_key(self):
+        """
+        현재 원본과 확대/축소 수준의 QPixmapCache 키를 반환합니다.
+        
+        원본이 바뀌면 cacheKey()가 바뀌므로 별도의 무효화가 필요 없습니다.
+        
+        Returns:
+            str: QPixmapCache 키
+        """
+        return f"iv:{self.pixmap.cacheKey()}:{round(self.zoom_level, 4)}"
     
     def wheelEvent(self, event):
         """
@@ -185,13 +450,28 @@ class ImageView(QWidget):
             event: QWheelEvent 객체
         """
         if not self.pixmap.isNull():
-            delta = event.angleDelta().y()
-            
-            # 확대/축소 방향 결정
-            if delta > 0:
-                self.zoom_in()
-            else:
-                self.zoom_out()
+            # 휠 회전량을 누적하고 다음 프레임에 한 번에 반영
+            self._wheel_accum += event.angleDelta().y()
+            if not self._wheel_timer.isActive():
+                self._wheel_timer.start()
+    
+    def _flush_wheel(self):
+        """누적된 휠 회전량만큼 확대/축소하고 이미지를 한 번만 갱신합니다."""
+        # 한 단계에 못 미치는 나머지는 다음 입력을 위해 남겨 둠
+        steps = int(self._wheel_accum / self.WHEEL_STEP_DELTA)
+        if steps == 0:
+            return
+        self._wheel_accum -= steps * self.WHEEL_STEP_DELTA
+        
+        # 확대/축소 방향 결정 (zoom_in/zoom_out과 같은 제한 적용)
+        for _ in range(steps):
+            if self.zoom_level < self.MAX_ZOOM:
+                self.zoom_level *= self.ZOOM_FACTOR
+        for _ in range(-steps):
+            if self.zoom_level > self.MIN_ZOOM:
+                self.zoom_level /= self.ZOOM_FACTOR
+        
+        self._update_image_scale(fast=True)
     
     def mousePressEvent(self, event):
         """
@@ -219,8 +499,8 @@ class ImageView(QWidget):
             # 오프셋 업데이트
             self.offset += delta
             
-            # 이미지 업데이트
-            self._update_image_scale()
+            # 스케일은 그대로이므로 라벨 위치만 이동
+            self.label.move(self.offset)
     
     def mouseReleaseEvent(self, event):
         """
@@ -240,6 +520,9 @@ class ImageView(QWidget):
             event: QResizeEvent 객체
         """
         super().resizeEvent(event)
+        
+        # 라벨이 위젯 전체를 덮도록 하고 패닝 오프셋 유지
+        self.label.setGeometry(QRect(self.offset, self.size()))
         self._update_image_scale()
     
     def contextMenuEvent(self, event):
@@ -249,25 +532,17 @@ class ImageView(QWidget):
         Args:
             event: QContextMenuEvent 객체
         """
-        menu = QMenu(self)
-        
-        # 메뉴 항목 추가
-        zoom_in_action = menu.addAction("확대")
-        zoom_out_action = menu.addAction("축소")
-        reset_zoom_action = menu.addAction("원래 크기로")
-        
-        menu.addSeparator()
-        
-        toggle_pan_action = menu.addAction("패닝 모드 " + ("비활성화" if self.is_panning else "활성화"))
+        # 패닝 상태에 따라 바뀌는 항목만 갱신
+        self._pan_action.setText("패닝 모드 " + ("비활성화" if self.is_panning else "활성화"))
         
         # 메뉴 표시 및 선택 처리
-        action = menu.exec_(self.mapToGlobal(event.pos()))
+        action = self._context_menu.exec_(self.mapToGlobal(event.pos()))
         
-        if action == zoom_in_action:
+        if action == self._zoom_in_action:
             self.zoom_in()
-        elif action == zoom_out_action:
+        elif action == self._zoom_out_action:
             self.zoom_out()
-        elif action == reset_zoom_action:
+        elif action == self._reset_zoom_action:
             self.reset_zoom()
-        elif action == toggle_pan_action:
+        elif action == self._pan_action:
             self.toggle_panning(not self.is_panning) 
\ No newline at end of file
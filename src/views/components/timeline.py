@@ -4,7 +4,7 @@
 비디오 플레이어의 현재 프레임 위치와 총 프레임을 표시하고 조작하는 UI 컴포넌트입니다.
 """
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtWidgets import (
     QWidget, QSlider, QLabel, QHBoxLayout, QVBoxLayout
 )
@@ -23,6 +23,9 @@ class Timeline(QWidget):
     # 사용자가 타임라인에서 위치를 변경할 때 발생하는 신호
     position_changed = Signal(int)
     
+    # 드래그 중 위치 변경 신호를 모아 보내는 간격 (ms, 약 한 프레임)
+    POSITION_EMIT_INTERVAL = 16
+    
     def __init__(self, parent=None):
         """
         Timeline 컴포넌트 초기화
@@ -38,6 +41,16 @@ class Timeline(QWidget):
         # 이전 재생 상태 추적을 위한 변수
         self.was_playing = False
         
+        # 마지막으로 표시한 총 프레임 수 (변경이 없으면 갱신 생략)
+        self._frame_count = 0
+        
+        # 드래그 중 슬라이더 값을 모아 프레임당 한 번만 position_changed 발생
+        self._pending_value = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.POSITION_EMIT_INTERVAL)
+        self._emit_timer.timeout.connect(self._emit_pending_position)
+        
         # UI 요소 초기화
         self._init_ui()
         
@@ -109,8 +122,20 @@ class Timeline(QWidget):
         Args:
             count: 총 프레임 수
         """
+        if count == self._frame_count:
+            return
+        self._frame_count = count
+        
         # 슬라이더 최대값 설정 (0-based)
+        # 범위가 줄어 값이 잘려도 앱 상태에서 온 변경이므로 position_changed로 되돌려 보내지 않음
+        previous_value = self.slider.value()
+        self.slider.blockSignals(True)
         self.slider.setMaximum(max(0, count - 1))
+        self.slider.blockSignals(False)
+        
+        # 신호를 막았으므로 잘린 값은 라벨에 직접 반영 (1-based 표시)
+        if self.slider.value() != previous_value:
+            self.current_frame_label.setText(str(self.slider.value() + 1))
         
         # 총 프레임 라벨 업데이트
         self.total_frames_label.setText(f"/ {count}")
@@ -122,11 +147,21 @@ class Timeline(QWidget):
         Args:
             frame: 현재 프레임 인덱스 (0-based)
         """
-        # 범위 내에 있는지 확인하고 슬라이더 값 설정
-        self.slider.setValue(max(0, min(frame, self.slider.maximum())))
+        # 범위 내로 제한한 값과 라벨 텍스트 (1-based 표시)
+        value = max(0, min(frame, self.slider.maximum()))
+        text = str(frame + 1)
         
-        # 현재 프레임 라벨 업데이트 (1-based 표시)
-        self.current_frame_label.setText(str(frame + 1))
+        # 재생 중 같은 프레임이 다시 들어오면 다시 그리지 않음
+        if value == self.slider.value() and text == self.current_frame_label.text():
+            return
+        
+        # 앱 상태에서 온 값이므로 position_changed로 되돌려 보내지 않음
+        self.slider.blockSignals(True)
+        self.slider.setValue(value)
+        self.slider.blockSignals(False)
+        
+        # 현재 프레임 라벨 업데이트
+        self.current_frame_label.setText(text)
     
     def on_slider_value_changed(self, value):
         """
@@ -138,7 +173,19 @@ class Timeline(QWidget):
         # 현재 프레임 라벨 업데이트 (1-based 표시)
         self.current_frame_label.setText(str(value + 1))
         
-        # 위치 변경 신호 발생
+        # 위치 변경 신호는 다음 프레임에 최신 값으로 한 번만 발생
+        self._pending_value = value
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+    
+    def _emit_pending_position(self):
+        """모아 둔 최신 슬라이더 값으로 위치 변경 신호를 발생시킵니다."""
+        self._emit_timer.stop()
+        if self._pending_value is None:
+            return
+        
+        value = self._pending_value
+        self._pending_value = None
         self.position_changed.emit(value)
     
     def on_slider_pressed(self):
@@ -152,6 +199,9 @@ class Timeline(QWidget):
     
     def on_slider_released(self):
         """슬라이더가 놓아졌을 때 호출됩니다."""
+        # 드래그 중 남은 위치 변경을 바로 반영
+        self._emit_pending_position()
+        
         # 이전에 재생 중이었다면 다시 재생
         if self.was_playing:
             self.app_state.set_playback_state('play')
@@ -187,10 +237,17 @@ class Timeline(QWidget):
     
     def reset(self):
         """타임라인을 초기 상태로 리셋합니다."""
-        # 슬라이더 초기화
+        # 드래그 중 모아 둔 위치 변경은 버림
+        self._emit_timer.stop()
+        self._pending_value = None
+        
+        # 슬라이더 초기화 (중간 값 변경마다 신호가 발생하지 않도록 차단)
+        self.slider.blockSignals(True)
         self.slider.setMinimum(0)
         self.slider.setMaximum(0)
         self.slider.setValue(0)
+        self.slider.blockSignals(False)
+        self._frame_count = 0
         
         # 라벨 초기화
         self.current_frame_label.setText("1")
@@ -7,21 +7,21 @@ for the Tennis Ball Tracker application.
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel,
                                QMenuBar, QMenu, QFileDialog, QMessageBox, QSizePolicy, QProgressDialog)
-from PySide6.QtCore import Slot, Qt
+from PySide6.QtCore import Slot, Qt, QCoreApplication
 from PySide6.QtGui import QAction, QPainter, QPixmap, QBrush, QPalette, QColor
 
 from src.models.app_state import AppState
 from src.controllers.image_manager import ImageManager
+from src.controllers.image_folder_processor import FolderProcessWorker
 from src.utils.logger import Logger
 from src.utils.settings_manager import SettingsManager
 from src.views.tabs.monitoring_tab import MonitoringTab
 from src.views.tabs.settings_tab import SettingsTab
 from src.views.tabs.coming_soon_tab import ComingSoonTab
 from src.utils.ui_theme import (
-    get_application_style, get_tab_widget_style, get_button_style,
-    get_label_style, get_group_box_style, get_message_box_style,
-    apply_dark_theme, get_menu_style, get_background_style, get_app_title_style,
-    get_scrollbar_style, create_status_bar_style
+    get_button_style, get_label_style, get_group_box_style, get_message_box_style,
+    apply_dark_theme, get_background_style, get_app_title_style,
+    create_status_bar_style
 )
 from src.constants.ui_constants import (
     PRIMARY_COLOR, ERROR_COLOR, BG_DARK, BG_MEDIUM
@@ -29,7 +29,6 @@ from src.constants.ui_constants import (
 # Modified to import dynamically
 # from src.views.dialogs.folder_selection_dialog import FolderSelectionDialog
 import os
-import json
 
 class MainWindow(QMainWindow):
     """
@@ -52,6 +51,10 @@ class MainWindow(QMainWindow):
         self.image_manager = ImageManager.instance()
         self.settings_manager = SettingsManager.instance()
         
+        # Folder processing job in progress (see _process_image_folder)
+        self._folder_worker = None
+        self._process_progress = None
+        
         # Set window properties
         self.setWindowTitle("Tennis Ball Tracker System")
         self.setMinimumSize(1366, 736)
@@ -103,21 +106,8 @@ class MainWindow(QMainWindow):
     
     def apply_theme(self):
         """Apply the application-wide theme"""
-        # Apply base application style
+        # One global style sheet covers the window, tabs and menus
         apply_dark_theme(self)
-        
-        # Apply specific styles to main window components
-        self.setStyleSheet(f"""
-            {get_application_style()}
-            QMainWindow {{
-                background-color: #1e1e1e;
-            }}
-            {get_tab_widget_style()}
-            {get_menu_style()}
-        """)
-        
-        # Apply styles to the tab widget
-        self.tab_widget.setStyleSheet(get_tab_widget_style())
     
     def move_to_center(self):
         """Center the window on the screen"""
@@ -152,13 +142,15 @@ class MainWindow(QMainWindow):
     def load_last_file_path(self):
         """Load last used file path and automatically load images"""
         last_folder_path = self.settings_manager.get("last_folder_path", "")
-        if last_folder_path and os.path.exists(last_folder_path):
+        entries = self._list_folder(last_folder_path) if last_folder_path else None
+        if entries is not None:
             self.logger.info(f"Found last used folder path: {last_folder_path}")
             
             # Check if frames_info.json file exists
             json_file_path = os.path.join(last_folder_path, "frames_info.json")
+            file_names, _ = entries
             
-            if os.path.exists(json_file_path):
+            if os.path.normcase("frames_info.json") in file_names:
                 # Display progress dialog
                 progress_dialog = QProgressDialog("Loading image files...", "Cancel", 0, 100, self)
                 progress_dialog.setWindowModality(Qt.WindowModal)
@@ -167,7 +159,6 @@ class MainWindow(QMainWindow):
                 progress_dialog.show()
                 
                 # Update QApplication event processing
-                from PySide6.QtCore import QCoreApplication
                 QCoreApplication.processEvents()
                 
                 # Load images from JSON file
@@ -227,6 +218,33 @@ class MainWindow(QMainWindow):
         else:
             self.logger.debug("No available last folder path")
     
+    @staticmethod
+    def _list_folder(folder_path):
+        """
+        List the files and folders directly inside a folder with one os.scandir call
+        
+        Names are passed through os.path.normcase so lookups follow the
+        platform's case rules, as os.path.exists does.
+        
+        Args:
+            folder_path: Folder to list
+            
+        Returns:
+            tuple: (file names, folder names) as sets, or None if the folder cannot be read
+        """
+        file_names = set()
+        dir_names = set()
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dir_names.add(os.path.normcase(entry.name))
+                    elif entry.is_file():
+                        file_names.add(os.path.normcase(entry.name))
+        except OSError:
+            return None
+        return file_names, dir_names
+    
     def setup_menu_bar(self):
         """Set up the menu bar with various menus and actions"""
         # Create menu bar
@@ -279,13 +297,13 @@ class MainWindow(QMainWindow):
         progress_dialog.show()
         
         # Update QApplication event processing (maintain UI responsiveness)
-        from PySide6.QtCore import QCoreApplication
         QCoreApplication.processEvents()
         
-        # Check if frames_info.json file exists
+        # Check if frames_info.json file and camera folders exist (one directory read)
         json_file_path = os.path.join(folder_path, "frames_info.json")
+        file_names, dir_names = self._list_folder(folder_path) or (set(), set())
         
-        if os.path.exists(json_file_path):
+        if os.path.normcase("frames_info.json") in file_names:
             # If JSON file exists, load through ImageManager
             success = self.image_manager.load_images_from_json(json_file_path)
             
@@ -328,13 +346,10 @@ class MainWindow(QMainWindow):
                 self.logger.error(f"Failed to load images from JSON: {json_file_path}")
         else:
             # If JSON file doesn't exist, check folder structure
-            camera_dirs = [
-                os.path.join(folder_path, "LeftCamera"),
-                os.path.join(folder_path, "RightCamera")
-            ]
+            camera_dirs = [os.path.normcase("LeftCamera"), os.path.normcase("RightCamera")]
             
             # Check if camera folders exist
-            if all(os.path.exists(d) for d in camera_dirs):
+            if all(d in dir_names for d in camera_dirs):
                 # Folder structure is correct but JSON file is missing
                 progress_dialog.close()
                 QMessageBox.warning(
@@ -348,14 +363,8 @@ class MainWindow(QMainWindow):
                 # Image folder structure is incorrect
                 progress_dialog.close()
                 
-                # Search for image formats
-                img_files = []
-                for root, _, files in os.walk(folder_path):
-                    for file in files:
-                        if file.lower().endswith(('.jpg', '.jpeg', '.bmp')):
-                            img_files.append(os.path.join(root, file))
-                            if len(img_files) >= 10:  # Check maximum of 10
-                                break
+                # Search for image formats (reused by the processing step)
+                img_files = FolderProcessWorker.scan_image_files(folder_path)
                 
                 if img_files:
                     # Images exist but structure is incorrect - provide processing options
@@ -376,7 +385,7 @@ class MainWindow(QMainWindow):
                     
                     if result == QMessageBox.Yes:
                         # Start image processing
-                        self._process_image_folder(folder_path)
+                        self._process_image_folder(folder_path, img_files)
                 else:
                     # No image files
                     QMessageBox.warning(
@@ -387,13 +396,9 @@ class MainWindow(QMainWindow):
                     
                 self.logger.warning(f"Folder does not have proper structure: {folder_path}")
     
-    def _process_image_folder(self, folder_path):
+    def _process_image_folder(self, folder_path, image_files=None):
         """Process image folder to create the necessary folder structure and classify images."""
-        # 진행 대화상자 생성
         # Create progress dialog
-        from PySide6.QtWidgets import QProgressDialog
-        from PySide6.QtCore import QCoreApplication, Qt
-        
         progress = QProgressDialog("Processing image files...", "Cancel", 0, 100, self)
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
@@ -401,223 +406,97 @@ class MainWindow(QMainWindow):
         progress.setValue(0)
         progress.show()
         
-        try:
-            # 1. 필요한 폴더 구조 생성
-            for camera in ["LeftCamera", "RightCamera"]:
-                for subdir in ["raw", "resize"]:
-                    path = os.path.join(folder_path, camera, subdir)
-                    os.makedirs(path, exist_ok=True)
-            
-            progress.setValue(10)
-            QCoreApplication.processEvents()
-            
-            # 2. 이미지 파일 검색
-            import shutil
-            from PIL import Image
-            
-            self.logger.info("Searching for image files...")
-            progress.setLabelText("Searching for image files...")
-            
-            left_files = []
-            right_files = []
-            
-            # 모든 이미지 파일 검색
-            all_files = []
-            for root, _, files in os.walk(folder_path):
-                for file in files:
-                    if file.lower().endswith(('.jpg', '.jpeg', '.bmp')):
-                        file_path = os.path.join(root, file)
-                        all_files.append(file_path)
-            
-            progress.setValue(20)
-            progress.setLabelText("Classifying images...")
-            QCoreApplication.processEvents()
-            
-            # 파일명으로 좌/우 카메라 이미지 분류
-            for file in all_files:
-                if progress.wasCanceled():
-                    return
-                    
-                if "left" in file.lower() or "leftcamera" in file.lower():
-                    left_files.append(file)
-                elif "right" in file.lower() or "rightcamera" in file.lower():
-                    right_files.append(file)
-            
-            # 만약 Left/Right가 구분되지 않았다면 파일을 첫 번째 절반과 두 번째 절반으로 나누기
-            if not left_files and not right_files and all_files:
-                all_files.sort()
-                mid = len(all_files) // 2
-                left_files = all_files[:mid]
-                right_files = all_files[mid:]
-            
-            if not left_files or not right_files:
-                progress.close()
+        # Run the copy/resize work on a pool thread; the dialog is driven by its signals
+        worker = FolderProcessWorker(folder_path, image_files)
+        worker.progress.connect(self._on_process_progress)
+        worker.finished.connect(self._on_process_finished)
+        progress.canceled.connect(worker.cancel)
+        
+        # Keep references until the worker reports back
+        self._process_progress = progress
+        self._folder_worker = worker
+        worker.start()
+    
+    @Slot(int, str)
+    def _on_process_progress(self, value, label):
+        """Update the processing dialog from the folder worker."""
+        progress = self._process_progress
+        if progress is None:
+            return
+        
+        # setValue() on a modal dialog processes events, which can run
+        # _on_process_finished and drop the dialog before it returns
+        progress.setLabelText(label)
+        progress.setValue(value)
+    
+    @Slot(bool, dict)
+    def _on_process_finished(self, success, result):
+        """Load the processed folder, or report why processing stopped."""
+        progress = self._process_progress
+        folder_path = self._folder_worker.folder_path
+        self._process_progress = None
+        self._folder_worker = None
+        
+        if not success:
+            progress.close()
+            reason = result.get("reason")
+            if reason == FolderProcessWorker.REASON_CLASSIFICATION:
                 QMessageBox.warning(
                     self,
                     "Image Classification Failed",
                     "Cannot distinguish between left and right camera images.\n"
                     "Filenames must contain 'Left'/'Right' or 'LeftCamera'/'RightCamera'."
                 )
-                return
-            
-            # 파일 정렬
-            left_files.sort()
-            right_files.sort()
-            
-            progress.setValue(30)
-            progress.setLabelText("Copying and adjusting files...")
-            QCoreApplication.processEvents()
-            
-            # 3. 이미지 처리 및 복사
-            self.logger.info(f"Processing {len(left_files)} left files and {len(right_files)} right files")
-            total_files = min(len(left_files), len(right_files))
-            frame_info = {}
-            
-            # 각 프레임 처리
-            for i in range(total_files):
-                if progress.wasCanceled():
-                    return
-                    
-                left_file = left_files[i]
-                right_file = right_files[i]
-                frame_number = i + 1
-                
-                # 파일 경로 생성
-                left_raw = f"LeftCamera/raw/frame_{frame_number:04d}_LeftCamera.jpg"
-                right_raw = f"RightCamera/raw/frame_{frame_number:04d}_RightCamera.jpg"
-                left_resize = f"LeftCamera/resize/frame_{frame_number:04d}_LeftCamera.jpg"
-                right_resize = f"RightCamera/resize/frame_{frame_number:04d}_RightCamera.jpg"
-                
-                # raw 파일 복사
-                self._copy_file(left_file, os.path.join(folder_path, left_raw))
-                self._copy_file(right_file, os.path.join(folder_path, right_raw))
-                
-                # 이미지 리사이징
-                self._resize_image(
-                    os.path.join(folder_path, left_raw),
-                    os.path.join(folder_path, left_resize),
-                    height=280
-                )
-                self._resize_image(
-                    os.path.join(folder_path, right_raw),
-                    os.path.join(folder_path, right_resize),
-                    height=280
+            elif reason == FolderProcessWorker.REASON_ERROR:
+                QMessageBox.critical(
+                    self,
+                    "Processing Error",
+                    f"An error occurred during image processing:\n{result.get('message', '')}"
                 )
-                
-                # 프레임 정보 추가
-                frame_info[str(frame_number)] = {
-                    "frame_number": frame_number,
-                    "left_raw": left_raw.replace("/", "\\"),
-                    "right_raw": right_raw.replace("/", "\\"),
-                    "left_resize": left_resize.replace("/", "\\"),
-                    "right_resize": right_resize.replace("/", "\\")
-                }
-                
-                # 진행상황 업데이트
-                progress_value = 30 + int((i + 1) / total_files * 60)  # 30% ~ 90%
-                progress.setValue(progress_value)
-                progress.setLabelText(f"Processing images... ({i+1}/{total_files})")
-                QCoreApplication.processEvents()
-            
-            progress.setValue(90)
-            progress.setLabelText("Generating JSON file...")
-            QCoreApplication.processEvents()
-            
-            # 4. JSON 파일 생성
-            json_data = {
-                "total_frames": total_files,
-                "frame_info": frame_info
-            }
-            
-            json_file_path = os.path.join(folder_path, "frames_info.json")
-            with open(json_file_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=4)
-            
-            self.logger.info(f"Created frames_info.json with {total_files} frames")
+            return
+        
+        progress.setValue(100)
+        progress.setLabelText("Processing complete!")
+        
+        # 처리 완료 후 이미지 로드
+        success = self.image_manager.load_images_from_json(result["json_file_path"])
+        
+        if success:
+            # 로드 성공 시 앱 상태 업데이트
+            self.app_state.file_path = folder_path
+            image_count = self.image_manager.get_total_images()
+            self.app_state.total_frames = image_count
+            self.app_state.current_frame = 0
+            self.app_state.playback_state = 'pause'
             
-            progress.setValue(100)
-            progress.setLabelText("Processing complete!")
-            QCoreApplication.processEvents()
+            # 모니터링 탭으로 전환
+            if self.tab_widget.currentIndex() != 0:
+                self.tab_widget.setCurrentIndex(0)
             
-            # 처리 완료 후 이미지 로드
-            success = self.image_manager.load_images_from_json(json_file_path)
+            # 모니터링 탭의 이미지 갱신
+            # Update monitoring tab's image display
+            monitoring_tab = self.tab_widget.widget(0)
+            if hasattr(monitoring_tab, 'image_display_manager'):
+                monitoring_tab.image_display_manager.update_displayed_images(0)
+                # 오버레이 처리
+                if hasattr(monitoring_tab, '_process_overlay'):
+                    monitoring_tab._process_overlay(1)  # Frame number is 1 (index 0 + 1)
             
-            if success:
-                # 로드 성공 시 앱 상태 업데이트
-                self.app_state.file_path = folder_path
-                image_count = self.image_manager.get_total_images()
-                self.app_state.total_frames = image_count
-                self.app_state.current_frame = 0
-                self.app_state.playback_state = 'pause'
-                
-                # 모니터링 탭으로 전환
-                if self.tab_widget.currentIndex() != 0:
-                    self.tab_widget.setCurrentIndex(0)
-                
-                # 모니터링 탭의 이미지 갱신
-                # Update monitoring tab's image display
-                monitoring_tab = self.tab_widget.widget(0)
-                if hasattr(monitoring_tab, 'image_display_manager'):
-                    monitoring_tab.image_display_manager.update_displayed_images(0)
-                    # 오버레이 처리
-                    if hasattr(monitoring_tab, '_process_overlay'):
-                        monitoring_tab._process_overlay(1)  # Frame number is 1 (index 0 + 1)
-                
-                progress.close()
-                QMessageBox.information(
-                    self, 
-                    "Processing Complete", 
-                    f"Image processing is complete.\n{image_count} images have been loaded."
-                )
-                self.logger.info(f"Successfully loaded {image_count} images after processing")
-            else:
-                progress.close()
-                QMessageBox.warning(
-                    self,
-                    "Load Failed",
-                    "Images were processed but failed to load."
-                )
-                self.logger.error("Failed to load images after processing")
-                
-        except Exception as e:
-            self.logger.error(f"Error processing image folder: {str(e)}")
             progress.close()
-            QMessageBox.critical(
+            QMessageBox.information(
+                self, 
+                "Processing Complete", 
+                f"Image processing is complete.\n{image_count} images have been loaded."
+            )
+            self.logger.info(f"Successfully loaded {image_count} images after processing")
+        else:
+            progress.close()
+            QMessageBox.warning(
                 self,
-                "Processing Error",
-                f"An error occurred during image processing:\n{str(e)}"
+                "Load Failed",
+                "Images were processed but failed to load."
             )
-    
-    def _copy_file(self, src, dst):
-        """Copy a file. Skips if the destination file already exists."""
-        try:
-            if not os.path.exists(dst):
-                os.makedirs(os.path.dirname(dst), exist_ok=True)
-                
-                # 이미지 파일만 복사
-                import shutil
-                shutil.copy2(src, dst)
-                
-            return True
-        except Exception as e:
-            self.logger.error(f"Error copying file {src} to {dst}: {str(e)}")
-            return False
-    
-    def _resize_image(self, src, dst, height=280):
-        """Resize an image. Skips if the destination file already exists."""
-        if not os.path.exists(dst):
-            try:
-                from PIL import Image
-                img = Image.open(src)
-                w, h = img.size
-                new_width = int(w * height / h)
-                resized_img = img.resize((new_width, height), Image.LANCZOS)
-                os.makedirs(os.path.dirname(dst), exist_ok=True)
-                resized_img.save(dst, "JPEG", quality=85)
-            except Exception as e:
-                self.logger.error(f"Error resizing image {src}: {str(e)}")
-                # 리사이징 실패 시 원본 파일 복사
-                self._copy_file(src, dst)
+            self.logger.error("Failed to load images after processing")
     
     def initialize_tabs(self):
         """Initialize and add all tabs to the tab widget"""
@@ -755,8 +634,7 @@ class MainWindow(QMainWindow):
         else:
             self.logger.debug("Background image loaded successfully")
             # Set transparent background for widgets to allow background image to show
-            self.centralWidget().setStyleSheet("background-color: transparent;")
-            self.tab_widget.setStyleSheet(self.tab_widget.styleSheet() + "background-color: transparent;")
+            apply_dark_theme(self, transparent_background=True)
     
     def paintEvent(self, event):
         """Override paint event to ensure background is properly stretched"""
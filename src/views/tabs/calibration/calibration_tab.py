@@ -25,12 +25,7 @@ from src.controllers.calibration.point_manager import CalibrationPointManager
 from src.models.calibration.point_io import CalibrationPointIO
 from src.utils.image.image_utils import scale_pos_to_original, draw_calibration_points
 from src.utils.math.vector import Vector2D
-from src.utils.ui_theme import (
-    get_group_box_style, get_label_style, get_button_style, 
-    get_separator_style, get_message_box_style, get_image_label_style,
-    get_active_image_label_style, get_inactive_image_label_style,
-    get_status_label_style, get_disabled_button_style
-)
+from src.utils.ui_theme import set_style_property
 
 
 class CalibrationTab(QWidget):
@@ -102,7 +97,7 @@ class CalibrationTab(QWidget):
         # Create a grouped section for title and instructions
         instruction_group = QGroupBox("Tennis Court Calibration Instructions")
         instruction_group.setObjectName("instructionGroup")
-        instruction_group.setStyleSheet(get_group_box_style(is_title_centered=True))
+        instruction_group.setProperty("titleCentered", True)
         instruction_layout = QVBoxLayout(instruction_group)
         instruction_layout.setContentsMargins(15, 20, 15, 15)
         
@@ -147,14 +142,13 @@ class CalibrationTab(QWidget):
         left_instructions.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         left_instructions.setTextFormat(Qt.RichText)
         left_instructions.setWordWrap(True)
-        left_instructions.setStyleSheet(get_label_style(is_description=True))
+        left_instructions.setProperty("variant", "description")
         instruction_columns.addWidget(left_instructions)
         
         # Add vertical separator
         separator = QFrame()
         separator.setFrameShape(QFrame.VLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet(get_separator_style())
         instruction_columns.addWidget(separator)
         
         # Create and add right column label
@@ -162,7 +156,7 @@ class CalibrationTab(QWidget):
         right_instructions.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         right_instructions.setTextFormat(Qt.RichText)
         right_instructions.setWordWrap(True)
-        right_instructions.setStyleSheet(get_label_style(is_description=True))
+        right_instructions.setProperty("variant", "description")
         instruction_columns.addWidget(right_instructions)
         
         # Add the columns layout to the instruction layout
@@ -170,7 +164,6 @@ class CalibrationTab(QWidget):
         
         # Status label
         self.status_label = QLabel("Select points on the tennis court")
-        self.status_label.setStyleSheet(get_label_style())
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setMinimumHeight(30)
         instruction_layout.addWidget(self.status_label)
@@ -184,7 +177,7 @@ class CalibrationTab(QWidget):
         
         # Left camera image
         left_camera_group = QGroupBox("Left Camera Image")
-        left_camera_group.setStyleSheet(get_group_box_style(is_title_centered=True))
+        left_camera_group.setProperty("titleCentered", True)
         left_camera_layout = QVBoxLayout(left_camera_group)
         
         # Left camera label
@@ -192,7 +185,7 @@ class CalibrationTab(QWidget):
         self.left_image_label.setAlignment(Qt.AlignCenter)
         self.left_image_label.setMinimumSize(640, 360)
         self.left_image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.left_image_label.setStyleSheet(get_image_label_style())
+        self.left_image_label.setProperty("imageState", "inactive")
         
         # Install event filter for mouse interactions
         self.left_image_label.installEventFilter(self)
@@ -204,7 +197,7 @@ class CalibrationTab(QWidget):
         
         # Right camera image
         right_camera_group = QGroupBox("Right Camera Image")
-        right_camera_group.setStyleSheet(get_group_box_style(is_title_centered=True))
+        right_camera_group.setProperty("titleCentered", True)
         right_camera_layout = QVBoxLayout(right_camera_group)
         
         # Right camera label
@@ -212,7 +205,7 @@ class CalibrationTab(QWidget):
         self.right_image_label.setAlignment(Qt.AlignCenter)
         self.right_image_label.setMinimumSize(640, 360)
         self.right_image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.right_image_label.setStyleSheet(get_image_label_style())
+        self.right_image_label.setProperty("imageState", "inactive")
         
         # Install event filter for mouse interactions
         self.right_image_label.installEventFilter(self)
@@ -236,28 +229,26 @@ class CalibrationTab(QWidget):
         self.reset_button = QPushButton("Reset Points")
         self.reset_button.clicked.connect(self._reset_points)
         self.reset_button.setToolTip("Remove all selected points for the current camera")
-        self.reset_button.setStyleSheet(get_button_style(is_destructive=True))
+        self.reset_button.setProperty("destructive", True)
         action_layout.addWidget(self.reset_button)
         
         # Load button
         self.load_button = QPushButton("Load Points")
         self.load_button.clicked.connect(self._load_points)
         self.load_button.setToolTip("Load previously saved calibration points")
-        self.load_button.setStyleSheet(get_button_style())
         action_layout.addWidget(self.load_button)
         
         # Post-process button
         self.process_button = QPushButton("Post Process")
         self.process_button.clicked.connect(self._post_process_points)
         self.process_button.setToolTip("Optimize and align selected points automatically")
-        self.process_button.setStyleSheet(get_button_style())
         action_layout.addWidget(self.process_button)
         
         # Save button
         self.save_button = QPushButton("Save Points")
         self.save_button.clicked.connect(self._save_points)
         self.save_button.setToolTip("Save calibration points for future use")
-        self.save_button.setStyleSheet(get_button_style(is_primary=True))
+        self.save_button.setProperty("primary", True)
         action_layout.addWidget(self.save_button)
         
         # Add right spacer for centering
@@ -373,12 +364,7 @@ class CalibrationTab(QWidget):
         image_label.setPixmap(scaled_pixmap)
         
         # Add highlight border for active camera
-        if is_active:
-            style = get_active_image_label_style()
-            image_label.setStyleSheet(style)
-        else:
-            style = get_inactive_image_label_style()
-            image_label.setStyleSheet(style)
+        set_style_property(image_label, "imageState", "active" if is_active else "inactive")
     
     def _update_status_info(self):
         """Update the status information displayed to the user"""
@@ -409,11 +395,11 @@ class CalibrationTab(QWidget):
         
         # Set color based on completion status
         if points_remaining == 0:
-            self.status_label.setStyleSheet(get_status_label_style("complete"))
+            set_style_property(self.status_label, "status", "complete")
         elif points_remaining <= 3:
-            self.status_label.setStyleSheet(get_status_label_style("progress"))
+            set_style_property(self.status_label, "status", "progress")
         else:
-            self.status_label.setStyleSheet(get_status_label_style("start"))
+            set_style_property(self.status_label, "status", "start")
     
     def _update_button_states(self):
         """Update button enabled/disabled states based on current data"""
@@ -431,17 +417,7 @@ class CalibrationTab(QWidget):
         # Enable/disable post-process button based on if there are enough points to process
         self.process_button.setEnabled(len(points) == self.TOTAL_POINTS)
         
-        # Add visual styling to indicate button states
-        for button in [self.reset_button, self.save_button, self.process_button]:
-            if button.isEnabled():
-                if button == self.reset_button:
-                    button.setStyleSheet(get_button_style(is_destructive=True))
-                elif button == self.save_button:
-                    button.setStyleSheet(get_button_style(is_primary=True))
-                else:
-                    button.setStyleSheet(get_button_style())
-            else:
-                button.setStyleSheet(get_disabled_button_style())
+        # The global style sheet greys out disabled buttons via :disabled
     
     def _load_points(self):
         """Load points from a file"""
@@ -19,12 +19,15 @@ from PySide6.QtGui import QDesktopServices
 from src.utils.logger import Logger
 from src.models.app_state import AppState
 from src.utils.settings_manager import SettingsManager
-from src.utils.ui_theme import (
-    get_group_box_style, get_label_style, get_button_style,
-    get_form_input_label_style, get_text_edit_style, get_line_edit_style,
-    get_table_style, get_checkbox_style, get_message_box_style,
-    get_dialog_background_style, get_status_background_color, get_status_text_color,
-    PRIMARY_COLOR, SECONDARY_COLOR, TEXT_PRIMARY
+from src.utils.ui_theme import PRIMARY_COLOR, SECONDARY_COLOR, TEXT_PRIMARY
+from src.constants.ui_constants import (
+    STATUS_IMPLEMENTED_BG, STATUS_COMING_SOON_BG, STATUS_TEXT_COLOR
+)
+
+# Status column text and background, indexed by whether the feature is implemented
+_FEATURE_STATUS = (
+    ("Coming Soon", STATUS_COMING_SOON_BG),
+    ("Implemented", STATUS_IMPLEMENTED_BG),
 )
 
 class ComingSoonTab(QWidget):
@@ -58,7 +61,7 @@ class ComingSoonTab(QWidget):
         
         # Create title section
         title_group = QGroupBox("Coming Soon Features")
-        title_group.setStyleSheet(get_group_box_style(is_title_centered=True))
+        title_group.setProperty("titleCentered", True)
         title_layout = QVBoxLayout(title_group)
         
         description = QLabel(
@@ -66,7 +69,7 @@ class ComingSoonTab(QWidget):
             "You can also submit feedback or feature requests below."
         )
         description.setWordWrap(True)
-        description.setStyleSheet(get_label_style(is_description=True))
+        description.setProperty("variant", "description")
         description.setAlignment(Qt.AlignCenter)
         title_layout.addWidget(description)
         
@@ -78,7 +81,6 @@ class ComingSoonTab(QWidget):
         # Left side: Features table (70%)
         feature_buttons_layout = self._setup_features_table()
         features_group = QGroupBox("Upcoming Features")
-        features_group.setStyleSheet(get_group_box_style())
         features_layout = QVBoxLayout(features_group)
         features_layout.addWidget(self.features_table)
         features_layout.addLayout(feature_buttons_layout)
@@ -87,19 +89,17 @@ class ComingSoonTab(QWidget):
         # Right side: Feedback form (30%)
         self._setup_feedback_form()
         feedback_group = QGroupBox("")
-        feedback_group.setStyleSheet(get_group_box_style())
         feedback_layout = QVBoxLayout(feedback_group)
         feedback_layout.addLayout(self.feedback_form)
         
         # Add submit button to feedback form
         self.submit_button = QPushButton("Submit Feedback")
-        self.submit_button.setStyleSheet(get_button_style(is_primary=True))
+        self.submit_button.setProperty("primary", True)
         self.submit_button.clicked.connect(self._submit_feedback)
         feedback_layout.addWidget(self.submit_button)
         
         # Add reset button
         self.reset_button = QPushButton("Reset Form")
-        self.reset_button.setStyleSheet(get_button_style())
         self.reset_button.clicked.connect(self._reset_form)
         feedback_layout.addWidget(self.reset_button)
         
@@ -110,14 +110,12 @@ class ComingSoonTab(QWidget):
         
         # Add resources section at the bottom
         resources_group = QGroupBox("Additional Resources")
-        resources_group.setStyleSheet(get_group_box_style())
         resources_layout = QVBoxLayout(resources_group)
         
         resources_description = QLabel(
             "Check out these resources for more information about the Tennis Ball Tracker project:"
         )
         resources_description.setWordWrap(True)
-        resources_description.setStyleSheet(get_label_style())
         resources_layout.addWidget(resources_description)
         
         # Resources buttons layout
@@ -125,19 +123,16 @@ class ComingSoonTab(QWidget):
         
         # Documentation button
         docs_button = QPushButton("Documentation")
-        docs_button.setStyleSheet(get_button_style())
         docs_button.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://pk2381.pythonanywhere.com/animation/underconstruction/")))
         resources_buttons.addWidget(docs_button)
         
         # GitHub button
         github_button = QPushButton("GitHub Repository")
-        github_button.setStyleSheet(get_button_style())
         github_button.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://pk2381.pythonanywhere.com/animation/underconstruction/")))
         resources_buttons.addWidget(github_button)
         
         # Support button
         support_button = QPushButton("Support")
-        support_button.setStyleSheet(get_button_style())
         support_button.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://pk2381.pythonanywhere.com/animation/underconstruction/")))
         resources_buttons.addWidget(support_button)
         
@@ -147,7 +142,6 @@ class ComingSoonTab(QWidget):
     def _setup_features_table(self):
         """Set up the features table"""
         self.features_table = QTableWidget(0, 4)
-        self.features_table.setStyleSheet(get_table_style())
         
         # Set headers
         self.features_table.setHorizontalHeaderLabels(["Feature", "Description", "Version", "Status"])
@@ -163,23 +157,21 @@ class ComingSoonTab(QWidget):
         feature_buttons_layout = QHBoxLayout()
         
         self.add_feature_button = QPushButton("Add Feature")
-        self.add_feature_button.setStyleSheet(get_button_style(is_primary=True))
+        self.add_feature_button.setProperty("primary", True)
         self.add_feature_button.clicked.connect(self._add_feature_dialog)
         feature_buttons_layout.addWidget(self.add_feature_button)
         
         self.edit_feature_button = QPushButton("Edit Feature")
-        self.edit_feature_button.setStyleSheet(get_button_style())
         self.edit_feature_button.clicked.connect(self._edit_feature_dialog)
         feature_buttons_layout.addWidget(self.edit_feature_button)
         
         self.delete_feature_button = QPushButton("Delete Feature")
-        self.delete_feature_button.setStyleSheet(get_button_style())
         self.delete_feature_button.clicked.connect(self._delete_feature)
         feature_buttons_layout.addWidget(self.delete_feature_button)
         
         # Add save button
         self.save_button = QPushButton("Save Features")
-        self.save_button.setStyleSheet(get_button_style(is_primary=True))
+        self.save_button.setProperty("primary", True)
         self.save_button.clicked.connect(self._save_features)
         feature_buttons_layout.addWidget(self.save_button)
         
@@ -204,13 +196,13 @@ class ComingSoonTab(QWidget):
         version_item.setTextAlignment(Qt.AlignCenter)
         self.features_table.setItem(row, 2, version_item)
         
-        status_text = "Implemented" if implemented else "Coming Soon"
+        status_text, status_background = _FEATURE_STATUS[bool(implemented)]
         status_item = QTableWidgetItem(status_text)
         status_item.setTextAlignment(Qt.AlignCenter)
         
         # Set background and text color based on status
-        status_item.setBackground(get_status_background_color(implemented))
-        status_item.setForeground(get_status_text_color())
+        status_item.setBackground(status_background)
+        status_item.setForeground(STATUS_TEXT_COLOR)
             
         self.features_table.setItem(row, 3, status_item)
     
@@ -221,23 +213,21 @@ class ComingSoonTab(QWidget):
         
         # Name field
         name_label = QLabel("Name:")
-        name_label.setStyleSheet(get_form_input_label_style())
+        name_label.setProperty("variant", "formInput")
         self.name_input = QLineEdit()
-        self.name_input.setStyleSheet(get_line_edit_style())
         self.name_input.setPlaceholderText("Your name")
         self.feedback_form.addRow(name_label, self.name_input)
         
         # Email field
         email_label = QLabel("Email:")
-        email_label.setStyleSheet(get_form_input_label_style())
+        email_label.setProperty("variant", "formInput")
         self.email_input = QLineEdit()
-        self.email_input.setStyleSheet(get_line_edit_style())
         self.email_input.setPlaceholderText("Your email address")
         self.feedback_form.addRow(email_label, self.email_input)
         
         # Feedback type
         feedback_type_label = QLabel("Feedback Type:")
-        feedback_type_label.setStyleSheet(get_form_input_label_style())
+        feedback_type_label.setProperty("variant", "formInput")
         
         # Create checkboxes in a container
         feedback_type_container = QWidget()
@@ -246,24 +236,20 @@ class ComingSoonTab(QWidget):
         feedback_type_layout.setSpacing(5)
         
         self.feature_request_checkbox = QCheckBox("Feature Request")
-        self.feature_request_checkbox.setStyleSheet(get_checkbox_style())
         feedback_type_layout.addWidget(self.feature_request_checkbox)
         
         self.bug_report_checkbox = QCheckBox("Bug Report")
-        self.bug_report_checkbox.setStyleSheet(get_checkbox_style())
         feedback_type_layout.addWidget(self.bug_report_checkbox)
         
         self.improvement_checkbox = QCheckBox("Improvement Suggestion")
-        self.improvement_checkbox.setStyleSheet(get_checkbox_style())
         feedback_type_layout.addWidget(self.improvement_checkbox)
         
         self.feedback_form.addRow(feedback_type_label, feedback_type_container)
         
         # Feedback content
         feedback_label = QLabel("Feedback:")
-        feedback_label.setStyleSheet(get_form_input_label_style())
+        feedback_label.setProperty("variant", "formInput")
         self.feedback_input = QTextEdit()
-        self.feedback_input.setStyleSheet(get_text_edit_style())
         self.feedback_input.setPlaceholderText("Please describe your feedback, feature request or issue in detail")
         self.feedback_input.setMinimumHeight(150)
         self.feedback_form.addRow(feedback_label, self.feedback_input)
@@ -273,7 +259,6 @@ class ComingSoonTab(QWidget):
         # Check if required fields are filled
         if not self.name_input.text() or not self.email_input.text() or not self.feedback_input.toPlainText():
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Warning)
             message_box.setWindowTitle("Missing Information")
             message_box.setText("Please fill in all required fields (Name, Email, and Feedback).")
@@ -285,7 +270,6 @@ class ComingSoonTab(QWidget):
                 self.bug_report_checkbox.isChecked() or 
                 self.improvement_checkbox.isChecked()):
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Warning)
             message_box.setWindowTitle("Missing Information")
             message_box.setText("Please select at least one feedback type.")
@@ -297,7 +281,6 @@ class ComingSoonTab(QWidget):
         self.logger.info(f"Feedback submitted by {self.name_input.text()}")
         
         message_box = QMessageBox()
-        message_box.setStyleSheet(get_message_box_style())
         message_box.setIcon(QMessageBox.Information)
         message_box.setWindowTitle("Feedback Submitted")
         message_box.setText("Thank you for your feedback! Your input helps us improve the application.")
@@ -319,7 +302,6 @@ class ComingSoonTab(QWidget):
         """Show dialog to add a new feature"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Add New Feature")
-        dialog.setStyleSheet(get_dialog_background_style())
         dialog.setMinimumWidth(400)
         
         layout = QVBoxLayout(dialog)
@@ -330,34 +312,30 @@ class ComingSoonTab(QWidget):
         
         # Feature name field
         name_label = QLabel("Feature Name:")
-        name_label.setStyleSheet(get_form_input_label_style())
+        name_label.setProperty("variant", "formInput")
         self.new_feature_name = QLineEdit()
-        self.new_feature_name.setStyleSheet(get_line_edit_style())
         self.new_feature_name.setPlaceholderText("Enter feature name")
         form.addRow(name_label, self.new_feature_name)
         
         # Description field
         desc_label = QLabel("Description:")
-        desc_label.setStyleSheet(get_form_input_label_style())
+        desc_label.setProperty("variant", "formInput")
         self.new_feature_desc = QTextEdit()
-        self.new_feature_desc.setStyleSheet(get_text_edit_style())
         self.new_feature_desc.setPlaceholderText("Enter feature description")
         self.new_feature_desc.setMinimumHeight(100)
         form.addRow(desc_label, self.new_feature_desc)
         
         # Version field
         version_label = QLabel("Version:")
-        version_label.setStyleSheet(get_form_input_label_style())
+        version_label.setProperty("variant", "formInput")
         self.new_feature_version = QLineEdit()
-        self.new_feature_version.setStyleSheet(get_line_edit_style())
         self.new_feature_version.setPlaceholderText("e.g., v1.0")
         form.addRow(version_label, self.new_feature_version)
         
         # Implemented status
         status_label = QLabel("Status:")
-        status_label.setStyleSheet(get_form_input_label_style())
+        status_label.setProperty("variant", "formInput")
         self.new_feature_implemented = QCheckBox("Implemented")
-        self.new_feature_implemented.setStyleSheet(get_checkbox_style())
         form.addRow(status_label, self.new_feature_implemented)
         
         layout.addLayout(form)
@@ -367,12 +345,10 @@ class ComingSoonTab(QWidget):
         button_box.accepted.connect(lambda: self._save_new_feature(dialog))
         button_box.rejected.connect(dialog.reject)
         
-        # Style the buttons
+        # Mark the accept button as the primary action
         for button in button_box.buttons():
             if button_box.buttonRole(button) == QDialogButtonBox.AcceptRole:
-                button.setStyleSheet(get_button_style(is_primary=True))
-            else:
-                button.setStyleSheet(get_button_style())
+                button.setProperty("primary", True)
         
         layout.addWidget(button_box)
         
@@ -388,7 +364,6 @@ class ComingSoonTab(QWidget):
         
         if not name or not desc or not version:
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Warning)
             message_box.setWindowTitle("Missing Information")
             message_box.setText("Please fill in all fields.")
@@ -407,7 +382,6 @@ class ComingSoonTab(QWidget):
         selected_rows = self.features_table.selectedItems()
         if not selected_rows:
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Information)
             message_box.setWindowTitle("Selection Required")
             message_box.setText("Please select a feature to edit.")
@@ -426,7 +400,6 @@ class ComingSoonTab(QWidget):
         # Create dialog
         dialog = QDialog(self)
         dialog.setWindowTitle("Edit Feature")
-        dialog.setStyleSheet(get_dialog_background_style())
         dialog.setMinimumWidth(400)
         
         layout = QVBoxLayout(dialog)
@@ -437,32 +410,28 @@ class ComingSoonTab(QWidget):
         
         # Feature name field
         name_label = QLabel("Feature Name:")
-        name_label.setStyleSheet(get_form_input_label_style())
+        name_label.setProperty("variant", "formInput")
         self.edit_feature_name = QLineEdit(name)
-        self.edit_feature_name.setStyleSheet(get_line_edit_style())
         form.addRow(name_label, self.edit_feature_name)
         
         # Description field
         desc_label = QLabel("Description:")
-        desc_label.setStyleSheet(get_form_input_label_style())
+        desc_label.setProperty("variant", "formInput")
         self.edit_feature_desc = QTextEdit()
-        self.edit_feature_desc.setStyleSheet(get_text_edit_style())
         self.edit_feature_desc.setPlainText(desc)
         self.edit_feature_desc.setMinimumHeight(100)
         form.addRow(desc_label, self.edit_feature_desc)
         
         # Version field
         version_label = QLabel("Version:")
-        version_label.setStyleSheet(get_form_input_label_style())
+        version_label.setProperty("variant", "formInput")
         self.edit_feature_version = QLineEdit(version)
-        self.edit_feature_version.setStyleSheet(get_line_edit_style())
         form.addRow(version_label, self.edit_feature_version)
         
         # Implemented status
         status_label = QLabel("Status:")
-        status_label.setStyleSheet(get_form_input_label_style())
+        status_label.setProperty("variant", "formInput")
         self.edit_feature_implemented = QCheckBox("Implemented")
-        self.edit_feature_implemented.setStyleSheet(get_checkbox_style())
         self.edit_feature_implemented.setChecked(implemented)
         form.addRow(status_label, self.edit_feature_implemented)
         
@@ -473,12 +442,10 @@ class ComingSoonTab(QWidget):
         button_box.accepted.connect(lambda: self._update_feature(row, dialog))
         button_box.rejected.connect(dialog.reject)
         
-        # Style the buttons
+        # Mark the accept button as the primary action
         for button in button_box.buttons():
             if button_box.buttonRole(button) == QDialogButtonBox.AcceptRole:
-                button.setStyleSheet(get_button_style(is_primary=True))
-            else:
-                button.setStyleSheet(get_button_style())
+                button.setProperty("primary", True)
         
         layout.addWidget(button_box)
         
@@ -494,7 +461,6 @@ class ComingSoonTab(QWidget):
         
         if not name or not desc or not version:
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Warning)
             message_box.setWindowTitle("Missing Information")
             message_box.setText("Please fill in all fields.")
@@ -507,10 +473,11 @@ class ComingSoonTab(QWidget):
         self.features_table.item(row, 2).setText(version)
         
         # Update status text, background, and foreground color
-        status_text = "Implemented" if implemented else "Coming Soon"
-        self.features_table.item(row, 3).setText(status_text)
-        self.features_table.item(row, 3).setBackground(get_status_background_color(implemented))
-        self.features_table.item(row, 3).setForeground(get_status_text_color())
+        status_text, status_background = _FEATURE_STATUS[bool(implemented)]
+        status_item = self.features_table.item(row, 3)
+        status_item.setText(status_text)
+        status_item.setBackground(status_background)
+        status_item.setForeground(STATUS_TEXT_COLOR)
         
         # Close the dialog
         dialog.accept()
@@ -521,7 +488,6 @@ class ComingSoonTab(QWidget):
         selected_rows = self.features_table.selectedItems()
         if not selected_rows:
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Information)
             message_box.setWindowTitle("Selection Required")
             message_box.setText("Please select a feature to delete.")
@@ -533,7 +499,6 @@ class ComingSoonTab(QWidget):
         
         # Confirm deletion
         message_box = QMessageBox()
-        message_box.setStyleSheet(get_message_box_style())
         message_box.setIcon(QMessageBox.Question)
         message_box.setWindowTitle("Confirm Deletion")
         message_box.setText(f"Are you sure you want to delete the feature '{self.features_table.item(row, 0).text()}'?")
@@ -574,7 +539,6 @@ class ComingSoonTab(QWidget):
             
             # Show success message
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Information)
             message_box.setWindowTitle("Features Saved")
             message_box.setText("Features have been saved successfully.")
@@ -584,7 +548,6 @@ class ComingSoonTab(QWidget):
         except Exception as e:
             # Show error message
             message_box = QMessageBox()
-            message_box.setStyleSheet(get_message_box_style())
             message_box.setIcon(QMessageBox.Critical)
             message_box.setWindowTitle("Error")
             message_box.setText(f"Failed to save features: {str(e)}")
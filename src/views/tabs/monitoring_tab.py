@@ -30,14 +30,13 @@ from src.controllers.ball_detection_controller import BallDetectionController
 from src.utils.logger import Logger
 from src.utils.settings_manager import SettingsManager
 from src.utils.ui_theme import (
-    get_group_box_style, get_label_style, get_button_style, 
-    get_combobox_style, get_separator_style, get_message_box_style,
-    get_camera_image_style
+    get_combobox_style, get_separator_style,
+    get_message_box_style, get_camera_image_style
 )
 from src.constants.ui_constants import (
     PRIMARY_COLOR, SUCCESS_COLOR, ERROR_COLOR, WARNING_COLOR, 
-    INFO_COLOR, BG_LIGHT, TEXT_PRIMARY, BORDER_DARK,
-    STATUS_STYLE_BASE, STATUS_NOT_DETECTED, STATUS_IN, STATUS_OUT,
+    INFO_COLOR, BG_LIGHT, BORDER_DARK,
+    STATUS_STYLE_BASE, STATUS_IN, STATUS_OUT,
     STATUS_OUT_OF_BOUNDS, STATUS_IN_SERVICE, STATUS_FAULT,
     DEFAULT_FRAME_IMAGE_PATH, CAMERA_FRAME_WIDTH, CAMERA_FRAME_HEIGHT,
     CAMERA_IMAGE_WIDTH, CAMERA_IMAGE_HEIGHT, RESIZE_TIMER_DELAY,
@@ -165,14 +164,12 @@ class MonitoringTab(QWidget):
             
             # Create group box and layout
             self.group_box = QGroupBox(group_title)
-            self.group_box.setStyleSheet(get_group_box_style())
             self.layout = QVBoxLayout(self.group_box)
             self.layout.setContentsMargins(10, 25, 10, 10)
             
             # Camera title
             title_label = QLabel(title)
             title_label.setAlignment(Qt.AlignCenter)
-            title_label.setStyleSheet(get_label_style())
             self.layout.addWidget(title_label)
             
             # Add image container to the layout
@@ -181,7 +178,7 @@ class MonitoringTab(QWidget):
             # FPS counter
             self.fps_label = QLabel("0/0 fps")
             self.fps_label.setAlignment(Qt.AlignRight)
-            self.fps_label.setStyleSheet(f"color: {TEXT_PRIMARY.name()}; font-size: 12px; padding: 5px;")
+            self.fps_label.setProperty("variant", "fps")
             self.layout.addWidget(self.fps_label)
             
             # Load the frame background
@@ -233,14 +230,12 @@ class MonitoringTab(QWidget):
         
         # Ball detection toggle button
         self.detection_button = QPushButton("Start Ball Detection")
-        self.detection_button.setStyleSheet(get_button_style())
         self.detection_button.clicked.connect(self._toggle_ball_detection)
         detection_controls.addWidget(self.detection_button)
         
         # Detection processing info label
         self.detection_info_label = QLabel("Detection inactive")
         self.detection_info_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.detection_info_label.setStyleSheet(get_label_style())
         detection_controls.addWidget(self.detection_info_label)
         
         left_camera_view.layout.addLayout(detection_controls)
@@ -267,7 +262,7 @@ class MonitoringTab(QWidget):
             "Connect to the FPGA or use the simulation button to see data."
         )
         explanation_label.setWordWrap(True)
-        explanation_label.setStyleSheet(get_label_style(is_description=True))
+        explanation_label.setProperty("variant", "description")
         explanation_layout.addWidget(explanation_label)
         
         # Add explanation container after the image
@@ -281,19 +276,17 @@ class MonitoringTab(QWidget):
         # Status label
         self.ball_status_label = QLabel("Not Detected")
         self.ball_status_label.setAlignment(Qt.AlignCenter)
-        self.ball_status_label.setStyleSheet(STATUS_NOT_DETECTED)
+        self.ball_status_label.setProperty("ballStatus", "notDetected")
         info_grid.addWidget(self.ball_status_label, 0, 0, 1, 2)
         
         # Position label
         self.ball_position_label = QLabel("X: 0.00, Y: 0.00, Z: 0.00")
         self.ball_position_label.setAlignment(Qt.AlignCenter)
-        self.ball_position_label.setStyleSheet(get_label_style())
         info_grid.addWidget(self.ball_position_label, 1, 0, 1, 2)
         
         # Detection confidence label
         self.detection_confidence_label = QLabel("Confidence: 0.00")
         self.detection_confidence_label.setAlignment(Qt.AlignCenter)
-        self.detection_confidence_label.setStyleSheet(get_label_style())
         info_grid.addWidget(self.detection_confidence_label, 2, 0, 1, 2)
         
         right_camera_view.layout.addLayout(info_grid)
@@ -307,7 +300,6 @@ class MonitoringTab(QWidget):
         
         # Simulation button
         self.simulation_button = QPushButton("Start Simulation")
-        self.simulation_button.setStyleSheet(get_button_style())
         self.simulation_button.clicked.connect(self._toggle_simulation)
         right_camera_view.layout.addWidget(self.simulation_button)
         
@@ -596,7 +588,7 @@ class MonitoringTab(QWidget):
             # Place instruction label below images
             instruction_label = QLabel("Please use File > Open Image Folder to load tennis match images.", self)
             instruction_label.setAlignment(Qt.AlignCenter)
-            instruction_label.setStyleSheet(f"{get_label_style(is_description=True)} font-size: 14px; padding: 10px; margin: 10px;")
+            instruction_label.setProperty("variant", "instruction")
             instruction_label.setWordWrap(True)
             
             # Add the label to the main area
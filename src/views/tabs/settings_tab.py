@@ -14,11 +14,6 @@ from PySide6.QtCore import Qt, Slot, Signal
 from src.utils.settings_manager import SettingsManager
 from src.utils.logger import Logger
 from src.models.app_state import AppState
-from src.utils.ui_theme import (
-    get_group_box_style, get_label_style, get_button_style, 
-    get_checkbox_style, get_slider_style, get_spinbox_style,
-    get_form_input_label_style, get_message_box_style, get_separator_style
-)
 from src.constants.ui_constants import WINDOW_SIZE_PRESETS
 
 class SettingsTab(QWidget):
@@ -78,7 +73,7 @@ class SettingsTab(QWidget):
         # Create a grouped section for title and description
         title_group = QGroupBox("Tennis Ball Tracker Settings")
         title_group.setObjectName("titleGroup")
-        title_group.setStyleSheet(get_group_box_style(is_title_centered=True))
+        title_group.setProperty("titleCentered", True)
         
         title_layout = QVBoxLayout(title_group)
         title_layout.setContentsMargins(15, 20, 15, 15)
@@ -92,7 +87,7 @@ class SettingsTab(QWidget):
         description_label = QLabel(description_text)
         description_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         description_label.setWordWrap(True)
-        description_label.setStyleSheet(get_label_style(is_description=True))
+        description_label.setProperty("variant", "description")
         
         title_layout.addWidget(description_label)
         self.layout.addWidget(title_group)
@@ -100,7 +95,6 @@ class SettingsTab(QWidget):
     def setup_playback_settings(self):
         """Set up the playback settings group"""
         playback_group = QGroupBox("Playback Settings")
-        playback_group.setStyleSheet(get_group_box_style())
         
         playback_layout = QFormLayout(playback_group)
         playback_layout.setContentsMargins(15, 20, 15, 15)
@@ -113,13 +107,12 @@ class SettingsTab(QWidget):
         speed_slider.setRange(10, 300)  # 10-300 as slider range (will be scaled to 10-3000)
         speed_slider.setTickPosition(QSlider.TicksBelow)
         speed_slider.setTickInterval(30)
-        speed_slider.setStyleSheet(get_slider_style())
+        speed_slider.setProperty("styleRole", "settingsSlider")
         self.ui_components["speed_slider"] = speed_slider
         
         speed_spinbox = QSpinBox()
         speed_spinbox.setRange(10, 3000)
         speed_spinbox.setSuffix(" fps")
-        speed_spinbox.setStyleSheet(get_spinbox_style())
         self.ui_components["speed_spinbox"] = speed_spinbox
         
         # Connect slider and spinbox
@@ -131,19 +124,17 @@ class SettingsTab(QWidget):
         speed_layout.addWidget(speed_spinbox)
         
         speed_label = QLabel("Playback Speed:")
-        speed_label.setStyleSheet(get_form_input_label_style())
+        speed_label.setProperty("variant", "formInput")
         playback_layout.addRow(speed_label, speed_layout)
         
         # Auto-play on load
         autoplay_checkbox = QCheckBox("Auto-play when loading images")
-        autoplay_checkbox.setStyleSheet(get_checkbox_style())
         autoplay_checkbox.toggled.connect(self.on_autoplay_toggled)
         self.ui_components["autoplay_checkbox"] = autoplay_checkbox
         playback_layout.addRow("", autoplay_checkbox)
         
         # Loop playback
         loop_checkbox = QCheckBox("Loop playback")
-        loop_checkbox.setStyleSheet(get_checkbox_style())
         loop_checkbox.toggled.connect(self.on_loop_toggled)
         self.ui_components["loop_checkbox"] = loop_checkbox
         playback_layout.addRow("", loop_checkbox)
@@ -154,7 +145,6 @@ class SettingsTab(QWidget):
     def setup_data_storage_settings(self):
         """Set up the data storage settings group"""
         storage_group = QGroupBox("Data Storage Settings")
-        storage_group.setStyleSheet(get_group_box_style())
         
         storage_layout = QFormLayout(storage_group)
         storage_layout.setContentsMargins(15, 20, 15, 15)
@@ -165,11 +155,9 @@ class SettingsTab(QWidget):
         data_dir_edit = QLabel()
         data_dir_edit.setFrameStyle(QLabel.StyledPanel | QLabel.Sunken)
         data_dir_edit.setMinimumWidth(300)
-        data_dir_edit.setStyleSheet(get_label_style())
         self.ui_components["data_dir_edit"] = data_dir_edit
         
         browse_button = QPushButton("Browse...")
-        browse_button.setStyleSheet(get_button_style())
         browse_button.clicked.connect(self.on_browse_data_dir)
         self.ui_components["browse_button"] = browse_button
         
@@ -177,12 +165,11 @@ class SettingsTab(QWidget):
         data_dir_layout.addWidget(browse_button)
         
         dir_label = QLabel("Default Data Directory:")
-        dir_label.setStyleSheet(get_form_input_label_style())
+        dir_label.setProperty("variant", "formInput")
         storage_layout.addRow(dir_label, data_dir_layout)
         
         # Auto-save Results
         autosave_checkbox = QCheckBox("Auto-save analysis results")
-        autosave_checkbox.setStyleSheet(get_checkbox_style())
         autosave_checkbox.toggled.connect(self.on_autosave_toggled)
         self.ui_components["autosave_checkbox"] = autosave_checkbox
         storage_layout.addRow("", autosave_checkbox)
@@ -197,14 +184,13 @@ class SettingsTab(QWidget):
         # Reset button
         reset_button = QPushButton("Reset to Defaults")
         reset_button.clicked.connect(self.on_reset_settings)
-        reset_button.setStyleSheet(get_button_style())
         self.ui_components["reset_button"] = reset_button
         
         # Apply button
         apply_button = QPushButton("Apply Settings")
         apply_button.clicked.connect(self.on_apply_settings)
         apply_button.setEnabled(False)
-        apply_button.setStyleSheet(get_button_style(is_primary=True))
+        apply_button.setProperty("primary", True)
         self.ui_components["apply_button"] = apply_button
         
         button_layout.addStretch()
@@ -328,7 +314,6 @@ class SettingsTab(QWidget):
         msg_box.setText("Are you sure you want to reset all settings to default values?")
         msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         msg_box.setDefaultButton(QMessageBox.No)
-        msg_box.setStyleSheet(get_message_box_style())
         
         if msg_box.exec() == QMessageBox.Yes:
             self.settings_manager.reset_to_defaults()
@@ -340,7 +325,6 @@ class SettingsTab(QWidget):
             success_box = QMessageBox()
             success_box.setWindowTitle("Settings Reset")
             success_box.setText("All settings have been reset to default values.")
-            success_box.setStyleSheet(get_message_box_style())
             success_box.exec()
     
     def on_apply_settings(self):
@@ -362,7 +346,6 @@ class SettingsTab(QWidget):
             success_box = QMessageBox()
             success_box.setWindowTitle("Settings Saved")
             success_box.setText("Settings have been successfully applied and saved.")
-            success_box.setStyleSheet(get_message_box_style())
             success_box.exec()
             
         except Exception as e:
@@ -371,7 +354,6 @@ class SettingsTab(QWidget):
             error_box.setWindowTitle("Error")
             error_box.setText(f"Error applying settings: {str(e)}")
             error_box.setIcon(QMessageBox.Critical)
-            error_box.setStyleSheet(get_message_box_style())
             error_box.exec()
     
     def _collect_current_settings(self):
@@ -13,9 +13,6 @@ from PySide6.QtGui import QPixmap
 
 from src.controllers.fpga_connection_manager import FpgaConnectionManager, FpgaSettingsDialog
 from src.utils.logger import Logger
-from src.utils.ui_theme import (
-    get_button_style, get_combobox_style, get_label_style, get_group_box_style
-)
 from src.constants.ui_constants import (
     CONNECTION_STATUS_RED_STYLE,
     CONNECTION_STATUS_GREEN_STYLE
@@ -69,7 +66,6 @@ class FpgaConnectionPanel(QWidget):
         
         # Create group box
         self.group_box = QGroupBox("FPGA Connection")
-        self.group_box.setStyleSheet(get_group_box_style())
         
         # Connection grid layout - using horizontal layout to reduce height
         connection_layout = QHBoxLayout()
@@ -82,17 +78,14 @@ class FpgaConnectionPanel(QWidget):
         
         # COM port dropdown with label
         port_label = QLabel("Port:")
-        port_label.setStyleSheet(get_label_style())
         port_layout.addWidget(port_label)
         
         self.com_port_combo = QComboBox()
-        self.com_port_combo.setStyleSheet(get_combobox_style())
         self.com_port_combo.setMaximumWidth(100)  # Limit width
         port_layout.addWidget(self.com_port_combo)
         
         # Refresh button
         self.refresh_button = QPushButton("↻")  # Using symbol to save space
-        self.refresh_button.setStyleSheet(get_button_style())
         self.refresh_button.setMaximumWidth(30)  # Make button compact
         self.refresh_button.setToolTip("Refresh Ports")
         self.refresh_button.clicked.connect(self._refresh_port_list)
@@ -113,13 +106,11 @@ class FpgaConnectionPanel(QWidget):
         
         # Connect/Disconnect button
         self.connect_button = QPushButton("Connect")
-        self.connect_button.setStyleSheet(get_button_style())
         self.connect_button.clicked.connect(self._toggle_connection)
         button_layout.addWidget(self.connect_button)
         
         # Settings button
         self.settings_button = QPushButton("⚙")  # Using symbol to save space
-        self.settings_button.setStyleSheet(get_button_style())
         self.settings_button.setMaximumWidth(30)  # Make button compact
         self.settings_button.setToolTip("FPGA Settings")
         self.settings_button.clicked.connect(self._show_settings_dialog)
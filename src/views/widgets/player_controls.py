@@ -18,10 +18,7 @@ import logging
 from src.models.app_state import AppState
 from src.utils.logger import Logger
 from src.utils.settings_manager import SettingsManager
-from src.utils.ui_theme import (
-    get_player_button_style, get_speed_button_style, get_player_slider_style,
-    get_button_style, get_combobox_style
-)
+from src.utils.ui_theme import get_button_style, get_combobox_style
 from src.constants.ui_constants import (
     WHITE_TEXT_STYLE,
     SEPARATOR_STYLE,
@@ -110,7 +107,7 @@ class PlayerControls(QWidget):
         # Time slider
         self.time_slider = QSlider(Qt.Horizontal)
         self.time_slider.setRange(0, 100)
-        self.time_slider.setStyleSheet(get_player_slider_style())
+        self.time_slider.setProperty("styleRole", "playerSlider")
         self.logger.debug(f"Time slider initialized: range=0-100")
         time_layout.addWidget(self.time_slider)
         
@@ -152,7 +149,7 @@ class PlayerControls(QWidget):
         # Add buttons to layout with fixed size and icon size
         for btn in [self.rewind_btn, self.prev_frame_btn, self.play_pause_btn, 
                     self.stop_btn, self.next_frame_btn, self.forward_btn]:
-            btn.setStyleSheet(get_player_button_style())
+            btn.setProperty("styleRole", "playerButton")
             btn.setFixedSize(45, 45)
             btn.setIconSize(QSize(24, 24))
             controls_layout.addWidget(btn)
@@ -185,7 +182,7 @@ class PlayerControls(QWidget):
         preset_layout.setSpacing(5)
         for preset_name, preset_fps in self.SPEED_PRESETS.items():
             speed_btn = QPushButton(preset_name)
-            speed_btn.setStyleSheet(get_speed_button_style())
+            speed_btn.setProperty("styleRole", "speedButton")
             speed_btn.clicked.connect(lambda checked, fps=preset_fps: self.set_speed_preset(fps))
             speed_btn.setToolTip(f"{preset_name} speed: {preset_fps} fps")
             preset_layout.addWidget(speed_btn)
@@ -203,7 +200,7 @@ class PlayerControls(QWidget):
         # Set initial value (slider value corresponding to 1000 fps)
         initial_slider_value = self.fps_to_slider_value(self.DEFAULT_FPS)
         self.speed_slider.setValue(initial_slider_value)
-        self.speed_slider.setStyleSheet(get_player_slider_style())
+        self.speed_slider.setProperty("styleRole", "playerSlider")
         speed_layout.addWidget(self.speed_slider)
         
         # Add speed display
@@ -42,10 +42,17 @@ class TestTennisTrackerApp:
     def test_init(self, mock_singletons, mock_main_window):
         """Test initialization of the application."""
         # Create instance
-        with patch.object(QApplication, '__init__', return_value=None):
+        with patch.object(QApplication, '__init__', return_value=None), \
+             patch('src.views.app.apply_dark_theme') as mock_apply_theme, \
+             patch('src.views.app.QTimer') as mock_timer, \
+             patch.object(TennisTrackerApp, 'aboutToQuit') as mock_about_to_quit:
             app = TennisTrackerApp(sys.argv)
         
-        # Verify singletons were initialized
+        # Verify only the logger is created eagerly
+        mock_singletons['image_manager'].assert_not_called()
+        mock_singletons['settings_manager'].assert_not_called()
+        
+        # Verify singletons are available on access
         assert app.logger is not None
         assert app.settings_manager is not None
         assert app.image_manager is not None
@@ -57,25 +64,31 @@ class TestTennisTrackerApp:
         assert app.organizationName() == "Tennis Tracker Team"
         assert app.organizationDomain() == "example.com"
         
-        # Verify main window was created and shown
+        # Verify the global theme was applied once to the application
+        mock_apply_theme.assert_called_once_with(app)
+        
+        # Verify shutdown logging is connected to aboutToQuit
+        mock_about_to_quit.connect.assert_called_once_with(app._on_about_to_quit)
+        
+        # Verify main window creation was deferred to the event loop
+        mock_timer.singleShot.assert_called_once_with(0, app._create_main_window)
+        mock_main_window.assert_not_called()
+        
+        # Verify main window was created and shown once the timer fires
+        app._create_main_window()
         mock_main_window.assert_called_once()
         mock_main_window.return_value.show.assert_called_once()
+        assert app.main_window is mock_main_window.return_value
     
-    def test_close_event(self, mock_singletons, mock_main_window):
-        """Test handling of close events."""
-        # Create event mock
-        event_mock = MagicMock()
-        
+    def test_about_to_quit(self, mock_singletons, mock_main_window):
+        """Test handling of application shutdown."""
         # Mock app instead of creating a real instance
         with patch('src.views.app.TennisTrackerApp', spec=TennisTrackerApp) as MockApp:
             app = MockApp.return_value
             app.logger = mock_singletons['logger'].return_value
             
-            # Call closeEvent directly
-            TennisTrackerApp.closeEvent(app, event_mock)
-            
-            # Verify event was accepted
-            event_mock.accept.assert_called_once()
+            # Call the aboutToQuit handler directly
+            TennisTrackerApp._on_about_to_quit(app)
             
             # Verify logger logged shutdown
-            app.logger.info.assert_called_with("Application shutting down...") 
\ No newline at end of file
+            app.logger.info.assert_called_with("Application shutting down...")
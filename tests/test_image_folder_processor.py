@@ -0,0 +1,104 @@
+"""
+Tests for the FolderProcessWorker class.
+"""
+
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from PIL import Image
+
+from src.controllers.image_folder_processor import FolderProcessWorker
+from src.utils.logger import Logger
+
+class TestFolderProcessWorker:
+    """Test the image folder processing worker."""
+    
+    @pytest.fixture
+    def mock_logger(self):
+        """Mock the logger used by the worker."""
+        with patch.object(Logger, 'instance', return_value=MagicMock()):
+            yield
+    
+    @pytest.fixture
+    def image_folder(self, tmp_path):
+        """Create a folder with two left and two right camera images."""
+        return self._make_image_folder(tmp_path)
+    
+    def _make_image_folder(self, path):
+        """Write two left and two right camera images into a folder."""
+        path.mkdir(exist_ok=True)
+        for i in range(2):
+            for side in ("left", "right"):
+                Image.new("RGB", (560, 420)).save(path / f"{side}_{i}.jpg")
+        return path
+    
+    def _run(self, worker):
+        """Run the worker synchronously and return the finished arguments."""
+        results = []
+        worker.finished.connect(lambda success, result: results.append((success, result)))
+        worker.run()
+        return results[0]
+    
+    def test_process_folder(self, qapp, mock_logger, image_folder):
+        """Test that frames are copied, resized and listed in frames_info.json."""
+        worker = FolderProcessWorker(str(image_folder))
+        success, result = self._run(worker)
+        
+        assert success is True
+        assert result["total_frames"] == 2
+        
+        with open(result["json_file_path"], 'r', encoding='utf-8') as file:
+            frames = json.load(file)
+        assert frames["total_frames"] == 2
+        assert list(frames["frame_info"]) == ["1", "2"]
+        assert frames["frame_info"]["2"]["left_raw"] == "LeftCamera\\raw\\frame_0002_LeftCamera.jpg"
+        
+        raw = image_folder / "LeftCamera" / "raw" / "frame_0001_LeftCamera.jpg"
+        assert raw.read_bytes() == (image_folder / "left_0.jpg").read_bytes()
+        
+        resized = image_folder / "RightCamera" / "resize" / "frame_0002_RightCamera.jpg"
+        assert Image.open(resized).size == (373, 280)
+    
+    def test_cancel(self, qapp, mock_logger, image_folder):
+        """Test that a canceled worker stops without writing frames_info.json."""
+        worker = FolderProcessWorker(str(image_folder))
+        worker.cancel()
+        success, result = self._run(worker)
+        
+        assert success is False
+        assert result["reason"] == FolderProcessWorker.REASON_CANCELED
+        assert not (image_folder / "frames_info.json").exists()
+    
+    def test_classification_failure(self, qapp, mock_logger, tmp_path):
+        """Test that a folder with only left images is reported as unclassifiable."""
+        Image.new("RGB", (560, 420)).save(tmp_path / "left_0.jpg")
+        
+        success, result = self._run(FolderProcessWorker(str(tmp_path)))
+        
+        assert success is False
+        assert result["reason"] == FolderProcessWorker.REASON_CLASSIFICATION
+    
+    def test_scan_image_files(self, tmp_path):
+        """Test that image files are found recursively by extension."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.JPG").touch()
+        (tmp_path / "sub" / "b.bmp").touch()
+        (tmp_path / "sub" / "notes.txt").touch()
+        
+        found = FolderProcessWorker.scan_image_files(str(tmp_path))
+        
+        assert sorted(found) == sorted([str(tmp_path / "a.JPG"), str(tmp_path / "sub" / "b.bmp")])
+    
+    def test_json_without_orjson(self, qapp, mock_logger, tmp_path):
+        """Test that frames_info.json is the same when orjson is unavailable."""
+        folder = self._make_image_folder(tmp_path / "orjson")
+        success, result = self._run(FolderProcessWorker(str(folder)))
+        with open(result["json_file_path"], 'r', encoding='utf-8') as file:
+            expected = file.read()
+        
+        folder = self._make_image_folder(tmp_path / "json")
+        with patch('src.controllers.image_folder_processor.orjson', None):
+            success, result = self._run(FolderProcessWorker(str(folder)))
+        
+        with open(result["json_file_path"], 'r', encoding='utf-8') as file:
+            assert file.read() == expected
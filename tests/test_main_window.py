@@ -231,4 +231,68 @@ class TestMainWindow:
         
         # Verify monitoring tab methods were called
         main_window.monitoring_tab.update_fpga_settings.assert_called_once()
-        main_window.monitoring_tab.player_controls.update_speed.assert_called_once_with(1000) 
\ No newline at end of file
+        main_window.monitoring_tab.player_controls.update_speed.assert_called_once_with(1000)
+    
+    def test_on_process_finished(self, main_window):
+        """Test loading a folder after the processing worker succeeds."""
+        progress = MagicMock()
+        main_window._process_progress = progress
+        main_window._folder_worker = MagicMock(folder_path="/images")
+        main_window.image_manager.load_images_from_json.return_value = True
+        main_window.image_manager.get_total_images.return_value = 4
+        main_window.tab_widget.currentIndex.return_value = 0
+        
+        with patch('src.views.main_window.QMessageBox') as MockMessageBox:
+            MainWindow._on_process_finished(
+                main_window, True, {"json_file_path": "/images/frames_info.json", "total_frames": 4}
+            )
+        
+        main_window.image_manager.load_images_from_json.assert_called_once_with("/images/frames_info.json")
+        assert main_window.app_state.file_path == "/images"
+        assert main_window.app_state.total_frames == 4
+        progress.close.assert_called_once()
+        MockMessageBox.information.assert_called_once()
+        assert main_window._folder_worker is None
+    
+    def test_on_process_finished_canceled(self, main_window):
+        """Test that a canceled processing run closes the dialog without loading."""
+        progress = MagicMock()
+        main_window._process_progress = progress
+        main_window._folder_worker = MagicMock(folder_path="/images")
+        
+        with patch('src.views.main_window.QMessageBox') as MockMessageBox:
+            MainWindow._on_process_finished(main_window, False, {"reason": "canceled"})
+        
+        progress.close.assert_called_once()
+        main_window.image_manager.load_images_from_json.assert_not_called()
+        MockMessageBox.warning.assert_not_called()
+        MockMessageBox.critical.assert_not_called()
+    
+    def test_list_folder(self, tmp_path):
+        """Test listing the top level of a folder in one pass."""
+        (tmp_path / "LeftCamera").mkdir()
+        (tmp_path / "frames_info.json").touch()
+        
+        file_names, dir_names = MainWindow._list_folder(str(tmp_path))
+        
+        assert file_names == {"frames_info.json"}
+        assert dir_names == {"LeftCamera"}
+        assert MainWindow._list_folder(str(tmp_path / "missing")) is None
+    
+    def test_on_process_progress_finishes_during_set_value(self, main_window):
+        """Test that progress survives the finished handler running inside setValue."""
+        progress = MagicMock()
+        main_window._process_progress = progress
+        
+        def finish_during_set_value(value):
+            main_window._process_progress = None
+        progress.setValue.side_effect = finish_during_set_value
+        
+        MainWindow._on_process_progress(main_window, 50, "Processing images... (1/2)")
+        
+        progress.setLabelText.assert_called_once_with("Processing images... (1/2)")
+        progress.setValue.assert_called_once_with(50)
+        
+        # Progress arriving after the dialog is released is ignored
+        MainWindow._on_process_progress(main_window, 60, "Processing images... (2/2)")
+        progress.setValue.assert_called_once()
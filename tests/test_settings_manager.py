@@ -0,0 +1,94 @@
+"""
+Tests for the SettingsManager class.
+"""
+
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+
+from src.utils.settings_manager import SettingsManager
+from src.utils.logger import Logger
+
+class TestSettingsManager:
+    """Test the SettingsManager singleton class."""
+
+    @pytest.fixture
+    def home_dir(self, tmp_path):
+        """Redirect the user's home directory to a temporary path."""
+        with patch('src.utils.settings_manager.Path.home', return_value=tmp_path), \
+             patch.object(Logger, 'instance', return_value=MagicMock()):
+            yield tmp_path
+
+    @pytest.fixture
+    def settings_manager(self, home_dir):
+        """Create a fresh SettingsManager bound to the temporary home directory."""
+        original_instance = SettingsManager._instance
+        SettingsManager._instance = None
+        yield SettingsManager.instance()
+        SettingsManager._instance = original_instance
+
+    def test_missing_file_writes_defaults(self, settings_manager, home_dir):
+        """Test that a missing settings file is replaced by the defaults on first write."""
+        settings_file = home_dir / ".tennis_tracker" / "settings.json"
+        assert settings_file.exists()
+
+        with open(settings_file, 'r', encoding='utf-8') as file:
+            saved = json.load(file)
+        assert saved["fpga_baud_rate"] == 115200
+
+    def test_load_does_not_create_directory(self, home_dir):
+        """Test that loading settings never creates the settings directory."""
+        with patch.object(Logger, 'instance', return_value=MagicMock()):
+            manager = SettingsManager.__new__(SettingsManager)
+            manager.logger = MagicMock()
+            manager.settings_dir = home_dir / ".tennis_tracker"
+            manager.settings_file = manager.settings_dir / "settings.json"
+            manager.settings = manager._get_default_settings()
+            manager._directory_checked = False
+
+            assert manager.load_settings() is False
+            assert not manager.settings_dir.exists()
+
+    def test_existing_file_is_loaded(self, home_dir):
+        """Test that values from an existing settings file are merged."""
+        settings_dir = home_dir / ".tennis_tracker"
+        settings_dir.mkdir()
+        with open(settings_dir / "settings.json", 'w', encoding='utf-8') as file:
+            json.dump({"autoplay": True}, file)
+
+        original_instance = SettingsManager._instance
+        SettingsManager._instance = None
+        try:
+            manager = SettingsManager.instance()
+            assert manager.get("autoplay") is True
+        finally:
+            SettingsManager._instance = original_instance
+
+    def test_default_settings_are_read_only(self, settings_manager):
+        """Test that the shared defaults cannot be mutated through an instance."""
+        with pytest.raises(TypeError):
+            settings_manager.DEFAULT_SETTINGS["autoplay"] = True
+
+        settings_manager.settings["autoplay"] = True
+        assert SettingsManager.DEFAULT_SETTINGS["autoplay"] is False
+
+    def test_unchanged_folder_path_skips_save(self, settings_manager, tmp_path):
+        """Test that re-setting the same folder path does not save again."""
+        assert settings_manager.update_last_folder_path(str(tmp_path)) is True
+
+        with patch.object(settings_manager, 'save_settings') as mock_save:
+            assert settings_manager.update_last_folder_path(str(tmp_path)) is True
+            mock_save.assert_not_called()
+
+    def test_file_path_rejects_directory(self, settings_manager, tmp_path):
+        """Test that a directory is not accepted as the last file path."""
+        assert settings_manager.update_last_file_path(str(tmp_path)) is False
+
+    def test_export_settings_pretty(self, settings_manager, tmp_path):
+        """Test that exported settings are indented and round-trip."""
+        export_path = tmp_path / "exported.json"
+        assert settings_manager.export_settings(export_path) is True
+
+        text = export_path.read_text(encoding='utf-8')
+        assert "\n    " in text
+        assert json.loads(text) == settings_manager.settings
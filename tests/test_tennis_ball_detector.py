@@ -0,0 +1,243 @@
+"""
+Tests for the tennis ball detector utility functions.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from src.utils import tennis_ball_detector as detector
+
+CAMERA_PARAMS = {
+    'baseline': 0.2,
+    'focal_length': 800.0,
+    'principal_point': (320.0, 240.0)
+}
+
+EXTRINSIC_CAMERA_PARAMS = dict(
+    CAMERA_PARAMS,
+    rotation_matrix=[[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]],
+    translation_vector=[1.0, 2.0, 3.0]
+)
+
+LEFT_POINTS = [(400.0, 250.0), (330.0, 100.0), (50.0, 460.0)]
+RIGHT_POINTS = [(380.0, 250.0), (300.0, 100.0), (10.0, 460.0)]
+
+class TestStereoCorrespondenceBatch:
+    """Test the vectorized stereo triangulation."""
+
+    @pytest.mark.parametrize('camera_params', [CAMERA_PARAMS, EXTRINSIC_CAMERA_PARAMS])
+    def test_matches_single_point_version(self, camera_params):
+        """Test that every row equals stereo_correspondence on that pair."""
+        batch = detector.stereo_correspondence_batch(LEFT_POINTS, RIGHT_POINTS, camera_params)
+        expected = [detector.stereo_correspondence(left, right, camera_params)
+                    for left, right in zip(LEFT_POINTS, RIGHT_POINTS)]
+        np.testing.assert_allclose(batch, np.array(expected), rtol=1e-12)
+
+    def test_zero_disparity_rows_are_nan(self):
+        """Test that pairs without disparity come back as NaN rows."""
+        batch = detector.stereo_correspondence_batch(
+            [(400.0, 250.0), (300.0, 200.0)], [(400.0, 250.0), (290.0, 200.0)],
+            EXTRINSIC_CAMERA_PARAMS)
+        assert np.isnan(batch[0]).all()
+        assert not np.isnan(batch[1]).any()
+
+    def test_accepts_single_pair_and_batch_shapes(self):
+        """Test that a (2,) pair and an (N, 2) batch are both accepted."""
+        single = detector.stereo_correspondence_batch(
+            np.array(LEFT_POINTS[0]), np.array(RIGHT_POINTS[0]), CAMERA_PARAMS)
+        batch = detector.stereo_correspondence_batch(
+            np.array(LEFT_POINTS), np.array(RIGHT_POINTS), CAMERA_PARAMS)
+        assert single.shape == (1, 3)
+        assert batch.shape == (len(LEFT_POINTS), 3)
+        np.testing.assert_allclose(single[0], batch[0])
+
+    @pytest.mark.skipif(detector._stereo_batch_numba is None, reason="numba is not installed")
+    @pytest.mark.parametrize('camera_params', [CAMERA_PARAMS, EXTRINSIC_CAMERA_PARAMS])
+    def test_numba_kernel_matches_numpy(self, camera_params, monkeypatch):
+        """Test that the compiled kernel agrees with the NumPy path, NaN rows included."""
+        rng = np.random.default_rng(0)
+        count = detector._NUMBA_MIN_BATCH + 44
+        left_points = rng.uniform(0.0, 640.0, size=(count, 2))
+        right_points = left_points - rng.uniform(1.0, 60.0, size=(count, 2))
+        right_points[::17, 0] = left_points[::17, 0]
+
+        compiled = detector.stereo_correspondence_batch(left_points, right_points, camera_params)
+        monkeypatch.setattr(detector, '_NUMBA_MIN_BATCH', count + 1)
+        vectorized = detector.stereo_correspondence_batch(left_points, right_points, camera_params)
+
+        assert np.isnan(compiled[::17]).all()
+        np.testing.assert_allclose(compiled, vectorized, rtol=1e-9)
+
+def _detection(x, y, area):
+    """Build a detection result with a selected center."""
+    return {'selected_center': {'x': x, 'y': y, 'area': area}}
+
+class TestCalculate3DPositionsBatch:
+    """Test the batched 3D position calculation."""
+
+    def test_matches_per_pair_version(self):
+        """Test that each result equals calculate_3d_position on that pair."""
+        left_detections = [
+            _detection(400, 250, 900.0),        # valid pair
+            None,                               # missing left detection
+            _detection(330, 100, 400.0),        # missing right detection
+            {'selected_center': None},          # no selected center
+            _detection(300, 200, 1500.0),       # zero disparity
+            _detection(50, 460, 3000.0),        # large areas (confidence may clamp)
+            {},                                 # empty detection result
+        ]
+        right_detections = [
+            _detection(380, 250, 800.0),
+            _detection(380, 250, 800.0),
+            None,
+            _detection(300, 100, 400.0),
+            _detection(300, 200, 1500.0),
+            _detection(10, 460, 3000.0),
+            _detection(10, 460, 3000.0),
+        ]
+
+        batch = detector.calculate_3d_positions_batch(
+            left_detections, right_detections, EXTRINSIC_CAMERA_PARAMS)
+        expected = [detector.calculate_3d_position(left, right, EXTRINSIC_CAMERA_PARAMS)
+                    for left, right in zip(left_detections, right_detections)]
+
+        assert len(batch) == len(expected)
+        for result, reference in zip(batch, expected):
+            assert result['has_position'] == reference['has_position']
+            assert result['confidence'] == pytest.approx(reference['confidence'])
+            if reference['position'] is None:
+                assert result['position'] is None
+            else:
+                assert result['position'] == pytest.approx(reference['position'])
+        assert [result['has_position'] for result in batch] == [
+            True, False, False, False, False, True, False]
+
+    def test_no_valid_pairs(self):
+        """Test that frames without usable detections all report no position."""
+        results = detector.calculate_3d_positions_batch([None, {}], [None, None])
+        assert results == [{'has_position': False, 'position': None, 'confidence': 0.0}] * 2
+
+# BGR yellow (HSV hue 30) and a band around it, independent of the app's defaults
+BALL_COLOR = (0, 255, 255)
+HSV_LOWER = np.array([20, 100, 100], dtype=np.uint8)
+HSV_UPPER = np.array([40, 255, 255], dtype=np.uint8)
+
+def _ball_frame(center=(120, 80), radius=20, shape=(240, 320)):
+    """Draw a filled yellow circle on a black frame."""
+    frame = np.zeros(shape + (3,), dtype=np.uint8)
+    cv2.circle(frame, center, radius, BALL_COLOR, -1)
+    return frame
+
+class TestDetectTennisBall:
+    """Test color based ball detection on synthetic frames."""
+
+    def test_selects_ball_center_and_radius(self):
+        """Test that a filled circle is found at its center with its radius."""
+        result = detector.detect_tennis_ball_by_color(_ball_frame(), HSV_LOWER, HSV_UPPER)
+
+        selected = result['selected_center']
+        assert result['detection_type'] == 'color'
+        assert result['frame_shape'] == (240, 320)
+        assert selected['x'] == pytest.approx(120, abs=1)
+        assert selected['y'] == pytest.approx(80, abs=1)
+        # Dilations beyond the opening grow the blob by half a kernel each
+        growth = (max(0, detector.TENNIS_BALL_DILATE_ITERATIONS - detector.TENNIS_BALL_ERODE_ITERATIONS)
+                  * (detector.TENNIS_BALL_KERNEL_SIZE // 2))
+        assert selected['radius'] == pytest.approx(20 + growth, abs=1.5)
+        assert len(result['candidate_centers']['x']) == 1
+
+    def test_rejects_blob_below_min_area(self, monkeypatch):
+        """Test that a blob smaller than the minimum area is not a candidate."""
+        monkeypatch.setattr(detector, 'TENNIS_BALL_MIN_CONTOUR_AREA', np.pi * 20 ** 2 * 2)
+        result = detector.detect_tennis_ball_by_color(_ball_frame(), HSV_LOWER, HSV_UPPER)
+
+        assert result['selected_center'] is None
+        assert len(result['candidate_centers']['x']) == 0
+
+    def test_stable_across_calls_reusing_buffers(self):
+        """Test that repeated calls on the persistent buffers give the same result."""
+        frame = _ball_frame()
+        first = detector.detect_tennis_ball_by_color(frame, HSV_LOWER, HSV_UPPER)
+        buffers = detector._get_mask_buffers(frame.shape[:2])
+        labels = detector._get_labels_buffer(frame.shape[:2])
+        second = detector.detect_tennis_ball_by_color(frame, HSV_LOWER, HSV_UPPER)
+
+        assert detector._get_mask_buffers(frame.shape[:2]) is buffers
+        assert detector._get_labels_buffer(frame.shape[:2]) is labels
+        assert second['selected_center'] == first['selected_center']
+        for key in ('x', 'y', 'area'):
+            np.testing.assert_array_equal(second['candidate_centers'][key],
+                                          first['candidate_centers'][key])
+
+    @pytest.mark.parametrize('erode, dilate', [(2, 2), (1, 3), (3, 1)])
+    def test_morphology_matches_erode_then_dilate(self, erode, dilate, monkeypatch):
+        """Test that the mask cleanup equals an explicit erode followed by dilate."""
+        monkeypatch.setattr(detector, 'TENNIS_BALL_ERODE_ITERATIONS', erode)
+        monkeypatch.setattr(detector, 'TENNIS_BALL_DILATE_ITERATIONS', dilate)
+        monkeypatch.setattr(detector, '_USE_MORPH_OPEN', dilate >= erode)
+        monkeypatch.setattr(detector, '_EXTRA_DILATE_ITERATIONS', dilate - erode)
+        monkeypatch.setattr(detector, 'TENNIS_BALL_MIN_CONTOUR_AREA', 1)
+        frame = _ball_frame()
+        frame[10:14, 10:14] = BALL_COLOR
+
+        mask = cv2.inRange(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV), HSV_LOWER, HSV_UPPER)
+        kernel = detector._MORPH_KERNEL
+        expected = cv2.dilate(cv2.erode(mask, kernel, iterations=erode), kernel, iterations=dilate)
+        expected_area = cv2.countNonZero(expected)
+
+        result = detector.detect_tennis_ball_by_color(frame, HSV_LOWER, HSV_UPPER)
+        assert result['candidate_centers']['area'].sum() == expected_area
+
+    @pytest.mark.parametrize('downsample, roi', [
+        (False, (151, 97, 121, 101)),
+        (True, None),
+        (True, (151, 97, 121, 101)),
+    ])
+    def test_roi_and_downsample_report_frame_coordinates(self, downsample, roi):
+        """Test that ROI and half-resolution detection find the ball at the same frame position."""
+        frame = _ball_frame(center=(201, 149), radius=24)
+        full = detector.detect_tennis_ball_by_color(frame, HSV_LOWER, HSV_UPPER)
+        result = detector.detect_tennis_ball_by_color(frame, HSV_LOWER, HSV_UPPER,
+                                                      downsample=downsample, roi=roi)
+
+        selected = result['selected_center']
+        reference = full['selected_center']
+        assert result['frame_shape'] == frame.shape[:2]
+        assert selected['x'] == pytest.approx(reference['x'], abs=2)
+        assert selected['y'] == pytest.approx(reference['y'], abs=2)
+        assert selected['radius'] == pytest.approx(reference['radius'], abs=2)
+        assert selected['area'] == pytest.approx(reference['area'], rel=0.15)
+        assert result['candidate_centers']['x'][0] == selected['x']
+        assert result['candidate_centers']['y'][0] == selected['y']
+
+class TestDraw3DPosition:
+    """Test the cached 3D position label overlay."""
+
+    @pytest.mark.parametrize('shape, dtype', [
+        ((120, 480, 3), np.uint8),
+        ((120, 480), np.uint8),
+        pytest.param((120, 480, 3), np.float32, marks=pytest.mark.skipif(
+            int(cv2.__version__.split('.')[0]) >= 5,
+            reason="cv2.putText only draws on 8-bit images since OpenCV 5")),
+    ])
+    def test_cached_label_matches_fresh_render(self, shape, dtype, monkeypatch):
+        """Test that cache misses and hits both draw the same pixels as cv2.putText."""
+        monkeypatch.setattr(detector, '_position_text_cache', (None, None, None))
+        frame = np.full(shape, 40, dtype=dtype)
+        position = (1.234, -5.678, 9.0)
+        color = (10, 200, 30)
+        thickness = 2
+
+        reference = frame.copy()
+        cv2.putText(reference, "3D Position: X=1.23, Y=-5.68, Z=9.00",
+                    (detector.TENNIS_BALL_POSITION_TEXT_X, detector.TENNIS_BALL_POSITION_TEXT_Y),
+                    cv2.FONT_HERSHEY_SIMPLEX, detector.TENNIS_BALL_POSITION_FONT_SCALE,
+                    color, thickness)
+
+        fresh = detector.draw_3d_position(frame, position, color, thickness)
+        cached = detector.draw_3d_position(frame, position, color, thickness)
+
+        np.testing.assert_array_equal(fresh, reference)
+        np.testing.assert_array_equal(cached, reference)
+        np.testing.assert_array_equal(frame, np.full(shape, 40, dtype=dtype))
@@ -0,0 +1,80 @@
+"""
+Tests for the Timeline component.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from PySide6.QtTest import QTest
+
+from src.views.components.timeline import Timeline
+
+class TestTimeline:
+    """Test the timeline slider and frame labels."""
+
+    @pytest.fixture
+    def timeline(self, qapp):
+        """Create a Timeline bound to a mocked app state."""
+        with patch('src.views.components.timeline.AppState', MagicMock()):
+            timeline = Timeline()
+        emitted = []
+        timeline.position_changed.connect(emitted.append)
+        timeline.emitted = emitted
+        yield timeline
+        timeline.deleteLater()
+
+    def test_set_current_frame_skips_unchanged_value(self, timeline):
+        """Test that repeating the current frame does not touch the slider."""
+        timeline.set_frame_count(10)
+        timeline.set_current_frame(4)
+
+        with patch.object(timeline.slider, 'setValue') as set_value:
+            timeline.set_current_frame(4)
+        set_value.assert_not_called()
+        assert timeline.slider.value() == 4
+        assert timeline.current_frame_label.text() == "5"
+        assert timeline.emitted == []
+
+    def test_shrinking_frame_count_updates_label(self, timeline):
+        """Test that the label follows the slider value clamped by a smaller range."""
+        timeline.set_frame_count(10)
+        timeline.set_current_frame(8)
+        timeline.set_frame_count(3)
+
+        assert timeline.slider.value() == 2
+        assert timeline.current_frame_label.text() == "3"
+        assert timeline.emitted == []
+
+    def test_drag_emits_once_per_burst(self, timeline):
+        """Test that slider moves are coalesced into one position_changed."""
+        timeline.set_frame_count(100)
+        for value in (3, 7, 12):
+            timeline.slider.setValue(value)
+
+        assert timeline.emitted == []
+        assert timeline.current_frame_label.text() == "13"
+
+        QTest.qWait(Timeline.POSITION_EMIT_INTERVAL * 5)
+        assert timeline.emitted == [12]
+
+    def test_release_flushes_pending_position(self, timeline):
+        """Test that releasing the slider emits the pending value immediately."""
+        timeline.set_frame_count(100)
+        timeline.slider.setValue(20)
+        timeline.slider.setValue(25)
+        timeline.on_slider_released()
+
+        assert timeline.emitted == [25]
+        QTest.qWait(Timeline.POSITION_EMIT_INTERVAL * 5)
+        assert timeline.emitted == [25]
+
+    def test_reset_emits_nothing(self, timeline):
+        """Test that reset() neither forwards slider changes nor a pending drag."""
+        timeline.set_frame_count(100)
+        timeline.slider.setValue(40)
+        timeline.reset()
+
+        QTest.qWait(Timeline.POSITION_EMIT_INTERVAL * 5)
+        assert timeline.emitted == []
+        assert timeline.slider.value() == 0
+        assert timeline.current_frame_label.text() == "1"
+        assert timeline.total_frames_label.text() == "/ 0"
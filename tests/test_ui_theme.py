@@ -0,0 +1,33 @@
+"""
+Tests for the global style sheet in ui_theme.
+"""
+
+import os
+import sys
+import pytest
+
+from src.utils import ui_theme
+
+class TestGlobalStylesheet:
+    """Test how the global style sheet is built or loaded."""
+
+    @pytest.fixture
+    def frozen_bundle(self, tmp_path, monkeypatch):
+        """Pretend to run from a one-file build unpacked into tmp_path."""
+        monkeypatch.setattr(sys, 'frozen', True, raising=False)
+        monkeypatch.setattr(sys, '_MEIPASS', str(tmp_path), raising=False)
+        monkeypatch.setattr(ui_theme, '_prebuilt_stylesheets', {})
+        yield tmp_path
+
+    def test_frozen_build_reads_qss_from_bundle(self, frozen_bundle):
+        """Test that the prebuilt .qss in _MEIPASS is used instead of rebuilding."""
+        theme_dir = frozen_bundle / ui_theme.THEME_DIR
+        os.makedirs(theme_dir)
+        marker = "/* bundled marker */"
+        (theme_dir / ui_theme.THEME_FILES[False]).write_text(marker, encoding='utf-8')
+
+        assert ui_theme.get_global_stylesheet() == marker
+
+    def test_frozen_build_falls_back_without_qss(self, frozen_bundle):
+        """Test that a missing .qss falls back to the sheet built in Python."""
+        assert ui_theme.get_global_stylesheet(True) == ui_theme._build_global_stylesheet(True)
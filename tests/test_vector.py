@@ -0,0 +1,30 @@
+"""
+Tests for the Vector2D class.
+"""
+
+import pytest
+
+from src.utils.math.vector import Vector2D
+
+class TestVector2D:
+    """Test the Vector2D value class."""
+
+    def test_from_tuple_coerces_to_float(self):
+        """Test that from_tuple converts integer components to floats."""
+        vector = Vector2D.from_tuple((3, 4))
+        assert isinstance(vector.x, float)
+        assert isinstance(vector.y, float)
+        assert vector == Vector2D(3, 4)
+
+    def test_arithmetic(self):
+        """Test addition, subtraction and length."""
+        a = Vector2D(1, 2)
+        b = Vector2D(4, 6)
+        assert b - a == Vector2D(3, 4)
+        assert a + b == Vector2D(5, 8)
+        assert a.distance_to(b) == pytest.approx(5.0)
+
+    def test_no_instance_dict(self):
+        """Test that instances use slots instead of a per-instance dict."""
+        with pytest.raises(AttributeError):
+            Vector2D(1, 2).z = 3